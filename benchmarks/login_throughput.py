@@ -0,0 +1,102 @@
+"""Login throughput and event-loop responsiveness under a burst of password checks.
+
+Runs ``--logins`` Argon2 verifications with ``--concurrency`` in flight through
+:class:`PasswordHashPool`, once hashing in threads and once in worker processes,
+while a ticker measures how late the event loop wakes up (a proxy for stalled
+journal reads). Example::
+
+    python benchmarks/login_throughput.py --logins 64 --concurrency 16 --processes 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from ai_daily_journal.config.schema import PasswordHashingConfig
+from ai_daily_journal.services.password_hashing import (
+    PasswordHashBusyError,
+    PasswordHashPool,
+    hash_params,
+    hash_password,
+)
+
+TICK_SECONDS = 0.01
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(time.perf_counter() - started - TICK_SECONDS)
+
+
+async def _run(config: PasswordHashingConfig, logins: int, concurrency: int) -> dict[str, float]:
+    pool = PasswordHashPool(config)
+    stored = hash_password(hash_params(config), "benchmark-pass")
+    await pool.verify(stored, "benchmark-pass")  # start the workers outside the timing
+    gate = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    rejected = 0
+
+    async def login() -> None:
+        nonlocal rejected
+        async with gate:
+            started = time.perf_counter()
+            try:
+                await pool.verify(stored, "benchmark-pass")
+            except PasswordHashBusyError:
+                rejected += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(login() for _ in range(logins)))
+    finally:
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await ticker
+        pool.shutdown()
+    latencies.sort()
+    return {
+        "logins_per_second": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000 if latencies else 0.0,
+        "rejected": rejected,
+        "max_loop_lag_ms": max(lags, default=0.0) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=16)
+    parser.add_argument("--time-cost", type=int, default=3)
+    parser.add_argument("--memory-cost-kib", type=int, default=65536)
+    parser.add_argument("--parallelism", type=int, default=4)
+    args = parser.parse_args()
+
+    for processes in (0, args.processes):
+        config = PasswordHashingConfig(
+            time_cost=args.time_cost,
+            memory_cost_kib=args.memory_cost_kib,
+            parallelism=args.parallelism,
+            processes=processes,
+            max_queue=args.max_queue,
+        )
+        result = asyncio.run(_run(config, args.logins, args.concurrency))
+        mode = f"{processes} processes" if processes else "threads"
+        rendered = "  ".join(f"{key}={value:.1f}" for key, value in result.items())
+        print(f"{mode:>12}: {rendered}")
+
+
+if __name__ == "__main__":
+    main()
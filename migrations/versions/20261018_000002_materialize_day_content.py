@@ -0,0 +1,72 @@
+"""materialize rendered day content
+
+Revision ID: 20261018_000002
+Revises: 20260220_000001
+Create Date: 2026-10-18 00:00:02
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000002"
+down_revision = "20260220_000001"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copies of render_day_text and content_hash as of this revision, so later
+# changes to the application cannot alter what this backfill writes.
+def _render_day_text(day_date: object, events: list[str]) -> str:
+    # str() rather than isoformat(): SQLite returns the raw column as a string.
+    header = f"Dnevnik za {day_date}\n\n"
+    if not events:
+        return header + "Brez vnosov.\n"
+    lines = [f"{idx}. {event.strip()}" for idx, event in enumerate(events, start=1)]
+    return header + "\n".join(lines) + "\n"
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column("ai_daily_journal_days", sa.Column("rendered_content", sa.Text(), nullable=True))
+    op.add_column(
+        "ai_daily_journal_days", sa.Column("content_hash", sa.String(length=64), nullable=True)
+    )
+    op.add_column(
+        "ai_daily_journal_days",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    bind = op.get_bind()
+    days = bind.execute(sa.text("SELECT id, day_date FROM ai_daily_journal_days")).all()
+    for day_id, day_date in days:
+        events = bind.execute(
+            sa.text(
+                "SELECT event_text_sl FROM ai_daily_journal_entries "
+                "WHERE day_id = :day_id AND superseded_by_entry_id IS NULL "
+                "ORDER BY sequence_no"
+            ),
+            {"day_id": day_id},
+        ).scalars()
+        content = _render_day_text(day_date, list(events))
+        bind.execute(
+            sa.text(
+                "UPDATE ai_daily_journal_days "
+                "SET rendered_content = :content, content_hash = :hash, version = 1 "
+                "WHERE id = :day_id"
+            ),
+            {"content": content, "hash": _content_hash(content), "day_id": day_id},
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("ai_daily_journal_days", "version")
+    op.drop_column("ai_daily_journal_days", "content_hash")
+    op.drop_column("ai_daily_journal_days", "rendered_content")
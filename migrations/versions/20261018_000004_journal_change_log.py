@@ -0,0 +1,60 @@
+"""journal change log for delta sync
+
+Revision ID: 20261018_000004
+Revises: 20261018_000003
+Create Date: 2026-10-18 00:00:04
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000004"
+down_revision = "20261018_000003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    day_change_kind = postgresql.ENUM(
+        "created", "modified", "deleted", name="day_change_kind", create_type=False
+    )
+    day_change_kind.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "journal_changes",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        ),
+        sa.Column(
+            "day_id",
+            sa.Integer(),
+            sa.ForeignKey("ai_daily_journal_days.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("day_date", sa.Date(), nullable=False),
+        sa.Column("change_kind", day_change_kind, nullable=False),
+        sa.Column("day_version", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_journal_changes_user_cursor", "journal_changes", ["user_id", "id"], unique=False
+    )
+
+    # Seed the log with existing days so a client syncing from an empty cursor sees everything.
+    op.execute(
+        "INSERT INTO journal_changes "
+        "(user_id, day_id, day_date, change_kind, day_version, created_at) "
+        "SELECT user_id, id, day_date, 'created', version, updated_at "
+        "FROM ai_daily_journal_days ORDER BY updated_at, id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_journal_changes_user_cursor", table_name="journal_changes")
+    op.drop_table("journal_changes")
+    op.execute("DROP TYPE IF EXISTS day_change_kind")
@@ -0,0 +1,36 @@
+"""unique sequence per active entry
+
+Revision ID: 20261018_000005
+Revises: 20261018_000004
+Create Date: 2026-10-18 00:00:05
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000005"
+down_revision = "20261018_000004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Superseded rows keep their sequence_no, so uniqueness only holds among active entries.
+    op.drop_constraint("uq_entry_day_sequence", "ai_daily_journal_entries", type_="unique")
+    op.create_index(
+        "uq_entry_day_sequence_active",
+        "ai_daily_journal_entries",
+        ["day_id", "sequence_no"],
+        unique=True,
+        postgresql_where=sa.text("superseded_by_entry_id IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_entry_day_sequence_active", table_name="ai_daily_journal_entries")
+    op.create_unique_constraint(
+        "uq_entry_day_sequence", "ai_daily_journal_entries", ["day_id", "sequence_no"]
+    )
@@ -0,0 +1,37 @@
+"""idempotency response snapshots
+
+Revision ID: 20261018_000006
+Revises: 20261018_000005
+Create Date: 2026-10-18 00:00:06
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000006"
+down_revision = "20261018_000005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "idempotency_keys",
+        sa.Column(
+            "session_id",
+            sa.Integer(),
+            sa.ForeignKey("write_sessions.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "idempotency_keys", sa.Column("response_snapshot", sa.LargeBinary(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("idempotency_keys", "response_snapshot")
+    op.drop_column("idempotency_keys", "session_id")
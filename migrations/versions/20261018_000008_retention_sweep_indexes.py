@@ -0,0 +1,30 @@
+"""indexes for retention sweeps
+
+Revision ID: 20261018_000008
+Revises: 20261018_000007
+Create Date: 2026-10-18 00:00:08
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000008"
+down_revision = "20261018_000007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_sessions_expires_at", "user_sessions", ["expires_at"])
+    op.create_index("ix_idempotency_keys_last_seen_at", "idempotency_keys", ["last_seen_at"])
+    op.create_index(
+        "ix_write_sessions_status_updated_at", "write_sessions", ["status", "updated_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_write_sessions_status_updated_at", table_name="write_sessions")
+    op.drop_index("ix_idempotency_keys_last_seen_at", table_name="idempotency_keys")
+    op.drop_index("ix_user_sessions_expires_at", table_name="user_sessions")
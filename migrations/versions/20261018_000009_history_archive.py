@@ -0,0 +1,106 @@
+"""archive tables and history views for superseded entries and finished operations
+
+Revision ID: 20261018_000009
+Revises: 20261018_000008
+Create Date: 2026-10-18 00:00:09
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000009"
+down_revision = "20261018_000008"
+branch_labels = None
+depends_on = None
+
+ENTRY_COLUMNS = (
+    "id, day_id, sequence_no, event_text_sl, source_user_text, event_hash, "
+    "superseded_by_entry_id, updated_from_entry_id, created_at, updated_at"
+)
+OPERATION_COLUMNS = (
+    "id, session_id, action, decision_json, proposed_entries_json, diff_text, applied_at, "
+    "status, created_at"
+)
+
+
+def upgrade() -> None:
+    operation_action = postgresql.ENUM(
+        "noop", "append", "update", "create", name="operation_action", create_type=False
+    )
+    operation_status = postgresql.ENUM(
+        "pending", "applied", "failed", "cancelled", name="operation_status", create_type=False
+    )
+
+    op.create_table(
+        "ai_daily_journal_entries_archive",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column(
+            "day_id",
+            sa.Integer(),
+            sa.ForeignKey("ai_daily_journal_days.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("sequence_no", sa.Integer(), nullable=False),
+        sa.Column("event_text_sl", sa.Text(), nullable=False),
+        sa.Column("source_user_text", sa.Text(), nullable=False),
+        sa.Column("event_hash", sa.String(length=64), nullable=False),
+        sa.Column("superseded_by_entry_id", sa.Integer(), nullable=True),
+        sa.Column("updated_from_entry_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_ai_daily_journal_entries_archive_day_id",
+        "ai_daily_journal_entries_archive",
+        ["day_id"],
+    )
+
+    op.create_table(
+        "write_operations_archive",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column(
+            "session_id",
+            sa.Integer(),
+            sa.ForeignKey("write_sessions.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("action", operation_action, nullable=False),
+        sa.Column("decision_json", sa.JSON(), nullable=False),
+        sa.Column("proposed_entries_json", sa.JSON(), nullable=False),
+        sa.Column("diff_text", sa.Text(), nullable=False),
+        sa.Column("applied_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("status", operation_status, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_write_operations_archive_session_id", "write_operations_archive", ["session_id"]
+    )
+
+    op.execute(
+        f"CREATE VIEW journal_entry_history AS "
+        f"SELECT {ENTRY_COLUMNS}, NULL AS archived_at FROM ai_daily_journal_entries "
+        f"UNION ALL SELECT {ENTRY_COLUMNS}, archived_at FROM ai_daily_journal_entries_archive"
+    )
+    op.execute(
+        f"CREATE VIEW write_operation_history AS "
+        f"SELECT {OPERATION_COLUMNS}, NULL AS archived_at FROM write_operations "
+        f"UNION ALL SELECT {OPERATION_COLUMNS}, archived_at FROM write_operations_archive"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP VIEW IF EXISTS write_operation_history")
+    op.execute("DROP VIEW IF EXISTS journal_entry_history")
+    op.drop_index("ix_write_operations_archive_session_id", table_name="write_operations_archive")
+    op.drop_table("write_operations_archive")
+    op.drop_index(
+        "ix_ai_daily_journal_entries_archive_day_id",
+        table_name="ai_daily_journal_entries_archive",
+    )
+    op.drop_table("ai_daily_journal_entries_archive")
@@ -0,0 +1,34 @@
+"""composite index for the latest operation of a write session
+
+Revision ID: 20261018_000010
+Revises: 20261018_000009
+Create Date: 2026-10-18 00:00:10
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000010"
+down_revision = "20261018_000009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Active entries of a day are already served by uq_entry_day_sequence_active
+    # (day_id, sequence_no) WHERE superseded_by_entry_id IS NULL, from 20261018_000005.
+    op.create_index(
+        "ix_write_operations_session_id_id",
+        "write_operations",
+        ["session_id", sa.text("id DESC")],
+    )
+    # The composite index covers every lookup the single-column one served.
+    op.drop_index("ix_write_operations_session_id", table_name="write_operations")
+
+
+def downgrade() -> None:
+    op.create_index("ix_write_operations_session_id", "write_operations", ["session_id"])
+    op.drop_index("ix_write_operations_session_id_id", table_name="write_operations")
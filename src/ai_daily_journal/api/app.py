@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -9,12 +13,77 @@ from ai_daily_journal.api.routes.auth import router as auth_router
 from ai_daily_journal.api.routes.journal import router as journal_router
 from ai_daily_journal.api.routes.system import router as system_router
 from ai_daily_journal.config import load_config
+from ai_daily_journal.db.session import (
+    dispose_app_engines,
+    get_async_session_factory_from_app,
+    get_engine_from_app,
+    get_session_factory_from_app,
+)
 from ai_daily_journal.paths import default_config_path
+from ai_daily_journal.services.maintenance import MaintenanceScheduler
+from ai_daily_journal.services.model_client import close_http_clients
+from ai_daily_journal.services.password_hashing import shutdown_app_password_pool
+from ai_daily_journal.services.warmup import warm_up
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_up(app: FastAPI) -> None:
+    try:
+        cfg = app.state.config
+        if cfg is not None and cfg.warmup.enabled:
+            app.state.warmup_report = await warm_up(
+                cfg,
+                engine=get_engine_from_app(app),
+                session_factory=get_session_factory_from_app(app),
+                async_engine=getattr(app.state, "async_db_engine", None),
+                async_session_factory=get_async_session_factory_from_app(app),
+            )
+            logger.info("warmup finished", extra={"steps": app.state.warmup_report})
+    except Exception as exc:  # noqa: BLE001
+        # Warmup is an optimisation; the probes in /readyz still gate on the database.
+        logger.warning("warmup failed: %s", exc)
+    finally:
+        app.state.warmup_complete = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the engines once at startup, warm them in the background, dispose on shutdown.
+
+    Shutdown also stops the password hashing worker processes, if any were started, and
+    closes the shared model endpoint HTTP clients.
+    """
+    cfg = app.state.config
+    if cfg is not None:
+        get_session_factory_from_app(app)
+        get_async_session_factory_from_app(app)
+    tasks = [asyncio.create_task(_warm_up(app))]
+    scheduler = None
+    if cfg is not None and cfg.maintenance.enabled:
+        scheduler = MaintenanceScheduler(
+            cfg,
+            get_engine_from_app(app),
+            on_report=lambda report: setattr(app.state, "maintenance_report", report),
+        )
+        tasks.append(asyncio.create_task(scheduler.run_forever()))
+    try:
+        yield
+    finally:
+        if scheduler is not None:
+            scheduler.stop()
+        for task in tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await dispose_app_engines(app)
+        shutdown_app_password_pool(app)
+        close_http_clients()
 
 
 def create_app() -> FastAPI:
     config_path = default_config_path()
-    app = FastAPI(title="AI Daily Journal", version="0.1.0")
+    app = FastAPI(title="AI Daily Journal", version="0.1.0", lifespan=lifespan)
     if config_path.exists():
         cfg = load_config(config_path)
         app.add_middleware(
@@ -29,6 +98,10 @@ def create_app() -> FastAPI:
         app.state.config = None
 
     app.state.repo_root = str(Path(__file__).resolve().parents[3])
+    # /readyz stays not-ready until the lifespan warmup has run.
+    app.state.warmup_complete = False
+    app.state.warmup_report = {}
+    app.state.maintenance_report = {}
     app.include_router(system_router)
     app.include_router(auth_router)
     app.include_router(journal_router)
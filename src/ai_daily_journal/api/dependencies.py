@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ai_daily_journal.db.session import (
+    get_async_session_factory_from_app,
+    get_session_factory_from_app,
+    start_checkout_count,
+)
+from ai_daily_journal.metrics import metrics
+from ai_daily_journal.services.auth import AsyncAuthService, AuthService
+from ai_daily_journal.services.session_cache import CachedSession, get_session_cache_from_app
+from ai_daily_journal.services.signed_sessions import get_session_codec_from_app
+
+
+async def _checkout_counter() -> AsyncIterator[list[int]]:
+    # Set in the request task so the threadpool calls made for this request inherit it.
+    counter = start_checkout_count()
+    try:
+        yield counter
+    finally:
+        metrics.observe("db_checkouts_per_request", counter[0])
+
+
+async def get_db(
+    request: Request, _: Annotated[list[int], Depends(_checkout_counter)]
+) -> AsyncIterator[AsyncSession]:
+    """One session per request: committed if the handler succeeds, rolled back if it raises."""
+    async with get_async_session_factory_from_app(request.app)() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+        await db.commit()
+
+
+def get_sync_db(
+    request: Request, _: Annotated[list[int], Depends(_checkout_counter)]
+) -> Iterator[Session]:
+    """:func:`get_db` for routes that run the sync services on the threadpool."""
+    with get_session_factory_from_app(request.app)() as db:
+        try:
+            yield db
+        except Exception:
+            db.rollback()
+            raise
+        db.commit()
+
+
+DbSession = Annotated[AsyncSession, Depends(get_db)]
+SyncDbSession = Annotated[Session, Depends(get_sync_db)]
+
+
+def _session_token(request: Request) -> str:
+    cfg = request.app.state.config
+    if cfg is None:
+        raise HTTPException(status_code=500, detail="Config missing")
+    token = request.cookies.get(cfg.api_ui.session_cookie_name)
+    if not token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return token
+
+
+async def get_current_user(request: Request, db: DbSession) -> CachedSession:
+    token = _session_token(request)
+    auth = AsyncAuthService(db, codec=get_session_codec_from_app(request.app))
+    # Only touches the database if the token cache misses or a revocation poll is due.
+    session = await auth.cached_session(token, get_session_cache_from_app(request.app))
+    if session is None:
+        raise HTTPException(status_code=401, detail="Invalid session")
+    return session
+
+
+def get_current_user_sync(request: Request, db: SyncDbSession) -> CachedSession:
+    token = _session_token(request)
+    auth = AuthService(db, codec=get_session_codec_from_app(request.app))
+    session = auth.cached_session(token, get_session_cache_from_app(request.app))
+    if session is None:
+        raise HTTPException(status_code=401, detail="Invalid session")
+    return session
+
+
+CurrentUser = Annotated[CachedSession, Depends(get_current_user)]
+SyncCurrentUser = Annotated[CachedSession, Depends(get_current_user_sync)]
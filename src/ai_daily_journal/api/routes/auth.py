@@ -3,11 +3,21 @@ from __future__ import annotations
 from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel, EmailStr, Field
 
-from ai_daily_journal.db.session import get_session_factory_from_app
-from ai_daily_journal.services.auth import AuthService
+from ai_daily_journal.api.dependencies import CurrentUser, DbSession
+from ai_daily_journal.db.models import User
+from ai_daily_journal.services.auth import AsyncAuthService
+from ai_daily_journal.services.password_hashing import (
+    PasswordHashBusyError,
+    get_password_pool_from_app,
+)
+from ai_daily_journal.services.session_cache import get_session_cache_from_app
+from ai_daily_journal.services.signed_sessions import get_session_codec_from_app
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
+# Seconds clients are asked to wait when the password hashing queue is full.
+HASH_BUSY_RETRY_AFTER = 1
+
 
 class RegisterRequest(BaseModel):
     email: EmailStr
@@ -20,55 +30,73 @@ class LoginRequest(BaseModel):
     password: str
 
 
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="Too many concurrent logins, retry shortly",
+        headers={"Retry-After": str(HASH_BUSY_RETRY_AFTER)},
+    )
+
+
 @router.post("/register")
-def register(payload: RegisterRequest, request: Request) -> dict[str, object]:
-    session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        user = AuthService(db).register_user(payload.email, payload.password, payload.timezone)
-        return {"id": user.id, "email": user.email}
+async def register(payload: RegisterRequest, request: Request, db: DbSession) -> dict[str, object]:
+    auth = AsyncAuthService(db, passwords=get_password_pool_from_app(request.app))
+    try:
+        user = await auth.register_user(payload.email, payload.password, payload.timezone)
+    except PasswordHashBusyError as exc:
+        raise _hashing_busy() from exc
+    return {"id": user.id, "email": user.email}
 
 
 @router.post("/login")
-def login(payload: LoginRequest, request: Request, response: Response) -> dict[str, object]:
+async def login(
+    payload: LoginRequest, request: Request, response: Response, db: DbSession
+) -> dict[str, object]:
     cfg = request.app.state.config
     if cfg is None:
         raise HTTPException(status_code=500, detail="Config missing")
 
-    session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        auth = AuthService(db)
-        token = auth.authenticate(payload.email, payload.password)
-        if token is None:
-            raise HTTPException(status_code=401, detail="Invalid credentials")
-        response.set_cookie(
-            cfg.api_ui.session_cookie_name,
-            token,
-            httponly=True,
-            max_age=cfg.api_ui.session_ttl_seconds,
-            samesite="lax",
-        )
-        return {"status": "ok"}
+    auth = AsyncAuthService(
+        db,
+        cfg.api_ui.session_ttl_seconds,
+        codec=get_session_codec_from_app(request.app),
+        passwords=get_password_pool_from_app(request.app),
+    )
+    try:
+        token = await auth.authenticate(payload.email, payload.password)
+    except PasswordHashBusyError as exc:
+        raise _hashing_busy() from exc
+    if token is None:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    response.set_cookie(
+        cfg.api_ui.session_cookie_name,
+        token,
+        httponly=True,
+        max_age=cfg.api_ui.session_ttl_seconds,
+        samesite="lax",
+    )
+    return {"status": "ok"}
 
 
 @router.post("/logout")
-def logout(request: Request, response: Response) -> dict[str, str]:
+async def logout(request: Request, response: Response, db: DbSession) -> dict[str, str]:
     cfg = request.app.state.config
     cookie_name = cfg.api_ui.session_cookie_name if cfg else "aijournal_session"
+    token = request.cookies.get(cookie_name)
+    if token and cfg is not None:
+        auth = AsyncAuthService(
+            db,
+            cfg.api_ui.session_ttl_seconds,
+            codec=get_session_codec_from_app(request.app),
+        )
+        await auth.revoke_session(token, get_session_cache_from_app(request.app))
     response.delete_cookie(cookie_name)
     return {"status": "ok"}
 
 
 @router.get("/me")
-def me(request: Request) -> dict[str, object]:
-    cfg = request.app.state.config
-    if cfg is None:
-        raise HTTPException(status_code=500, detail="Config missing")
-    token = request.cookies.get(cfg.api_ui.session_cookie_name)
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        user = AuthService(db).user_from_session_token(token)
-        if user is None:
-            raise HTTPException(status_code=401, detail="Invalid session")
-        return {"id": user.id, "email": user.email, "timezone": user.timezone}
+async def me(db: DbSession, session: CurrentUser) -> dict[str, object]:
+    user = await db.get(User, session.user_id)
+    if user is None:
+        raise HTTPException(status_code=401, detail="Invalid session")
+    return {"id": user.id, "email": user.email, "timezone": user.timezone}
@@ -1,15 +1,41 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Request
+from collections.abc import Iterator
+from datetime import date
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
+from ai_daily_journal.api.dependencies import (
+    CurrentUser,
+    DbSession,
+    SyncCurrentUser,
+    SyncDbSession,
+)
 from ai_daily_journal.db.session import get_session_factory_from_app
-from ai_daily_journal.services.auth import AuthService
-from ai_daily_journal.services.journal_read import JournalReadService
+from ai_daily_journal.services.journal_changes import (
+    DEFAULT_CHANGES_LIMIT,
+    MAX_CHANGES_LIMIT,
+    InvalidCursorError,
+    JournalChangesService,
+)
+from ai_daily_journal.services.journal_export import ExportFormat, export_journal
+from ai_daily_journal.services.journal_read import (
+    DAY_RANGE_LIMIT,
+    MONTH_DAYS_LIMIT,
+    AsyncJournalReadService,
+)
 from ai_daily_journal.services.write_flow import JournalWriteService
+from ai_daily_journal.services.write_transaction import StaleProposalError
 
 router = APIRouter(prefix="/api/journal", tags=["journal"])
 
+# Browsers may keep responses but must revalidate them with If-None-Match.
+CACHE_CONTROL = "private, no-cache"
+
 
 class ProposeRequest(BaseModel):
     text: str = Field(min_length=1, max_length=4000)
@@ -31,63 +57,178 @@ class DayEditRequest(BaseModel):
     session_id: int | None = None
 
 
-def _current_user_id(request: Request) -> int:
-    cfg = request.app.state.config
-    if cfg is None:
-        raise HTTPException(status_code=500, detail="Config missing")
-    token = request.cookies.get(cfg.api_ui.session_cookie_name)
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        user = AuthService(db).user_from_session_token(token)
-        if user is None:
-            raise HTTPException(status_code=401, detail="Invalid session")
-        return user.id
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip().removeprefix("W/") for value in header.split(",")]
+    return "*" in candidates or etag in candidates
 
 
-@router.get("/tree")
-def tree(request: Request) -> dict[str, object]:
-    user_id = _current_user_id(request)
-    session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        return {"tree": JournalReadService(db).tree(user_id)}
+def _cache_headers(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
 
 
-@router.get("/days/{day_date}")
-def day_file(day_date: str, request: Request) -> dict[str, object]:
-    user_id = _current_user_id(request)
-    session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        service = JournalReadService(db)
-        content = service.render_day_content(user_id, day_date)
-        if content is None:
-            raise HTTPException(status_code=404, detail="Day not found")
-        return {"day_date": day_date, "content": content}
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+@router.get("/tree", response_model=None)
+async def tree(
+    request: Request, response: Response, db: DbSession, user: CurrentUser
+) -> dict[str, object] | Response:
+    service = AsyncJournalReadService(db)
+    etag = f'"tree-{user.user_id}-{await service.journal_version(user.user_id)}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    _cache_headers(response, etag)
+    return {"tree": await service.tree(user.user_id)}
+
+
+@router.get("/tree/{year}/{month}", response_model=None)
+async def tree_month(
+    year: int,
+    month: int,
+    request: Request,
+    response: Response,
+    db: DbSession,
+    user: CurrentUser,
+    after: date | None = None,
+    limit: int = Query(default=MONTH_DAYS_LIMIT, ge=1, le=MONTH_DAYS_LIMIT),
+) -> dict[str, object] | Response:
+    if not 1 <= month <= 12 or not 1 <= year <= 9999:
+        raise HTTPException(status_code=400, detail="Invalid year or month")
+    service = AsyncJournalReadService(db)
+    version = await service.journal_version(user.user_id)
+    etag = f'"month-{user.user_id}-{year}-{month}-{after}-{limit}-{version}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    _cache_headers(response, etag)
+    days, next_after = await service.month_days(
+        user.user_id, year, month, after=after, limit=limit
+    )
+    return {"year": year, "month": month, "days": days, "next_after": next_after}
 
 
-@router.get("/latest")
-def latest(request: Request) -> dict[str, object]:
-    user_id = _current_user_id(request)
+@router.get("/days", response_model=None)
+async def day_range(
+    request: Request,
+    response: Response,
+    db: DbSession,
+    user: CurrentUser,
+    start: Annotated[date, Query(alias="from")],
+    end: Annotated[date, Query(alias="to")],
+    after: date | None = None,
+    limit: int = Query(default=DAY_RANGE_LIMIT, ge=1, le=DAY_RANGE_LIMIT),
+) -> dict[str, object] | Response:
+    if end < start:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    service = AsyncJournalReadService(db)
+    version = await service.journal_version(user.user_id)
+    etag = f'"days-{user.user_id}-{start}-{end}-{after}-{limit}-{version}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    _cache_headers(response, etag)
+    days, next_after = await service.day_range(
+        user.user_id, start, end, after=after, limit=limit
+    )
+    return {"days": days, "next_after": next_after}
+
+
+@router.get("/days/{day_date}", response_model=None)
+async def day_file(
+    day_date: str, request: Request, response: Response, db: DbSession, user: CurrentUser
+) -> dict[str, object] | Response:
+    service = AsyncJournalReadService(db)
+    day = await service.get_day(user.user_id, day_date)
+    if day is None:
+        raise HTTPException(status_code=404, detail="Day not found")
+    digest = (await service.day_content_hash(day))[:16]
+    etag = f'"day-{day.id}-{day.version}-{digest}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    _cache_headers(response, etag)
+    return {"day_date": day_date, "content": await service.day_content(day)}
+
+
+@router.get("/latest", response_model=None)
+async def latest(
+    request: Request, response: Response, db: DbSession, user: CurrentUser
+) -> dict[str, object] | Response:
+    service = AsyncJournalReadService(db)
+    etag = f'"latest-{user.user_id}-{await service.journal_version(user.user_id)}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    _cache_headers(response, etag)
+    latest_day = await service.latest_day(user.user_id)
+    if latest_day is None:
+        return {"day_date": None, "content": ""}
+    return {
+        "day_date": latest_day.day_date.isoformat(),
+        "content": await service.day_content(latest_day),
+    }
+
+
+@router.get("/changes")
+async def changes(
+    db: SyncDbSession,
+    user: SyncCurrentUser,
+    since: str | None = None,
+    limit: int = Query(default=DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_CHANGES_LIMIT),
+    include_content: bool = False,
+) -> dict[str, object]:
+    def run() -> dict[str, object]:
+        try:
+            change_set = JournalChangesService(db).changes_since(
+                user.user_id, since, limit=limit, include_content=include_content
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return {
+            "changes": change_set.changes,
+            "next_cursor": change_set.next_cursor,
+            "has_more": change_set.has_more,
+        }
+
+    return await run_in_threadpool(run)
+
+
+@router.get("/export")
+async def export(
+    request: Request,
+    user: CurrentUser,
+    fmt: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+    gzip: bool = False,
+) -> StreamingResponse:
     session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        service = JournalReadService(db)
-        latest_day = service.latest_day(user_id)
-        if latest_day is None:
-            return {"day_date": None, "content": ""}
-        return {"day_date": latest_day.day_date.isoformat(), "content": service.render_day_content(user_id, latest_day.day_date.isoformat())}
+
+    def stream() -> Iterator[bytes]:
+        # Outlives the request-scoped session: it lasts as long as the body is being sent.
+        with session_factory() as db:
+            yield from export_journal(db, user.user_id, fmt=fmt, gzip=gzip)
+
+    media_type = "application/x-ndjson" if fmt == "ndjson" else "text/markdown; charset=utf-8"
+    filename = "journal." + ("ndjson" if fmt == "ndjson" else "md") + (".gz" if gzip else "")
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if gzip:
+        media_type = "application/gzip"
+    return StreamingResponse(stream(), media_type=media_type, headers=headers)
+
+
+# Writes go through the sync services (model calls, row locks) on the threadpool. The services
+# are built there too: the constructor reads secrets and builds the model routers.
 
 
 @router.post("/propose")
-def propose(payload: ProposeRequest, request: Request) -> dict[str, object]:
-    user_id = _current_user_id(request)
-    cfg = request.app.state.config
-    session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        service = JournalWriteService(db, cfg)
+async def propose(
+    payload: ProposeRequest, request: Request, db: SyncDbSession, user: SyncCurrentUser
+) -> dict[str, object]:
+    def run() -> dict[str, object]:
+        service = JournalWriteService(db, request.app.state.config)
         try:
             return service.propose(
-                user_id=user_id,
+                user_id=user.user_id,
                 source_text=payload.text,
                 session_id=payload.session_id,
                 instruction=payload.instruction,
@@ -95,17 +236,22 @@ def propose(payload: ProposeRequest, request: Request) -> dict[str, object]:
         except Exception as exc:  # noqa: BLE001
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    return await run_in_threadpool(run)
+
 
 @router.post("/days/{day_date}/edit-propose")
-def propose_day_edit(day_date: str, payload: DayEditRequest, request: Request) -> dict[str, object]:
-    user_id = _current_user_id(request)
-    cfg = request.app.state.config
-    session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        service = JournalWriteService(db, cfg)
+async def propose_day_edit(
+    day_date: str,
+    payload: DayEditRequest,
+    request: Request,
+    db: SyncDbSession,
+    user: SyncCurrentUser,
+) -> dict[str, object]:
+    def run() -> dict[str, object]:
+        service = JournalWriteService(db, request.app.state.config)
         try:
             return service.propose_day_edit(
-                user_id=user_id,
+                user_id=user.user_id,
                 day_date=day_date,
                 edited_content=payload.content,
                 session_id=payload.session_id,
@@ -113,32 +259,38 @@ def propose_day_edit(day_date: str, payload: DayEditRequest, request: Request) -
         except Exception as exc:  # noqa: BLE001
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    return await run_in_threadpool(run)
+
 
 @router.post("/confirm")
-def confirm(payload: ConfirmRequest, request: Request) -> dict[str, object]:
-    user_id = _current_user_id(request)
-    cfg = request.app.state.config
-    session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        service = JournalWriteService(db, cfg)
+async def confirm(
+    payload: ConfirmRequest, request: Request, db: SyncDbSession, user: SyncCurrentUser
+) -> dict[str, object]:
+    def run() -> dict[str, object]:
+        service = JournalWriteService(db, request.app.state.config)
         try:
             return service.confirm(
-                user_id=user_id,
+                user_id=user.user_id,
                 session_id=payload.session_id,
                 idempotency_key=payload.idempotency_key,
             )
+        except StaleProposalError as exc:
+            raise HTTPException(status_code=409, detail=str(exc)) from exc
         except Exception as exc:  # noqa: BLE001
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    return await run_in_threadpool(run)
+
 
 @router.post("/cancel")
-def cancel(payload: CancelRequest, request: Request) -> dict[str, object]:
-    user_id = _current_user_id(request)
-    cfg = request.app.state.config
-    session_factory = get_session_factory_from_app(request.app)
-    with session_factory() as db:
-        service = JournalWriteService(db, cfg)
+async def cancel(
+    payload: CancelRequest, request: Request, db: SyncDbSession, user: SyncCurrentUser
+) -> dict[str, object]:
+    def run() -> dict[str, object]:
+        service = JournalWriteService(db, request.app.state.config)
         try:
-            return service.cancel(user_id=user_id, session_id=payload.session_id)
+            return service.cancel(user_id=user.user_id, session_id=payload.session_id)
         except Exception as exc:  # noqa: BLE001
             raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return await run_in_threadpool(run)
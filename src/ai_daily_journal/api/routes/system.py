@@ -6,10 +6,19 @@ from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 
 from ai_daily_journal import __version__
-from ai_daily_journal.config import load_secrets
-from ai_daily_journal.db.migrations import current_migration_version
-from ai_daily_journal.db.session import create_engine_from_config
-from ai_daily_journal.paths import default_env_path
+from ai_daily_journal.db.migrations import migration_head
+from ai_daily_journal.db.session import get_engine_from_app
+from ai_daily_journal.metrics import metrics
+from ai_daily_journal.services.model_limiter import limiter_snapshot
+from ai_daily_journal.services.model_router import routing_snapshot
+from ai_daily_journal.services.readiness import (
+    ProbeCache,
+    ProbeResult,
+    database_check,
+    migration_check,
+    model_endpoint_checks,
+    run_checks,
+)
 
 router = APIRouter(tags=["system"])
 
@@ -19,19 +28,48 @@ def healthz() -> dict[str, str]:
     return {"status": "ok"}
 
 
+def _probe_cache(request: Request) -> ProbeCache:
+    cache = getattr(request.app.state, "probe_cache", None)
+    if cache is None:
+        cache = ProbeCache(request.app.state.config.diagnostics.probe_cache_seconds)
+        request.app.state.probe_cache = cache
+    return cache
+
+
+def _readiness_checks(request: Request) -> dict[str, ProbeResult]:
+    cfg = request.app.state.config
+    engine = get_engine_from_app(request.app)
+    checks = {"db": database_check(engine), "migrations": migration_check(engine)}
+    return run_checks(checks, cfg.diagnostics.readiness_timeout_seconds)
+
+
 @router.get("/readyz")
 def readyz(request: Request) -> JSONResponse:
     cfg = request.app.state.config
     if cfg is None:
         return JSONResponse({"status": "not_ready", "reason": "config_missing"}, status_code=503)
+    if not getattr(request.app.state, "warmup_complete", True):
+        return JSONResponse({"status": "not_ready", "reason": "warming_up"}, status_code=503)
     try:
-        env = load_secrets(default_env_path())
-        engine = create_engine_from_config(cfg, env)
-        with engine.connect() as conn:
-            conn.exec_driver_sql("SELECT 1")
-        return JSONResponse({"status": "ready", "db": "ok"}, status_code=200)
+        results = _probe_cache(request).get("readyz", lambda: _readiness_checks(request))
     except Exception as exc:  # noqa: BLE001
         return JSONResponse({"status": "not_ready", "reason": str(exc)}, status_code=503)
+    checks = {name: result.as_dict() for name, result in results.items()}
+    if all(result.ok for result in results.values()):
+        return JSONResponse({"status": "ready", "db": "ok", "checks": checks}, status_code=200)
+    failed = next(name for name, result in results.items() if not result.ok)
+    reason = f"{failed}: {results[failed].detail}"
+    return JSONResponse(
+        {"status": "not_ready", "reason": reason, "checks": checks}, status_code=503
+    )
+
+
+def _diagnostic_checks(request: Request) -> dict[str, ProbeResult]:
+    cfg = request.app.state.config
+    engine = get_engine_from_app(request.app)
+    checks = {"db": database_check(engine), "migrations": migration_check(engine)}
+    checks.update(model_endpoint_checks(cfg))
+    return run_checks(checks, cfg.diagnostics.readiness_timeout_seconds)
 
 
 @router.get("/diagnostics")
@@ -45,19 +83,29 @@ def diagnostics(request: Request) -> dict[str, object]:
     if cfg is None:
         return payload
 
-    env = load_secrets(default_env_path())
     try:
-        engine = create_engine_from_config(cfg, env)
-        with engine.connect() as conn:
-            conn.exec_driver_sql("SELECT 1")
-        payload["db_ready"] = True
-        payload["migration_version"] = current_migration_version(engine)
+        results = _probe_cache(request).get("diagnostics", lambda: _diagnostic_checks(request))
     except Exception as exc:  # noqa: BLE001
         payload["db_ready"] = False
         payload["db_error"] = str(exc)
+    else:
+        payload["db_ready"] = results["db"].ok
+        if not results["db"].ok:
+            payload["db_error"] = results["db"].detail
+        payload["migration_version"] = results["migrations"].detail
+        payload["migration_head"] = migration_head()
+        payload["checks"] = {name: result.as_dict() for name, result in results.items()}
     payload["models"] = {
         "coordinator": cfg.models.coordinator.model_name,
         "editor": cfg.models.editor.model_name,
         "embeddings": cfg.models.embeddings.model_name,
     }
+    payload["warmup"] = {
+        "complete": getattr(request.app.state, "warmup_complete", True),
+        "steps": getattr(request.app.state, "warmup_report", {}),
+    }
+    payload["maintenance"] = getattr(request.app.state, "maintenance_report", {})
+    payload["model_routing"] = routing_snapshot()
+    payload["model_limits"] = limiter_snapshot()
+    payload["metrics"] = metrics.snapshot()
     return payload
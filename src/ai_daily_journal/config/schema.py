@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from typing import Literal
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class StrictModel(BaseModel):
@@ -19,6 +20,28 @@ class ApiUIConfig(StrictModel):
     cors_origins: list[str] = Field(default_factory=list)
     session_cookie_name: str = "aijournal_session"
     session_ttl_seconds: int = Field(default=86400, ge=60)
+    # In-process token cache; logouts reach other workers via session_revocations polling.
+    session_cache_ttl_seconds: float = Field(default=60.0, ge=0)
+    session_cache_max_entries: int = Field(default=10_000, ge=1)
+    session_revocation_poll_seconds: float = Field(default=2.0, ge=0)
+    # "signed": stateless HMAC tokens validated without I/O; keys come from this env var as
+    # comma-separated "key_id:secret" pairs, the first one signing and the rest verify-only.
+    session_mode: Literal["database", "signed"] = "database"
+    session_signing_keys_env: str = "AI_DAILY_JOURNAL_SESSION_KEYS"
+
+
+class PasswordHashingConfig(StrictModel):
+    """Argon2id parameters; stored hashes made with other values are upgraded on login."""
+
+    time_cost: int = Field(default=3, ge=1)
+    memory_cost_kib: int = Field(default=65536, ge=8)
+    parallelism: int = Field(default=4, ge=1)
+    hash_len: int = Field(default=32, ge=16)
+    salt_len: int = Field(default=16, ge=8)
+    # Worker processes for hashing; 0 hashes in threads of the API process instead.
+    processes: int = Field(default=2, ge=0)
+    # Jobs allowed to wait behind the running ones before logins are refused with 429.
+    max_queue: int = Field(default=16, ge=0)
 
 
 class DatabaseConfig(StrictModel):
@@ -28,24 +51,66 @@ class DatabaseConfig(StrictModel):
     echo_sql: bool = False
 
 
-class SingleModelRoleConfig(StrictModel):
+class ModelEndpointConfig(StrictModel):
+    name: str | None = None
+    base_url: str
+    api_key_env: str
+    weight: float = Field(default=1.0, gt=0.0)
+    # Backends often name the same model differently; falls back to the role's model_name.
+    model_name: str | None = None
+    # Bulkhead limits; unset values inherit the role-level limits.
+    max_in_flight: int | None = Field(default=None, ge=1)
+    requests_per_minute: int | None = Field(default=None, ge=1)
+
+
+class RoutedRoleConfig(StrictModel):
+    base_url: str | None = None
+    api_key_env: str | None = None
+    endpoints: list[ModelEndpointConfig] = Field(default_factory=list)
+    max_in_flight: int = Field(default=8, ge=1)
+    requests_per_minute: int | None = Field(default=None, ge=1)
+
+    @model_validator(mode="after")
+    def validate_endpoints(self) -> RoutedRoleConfig:
+        if not self.endpoints and (self.base_url is None or self.api_key_env is None):
+            raise ValueError("Set either base_url and api_key_env, or a list of endpoints")
+        return self
+
+    def resolved_endpoints(self) -> list[ModelEndpointConfig]:
+        endpoints = self.endpoints or [
+            ModelEndpointConfig(base_url=self.base_url, api_key_env=self.api_key_env)
+        ]
+        return [
+            endpoint.model_copy(
+                update={
+                    "max_in_flight": endpoint.max_in_flight or self.max_in_flight,
+                    "requests_per_minute": endpoint.requests_per_minute or self.requests_per_minute,
+                }
+            )
+            for endpoint in endpoints
+        ]
+
+
+class SingleModelRoleConfig(RoutedRoleConfig):
     model_name: str
     temperature: float = Field(default=0.0, ge=0.0, le=2.0)
     max_retries: int = Field(default=2, ge=0, le=5)
-    base_url: str
-    api_key_env: str
 
 
-class EmbeddingsConfig(StrictModel):
+class EmbeddingsConfig(RoutedRoleConfig):
     enabled: bool = True
     model_name: str
     dimensions: int = Field(default=1536, ge=64)
-    base_url: str
-    api_key_env: str
 
 
 class ModelsConfig(StrictModel):
     provider: str = "openai_compatible"
+    # Single structured-output call (coordinator endpoint) returns decision + event text.
+    fused: bool = False
+    request_timeout_seconds: float = Field(default=30.0, gt=0)
+    rate_limit_retries: int = Field(default=2, ge=0, le=5)
+    # End-to-end budget for one propose; each stage only gets what is left.
+    propose_deadline_seconds: float = Field(default=20.0, gt=0)
     coordinator: SingleModelRoleConfig
     editor: SingleModelRoleConfig
     embeddings: EmbeddingsConfig
@@ -54,6 +119,18 @@ class ModelsConfig(StrictModel):
 class DecisionConfig(StrictModel):
     dedup_similarity_threshold: float = Field(default=0.88, ge=0.0, le=1.0)
     candidate_limit: int = Field(default=10, ge=1, le=100)
+    fast_path_enabled: bool = True
+    ambiguity_band_min: float | None = Field(default=None, ge=0.0, le=1.0)
+    ambiguity_band_max: float = Field(default=0.97, ge=0.0, le=1.0)
+
+    @model_validator(mode="after")
+    def validate_ambiguity_band(self) -> DecisionConfig:
+        if (
+            self.ambiguity_band_min is not None
+            and self.ambiguity_band_min > self.ambiguity_band_max
+        ):
+            raise ValueError("ambiguity_band_min must not exceed ambiguity_band_max")
+        return self
 
 
 class LoggingConfig(StrictModel):
@@ -68,6 +145,20 @@ class LoggingConfig(StrictModel):
 class DiagnosticsConfig(StrictModel):
     health_timeout_seconds: int = Field(default=2, ge=1)
     readiness_timeout_seconds: int = Field(default=5, ge=1)
+    # /readyz and /diagnostics reuse probe results this long; orchestrators poll often.
+    probe_cache_seconds: float = Field(default=5.0, ge=0)
+
+
+class WarmupConfig(StrictModel):
+    """Startup work done before /readyz reports ready."""
+
+    enabled: bool = True
+    # Open database.pool_size connections up front instead of on first requests.
+    prewarm_pool: bool = True
+    # Execute the hot read/auth statements once so their compiled forms are cached.
+    hot_statements: bool = True
+    # Open a connection on each model endpoint's shared HTTP client.
+    model_endpoints: bool = True
 
 
 class RuntimeConfig(StrictModel):
@@ -83,6 +174,22 @@ class RuntimeConfig(StrictModel):
         return value
 
 
+class MaintenanceConfig(StrictModel):
+    """Retention sweeps run in the background by the API (or by `aijournal maintenance run`)."""
+
+    enabled: bool = True
+    interval_seconds: float = Field(default=3600.0, gt=0)
+    # Rows per DELETE; each batch is its own short transaction.
+    batch_size: int = Field(default=500, ge=1)
+    batch_pause_seconds: float = Field(default=0.05, ge=0)
+    idempotency_key_retention_days: int = Field(default=30, ge=1)
+    # Draft write sessions untouched for this long are deleted with their pending operations.
+    draft_session_retention_days: int = Field(default=7, ge=1)
+    # Superseded entries and finished operations older than this move to the archive tables;
+    # null keeps everything in the hot tables.
+    archive_after_days: int | None = Field(default=90, ge=1)
+
+
 class AppConfig(StrictModel):
     server: ServerConfig
     api_ui: ApiUIConfig
@@ -92,3 +199,6 @@ class AppConfig(StrictModel):
     logging: LoggingConfig
     diagnostics: DiagnosticsConfig
     runtime: RuntimeConfig
+    warmup: WarmupConfig = Field(default_factory=WarmupConfig)
+    password_hashing: PasswordHashingConfig = Field(default_factory=PasswordHashingConfig)
+    maintenance: MaintenanceConfig = Field(default_factory=MaintenanceConfig)
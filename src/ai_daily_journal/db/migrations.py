@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
+from alembic.script import ScriptDirectory
 from sqlalchemy import Engine, text
 
+from ai_daily_journal.paths import repo_root
+
 
 def current_migration_version(engine: Engine) -> str | None:
     with engine.connect() as conn:
@@ -17,3 +22,10 @@ def current_migration_version(engine: Engine) -> str | None:
 def migration_status(engine: Engine) -> dict[str, object]:
     version = current_migration_version(engine)
     return {"has_alembic_version": version is not None, "current_version": version}
+
+
+@lru_cache(maxsize=1)
+def migration_head(script_location: str | None = None) -> str | None:
+    """Head revision of the Alembic scripts shipped with this checkout."""
+    location = script_location or str(repo_root() / "migrations")
+    return ScriptDirectory(location).get_current_head()
@@ -5,15 +5,20 @@ from enum import Enum
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
+    DDL,
     JSON,
     Date,
     DateTime,
     Enum as SAEnum,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
+    event,
+    text,
 )
 from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -71,6 +76,12 @@ class OperationAction(str, Enum):
     create = "create"
 
 
+class DayChangeKind(str, Enum):
+    created = "created"
+    modified = "modified"
+    deleted = "deleted"
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -78,6 +89,10 @@ class User(Base):
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     timezone: Mapped[str] = mapped_column(String(64), default="Europe/Ljubljana", nullable=False)
+    # Bumped on every journal change; used as the ETag of user-wide views (tree, latest).
+    journal_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
@@ -89,12 +104,26 @@ class UserSession(Base):
 
     token: Mapped[str] = mapped_column(String(128), primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
 
     user: Mapped[User] = relationship("User")
 
 
+class SessionRevocation(Base):
+    """Logged-out session tokens (hashed), polled by every worker to evict cached sessions."""
+
+    __tablename__ = "session_revocations"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, nullable=False, index=True
+    )
+
+
 class JournalDay(Base):
     __tablename__ = "ai_daily_journal_days"
     __table_args__ = (UniqueConstraint("user_id", "day_date", name="uq_day_user_date"),)
@@ -103,6 +132,9 @@ class JournalDay(Base):
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     day_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     timezone: Mapped[str] = mapped_column(String(64), nullable=False)
+    rendered_content: Mapped[str | None] = mapped_column(Text, nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
@@ -115,7 +147,17 @@ class JournalDay(Base):
 
 class JournalEntry(Base):
     __tablename__ = "ai_daily_journal_entries"
-    __table_args__ = (UniqueConstraint("day_id", "sequence_no", name="uq_entry_day_sequence"),)
+    # Only active entries own a sequence slot; superseded history may repeat it.
+    __table_args__ = (
+        Index(
+            "uq_entry_day_sequence_active",
+            "day_id",
+            "sequence_no",
+            unique=True,
+            postgresql_where=text("superseded_by_entry_id IS NULL"),
+            sqlite_where=text("superseded_by_entry_id IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     day_id: Mapped[int] = mapped_column(
@@ -139,6 +181,50 @@ class JournalEntry(Base):
     day: Mapped[JournalDay] = relationship("JournalDay", back_populates="entries")
 
 
+class JournalEntryArchive(Base):
+    """Superseded entries moved out of the hot table; read through ``journal_entry_history``."""
+
+    __tablename__ = "ai_daily_journal_entries_archive"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    day_id: Mapped[int] = mapped_column(
+        ForeignKey("ai_daily_journal_days.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    sequence_no: Mapped[int] = mapped_column(Integer, nullable=False)
+    event_text_sl: Mapped[str] = mapped_column(Text, nullable=False)
+    source_user_text: Mapped[str] = mapped_column(Text, nullable=False)
+    event_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # No foreign keys: the entries they point at may be archived too.
+    superseded_by_entry_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    updated_from_entry_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, nullable=False
+    )
+
+
+class JournalChange(Base):
+    """Append-only log of day-level changes; ``id`` doubles as the sync cursor."""
+
+    __tablename__ = "journal_changes"
+    __table_args__ = (Index("ix_journal_changes_user_cursor", "user_id", "id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    day_id: Mapped[int | None] = mapped_column(
+        ForeignKey("ai_daily_journal_days.id", ondelete="SET NULL"), nullable=True
+    )
+    day_date: Mapped[date] = mapped_column(Date, nullable=False)
+    change_kind: Mapped[DayChangeKind] = mapped_column(
+        SAEnum(DayChangeKind, name="day_change_kind"), nullable=False
+    )
+    day_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, nullable=False
+    )
+
+
 class SemanticDocument(Base):
     __tablename__ = "semantic_documents"
 
@@ -153,6 +239,8 @@ class SemanticDocument(Base):
 
 class WriteSession(Base):
     __tablename__ = "write_sessions"
+    # Lets the retention sweep find abandoned drafts without scanning every session.
+    __table_args__ = (Index("ix_write_sessions_status_updated_at", "status", "updated_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -168,10 +256,14 @@ class WriteSession(Base):
 
 class WriteOperation(Base):
     __tablename__ = "write_operations"
+    # "Latest operation of a session" reads the first index entry instead of sorting.
+    __table_args__ = (
+        Index("ix_write_operations_session_id_id", "session_id", text("id DESC")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[int] = mapped_column(
-        ForeignKey("write_sessions.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("write_sessions.id", ondelete="CASCADE"), nullable=False
     )
     action: Mapped[OperationAction] = mapped_column(
         SAEnum(OperationAction, name="operation_action"), nullable=False
@@ -188,6 +280,31 @@ class WriteOperation(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
 
 
+class WriteOperationArchive(Base):
+    """Applied or cancelled operations moved out of the hot table."""
+
+    __tablename__ = "write_operations_archive"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    session_id: Mapped[int] = mapped_column(
+        ForeignKey("write_sessions.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    action: Mapped[OperationAction] = mapped_column(
+        SAEnum(OperationAction, name="operation_action"), nullable=False
+    )
+    decision_json: Mapped[dict] = mapped_column(JSON, nullable=False)
+    proposed_entries_json: Mapped[list[dict]] = mapped_column(JSON, nullable=False)
+    diff_text: Mapped[str] = mapped_column(Text, nullable=False)
+    applied_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    status: Mapped[OperationStatus] = mapped_column(
+        SAEnum(OperationStatus, name="operation_status"), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, nullable=False
+    )
+
+
 class IdempotencyKey(Base):
     __tablename__ = "idempotency_keys"
     __table_args__ = (UniqueConstraint("key", "user_id", name="uq_idempotency_key_user"),)
@@ -197,10 +314,17 @@ class IdempotencyKey(Base):
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
     first_seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
-    last_seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
+    last_seen_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, nullable=False, index=True
+    )
     operation_id: Mapped[int | None] = mapped_column(
         ForeignKey("write_operations.id", ondelete="SET NULL"), nullable=True
     )
+    session_id: Mapped[int | None] = mapped_column(
+        ForeignKey("write_sessions.id", ondelete="SET NULL"), nullable=True
+    )
+    # zlib-compressed JSON of the original confirm response, replayed verbatim.
+    response_snapshot: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
 
 
 class SchemaVersion(Base):
@@ -209,3 +333,31 @@ class SchemaVersion(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     version: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
     applied_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
+
+
+ENTRY_HISTORY_COLUMNS = (
+    "id, day_id, sequence_no, event_text_sl, source_user_text, event_hash, "
+    "superseded_by_entry_id, updated_from_entry_id, created_at, updated_at"
+)
+OPERATION_HISTORY_COLUMNS = (
+    "id, session_id, action, decision_json, proposed_entries_json, diff_text, applied_at, "
+    "status, created_at"
+)
+
+# Hot and archived rows side by side; ``archived_at`` is NULL for rows still in the hot table.
+HISTORY_VIEWS = {
+    "journal_entry_history": (
+        f"SELECT {ENTRY_HISTORY_COLUMNS}, NULL AS archived_at FROM ai_daily_journal_entries "
+        f"UNION ALL SELECT {ENTRY_HISTORY_COLUMNS}, archived_at "
+        "FROM ai_daily_journal_entries_archive"
+    ),
+    "write_operation_history": (
+        f"SELECT {OPERATION_HISTORY_COLUMNS}, NULL AS archived_at FROM write_operations "
+        f"UNION ALL SELECT {OPERATION_HISTORY_COLUMNS}, archived_at FROM write_operations_archive"
+    ),
+}
+
+# Migrations create the views on real databases; this covers metadata.create_all (tests).
+for _name, _query in HISTORY_VIEWS.items():
+    event.listen(Base.metadata, "after_create", DDL(f"CREATE VIEW {_name} AS {_query}"))
+    event.listen(Base.metadata, "before_drop", DDL(f"DROP VIEW IF EXISTS {_name}"))
@@ -1,44 +1,150 @@
 from __future__ import annotations
 
+import threading
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Callable
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import URL, Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 from ai_daily_journal.config import resolve_secret
 from ai_daily_journal.config.schema import AppConfig
+from ai_daily_journal.metrics import metrics
 
 SessionFactory = Callable[[], Session]
+AsyncSessionFactory = Callable[[], AsyncSession]
 
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+psycopg"}
 
-def create_engine_from_config(config: AppConfig, env: dict[str, str]) -> Engine:
-    url = resolve_secret(env, config.database.url_env)
-    kwargs: dict[str, object] = {"echo": config.database.echo_sql, "future": True}
+# Guards lazy engine construction so concurrent first requests share one engine.
+_BUILD_LOCK = threading.Lock()
+
+# Pool checkouts made for the current request; None outside a request.
+_request_checkouts: ContextVar[list[int] | None] = ContextVar("request_checkouts", default=None)
+
+
+def async_url(url: str | URL) -> URL:
+    """The async-driver flavour of ``url`` (psycopg async on Postgres, aiosqlite on SQLite)."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend])
+
+
+def _engine_kwargs(config: AppConfig, url: str) -> dict[str, object]:
+    kwargs: dict[str, object] = {"echo": config.database.echo_sql}
     if not url.startswith("sqlite"):
         kwargs["pool_size"] = config.database.pool_size
         kwargs["max_overflow"] = config.database.max_overflow
-    return create_engine(url, **kwargs)
+    return kwargs
+
+
+def create_engine_from_config(config: AppConfig, env: dict[str, str]) -> Engine:
+    url = resolve_secret(env, config.database.url_env)
+    return create_engine(url, future=True, **_engine_kwargs(config, url))
+
+
+def create_async_engine_from_config(config: AppConfig, env: dict[str, str]) -> AsyncEngine:
+    url = resolve_secret(env, config.database.url_env)
+    return create_async_engine(async_url(url), **_engine_kwargs(config, url))
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:  # noqa: ANN001
+    metrics.increment("db_pool_checkout_total")
+    counter = _request_checkouts.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def count_pool_checkouts(engine: Engine | AsyncEngine) -> None:
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if not event.contains(sync_engine, "checkout", _on_checkout):
+        event.listen(sync_engine, "checkout", _on_checkout)
+
+
+def start_checkout_count() -> list[int]:
+    """Start counting pool checkouts in the current context (and threads it hands work to)."""
+    counter = [0]
+    _request_checkouts.set(counter)
+    return counter
 
 
 def build_session_factory(engine: Engine) -> SessionFactory:
+    count_pool_checkouts(engine)
     maker = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
     return maker
 
 
+def build_async_session_factory(engine: AsyncEngine) -> AsyncSessionFactory:
+    count_pool_checkouts(engine)
+    # Attributes must stay readable after commit: lazy loads are not allowed under asyncio.
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def load_app_env(app) -> dict[str, str]:  # noqa: ANN001
+    from ai_daily_journal.config.loader import load_secrets
+
+    return load_secrets(Path(app.state.repo_root) / ".env")
+
+
 def get_session_factory_from_app(app) -> SessionFactory:  # noqa: ANN001
     existing = getattr(app.state, "session_factory", None)
     if existing is not None:
         return existing
-    cfg = app.state.config
-    if cfg is None:
-        raise RuntimeError("Configuration not loaded")
-    env_path = Path(app.state.repo_root) / ".env"
-    from ai_daily_journal.config.loader import load_secrets
+    with _BUILD_LOCK:
+        existing = getattr(app.state, "session_factory", None)
+        if existing is not None:
+            return existing
+        cfg = app.state.config
+        if cfg is None:
+            raise RuntimeError("Configuration not loaded")
+        engine = create_engine_from_config(cfg, load_app_env(app))
+        factory = build_session_factory(engine)
+        app.state.db_engine = engine
+        app.state.session_factory = factory
+        return factory
+
+
+def get_engine_from_app(app) -> Engine:  # noqa: ANN001
+    """The engine behind the app's sync sessions, built once and shared by every request."""
+    factory = get_session_factory_from_app(app)
+    engine = getattr(app.state, "db_engine", None)
+    # A factory injected directly (tests) carries its engine as the sessionmaker bind.
+    return engine if engine is not None else factory.kw["bind"]
+
+
+def get_async_session_factory_from_app(app) -> AsyncSessionFactory:  # noqa: ANN001
+    """Async sessions for the API's read and auth routes; the CLI keeps the sync path."""
+    existing = getattr(app.state, "async_session_factory", None)
+    if existing is not None:
+        return existing
+    with _BUILD_LOCK:
+        existing = getattr(app.state, "async_session_factory", None)
+        if existing is not None:
+            return existing
+        cfg = app.state.config
+        if cfg is None:
+            raise RuntimeError("Configuration not loaded")
+        engine = create_async_engine_from_config(cfg, load_app_env(app))
+        factory = build_async_session_factory(engine)
+        app.state.async_db_engine = engine
+        app.state.async_session_factory = factory
+        return factory
+
 
-    env = load_secrets(env_path)
-    engine = create_engine_from_config(cfg, env)
-    factory = build_session_factory(engine)
-    app.state.db_engine = engine
-    app.state.session_factory = factory
-    return factory
+async def dispose_app_engines(app) -> None:  # noqa: ANN001
+    """Close the pools of engines this module built for ``app`` (injected ones are left alone)."""
+    engine = getattr(app.state, "db_engine", None)
+    if engine is not None:
+        engine.dispose()
+    async_engine = getattr(app.state, "async_db_engine", None)
+    if async_engine is not None:
+        await async_engine.dispose()
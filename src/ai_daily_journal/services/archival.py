@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import (
+    CTE,
+    Connection,
+    DateTime,
+    Select,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.orm import aliased
+
+from ai_daily_journal.db.models import (
+    IdempotencyKey,
+    JournalEntry,
+    JournalEntryArchive,
+    SemanticDocument,
+    SessionStatus,
+    WriteOperation,
+    WriteOperationArchive,
+    WriteSession,
+)
+
+# The UNION ALL views over hot and archived rows; same columns as the archive tables.
+entry_history = table(
+    "journal_entry_history",
+    *(column(col.name, col.type) for col in JournalEntryArchive.__table__.columns),
+)
+operation_history = table(
+    "write_operation_history",
+    *(column(col.name, col.type) for col in WriteOperationArchive.__table__.columns),
+)
+
+
+def entry_history_query(day_id: int) -> Select:
+    """Every entry a day has had, active or superseded, hot or archived."""
+    return (
+        select(entry_history)
+        .where(entry_history.c.day_id == day_id)
+        .order_by(entry_history.c.sequence_no, entry_history.c.id)
+    )
+
+
+def operation_history_query(session_id: int) -> Select:
+    return (
+        select(operation_history)
+        .where(operation_history.c.session_id == session_id)
+        .order_by(operation_history.c.id)
+    )
+
+
+def _move(connection: Connection, source, target, ids: list[int], now: datetime) -> None:  # noqa: ANN001
+    names = [col.name for col in source.__table__.columns]
+    rows = select(
+        *(source.__table__.c[name] for name in names),
+        literal(now, DateTime(timezone=True)),
+    ).where(source.id.in_(ids))
+    connection.execute(insert(target).from_select([*names, "archived_at"], rows))
+
+
+def _pinned_entries(cutoff: datetime) -> CTE:
+    """Ids that must stay hot: reachable along ``superseded_by`` from a recent superseded row.
+
+    Archiving one of them would let ON DELETE SET NULL clear the link of a row that stays
+    in the hot table and make it look active again.
+    """
+    referrer = aliased(JournalEntry)
+    pinned = (
+        select(referrer.superseded_by_entry_id.label("id"))
+        .where(
+            referrer.superseded_by_entry_id.is_not(None),
+            referrer.superseded_by_entry_id != referrer.id,
+            referrer.updated_at >= cutoff,
+        )
+        .cte("pinned_entries", recursive=True)
+    )
+    successor = aliased(JournalEntry)
+    return pinned.union(
+        select(successor.superseded_by_entry_id)
+        .join(pinned, successor.id == pinned.c.id)
+        .where(
+            successor.superseded_by_entry_id.is_not(None),
+            successor.superseded_by_entry_id != successor.id,
+        )
+    )
+
+
+def archive_entries_batch(
+    connection: Connection, *, cutoff: datetime, limit: int, now: datetime
+) -> int:
+    """Move up to ``limit`` entries superseded before ``cutoff`` into the archive table.
+
+    A superseding entry is always inserted after the one it replaces, so in id order a
+    batch holds every older link of a chain before the newer ones: whole chains move
+    together, and no row left behind points at an archived one.
+    """
+    pinned = _pinned_entries(cutoff)
+    ids = list(
+        connection.execute(
+            select(JournalEntry.id)
+            .where(
+                JournalEntry.superseded_by_entry_id.is_not(None),
+                JournalEntry.updated_at < cutoff,
+                JournalEntry.id.not_in(select(pinned.c.id)),
+            )
+            .order_by(JournalEntry.id)
+            .limit(limit)
+        ).scalars()
+    )
+    if not ids:
+        return 0
+    _move(connection, JournalEntry, JournalEntryArchive, ids, now)
+    # Keeps updated_at; the archived row still records the link via superseded_by_entry_id.
+    connection.execute(
+        update(JournalEntry)
+        .where(JournalEntry.updated_from_entry_id.in_(ids))
+        .values(updated_from_entry_id=None, updated_at=JournalEntry.updated_at)
+    )
+    connection.execute(delete(SemanticDocument).where(SemanticDocument.entry_id.in_(ids)))
+    connection.execute(delete(JournalEntry).where(JournalEntry.id.in_(ids)))
+    return len(ids)
+
+
+def archive_operations_batch(
+    connection: Connection, *, cutoff: datetime, limit: int, now: datetime
+) -> int:
+    """Move up to ``limit`` operations of confirmed or cancelled sessions older than ``cutoff``.
+
+    Oldest first, so a session's latest operation (the one its idempotency key replays) is
+    the last to go and its key is cleared in the same transaction.
+    """
+    finished_at = func.coalesce(WriteOperation.applied_at, WriteOperation.created_at)
+    finished_sessions = select(WriteSession.id).where(WriteSession.status != SessionStatus.draft)
+    ids = list(
+        connection.execute(
+            select(WriteOperation.id)
+            .where(
+                WriteOperation.session_id.in_(finished_sessions),
+                finished_at < cutoff,
+            )
+            .order_by(WriteOperation.id)
+            .limit(limit)
+        ).scalars()
+    )
+    if not ids:
+        return 0
+    _move(connection, WriteOperation, WriteOperationArchive, ids, now)
+    # Replays compare the key's operation with the session's latest hot one: both become NULL.
+    connection.execute(
+        update(IdempotencyKey).where(IdempotencyKey.operation_id.in_(ids)).values(operation_id=None)
+    )
+    connection.execute(delete(WriteOperation).where(WriteOperation.id.in_(ids)))
+    return len(ids)
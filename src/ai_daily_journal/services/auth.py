@@ -1,21 +1,84 @@
 from __future__ import annotations
 
 import secrets
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta
 
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
-from sqlalchemy import select
+from sqlalchemy import Select, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ai_daily_journal.db.models import User, UserSession
+from ai_daily_journal.config.schema import PasswordHashingConfig
+from ai_daily_journal.db.models import SessionRevocation, User, UserSession
+from ai_daily_journal.metrics import metrics
+from ai_daily_journal.services.password_hashing import (
+    PasswordHashPool,
+    hash_params,
+    hash_password,
+    verify_password,
+)
+from ai_daily_journal.services.session_cache import CachedSession, SessionTokenCache, hash_token
+from ai_daily_journal.services.signed_sessions import SignedSessionCodec
+
+# Revocations only have to outlive the slowest worker's poll; older rows are pruned on logout.
+REVOCATION_RETENTION = timedelta(days=1)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite drops tzinfo on DateTime(timezone=True) columns.
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _new_session(user_id: int, ttl_seconds: int) -> UserSession:
+    expires = datetime.now(UTC) + timedelta(seconds=ttl_seconds)
+    return UserSession(token=secrets.token_urlsafe(32), user_id=user_id, expires_at=expires)
+
+
+def _latest_revocation_query() -> Select:
+    return select(func.max(SessionRevocation.id))
+
+
+def _revocations_query(cursor: int) -> Select:
+    return (
+        select(SessionRevocation.id, SessionRevocation.token_hash)
+        .where(SessionRevocation.id > cursor)
+        .order_by(SessionRevocation.id)
+    )
+
+
+def _session_row_query(token: str) -> Select:
+    return (
+        select(UserSession.user_id, UserSession.expires_at, User.timezone)
+        .join(User, User.id == UserSession.user_id)
+        .where(UserSession.token == token)
+    )
+
+
+# Above any real revocation id, so the warmup poll reads nothing.
+_WARMUP_CURSOR = 2**31 - 1
+
+
+def hot_auth_statements() -> list[Select]:
+    """What :meth:`AsyncAuthService.cached_session` runs, for the startup warmup."""
+    return [
+        _session_row_query(""),
+        _latest_revocation_query(),
+        _revocations_query(_WARMUP_CURSOR),
+    ]
 
 
 class AuthService:
-    def __init__(self, db: Session, session_ttl_seconds: int = 86_400) -> None:
+    def __init__(
+        self,
+        db: Session,
+        session_ttl_seconds: int = 86_400,
+        *,
+        hashing: PasswordHashingConfig | None = None,
+        codec: SignedSessionCodec | None = None,
+    ) -> None:
         self.db = db
         self.session_ttl_seconds = session_ttl_seconds
-        self._hasher = PasswordHasher()
+        self.codec = codec
+        self._params = hash_params(hashing or PasswordHashingConfig())
 
     def register_user(self, email: str, password: str, timezone_name: str) -> User:
         existing = self.db.execute(select(User).where(User.email == email)).scalar_one_or_none()
@@ -23,7 +86,7 @@ class AuthService:
             raise ValueError("Email already registered")
         user = User(
             email=email,
-            password_hash=self._hasher.hash(password),
+            password_hash=hash_password(self._params, password),
             timezone=timezone_name,
         )
         self.db.add(user)
@@ -35,22 +98,151 @@ class AuthService:
         user = self.db.execute(select(User).where(User.email == email)).scalar_one_or_none()
         if user is None:
             return None
-        try:
-            self._hasher.verify(user.password_hash, password)
-        except VerifyMismatchError:
+        result = verify_password(self._params, user.password_hash, password)
+        if not result.ok:
             return None
-        token = secrets.token_urlsafe(32)
-        expires = datetime.now(timezone.utc) + timedelta(seconds=self.session_ttl_seconds)
-        self.db.add(UserSession(token=token, user_id=user.id, expires_at=expires))
+        if result.new_hash is not None:
+            user.password_hash = result.new_hash
+            metrics.increment("password_rehash_total")
+        session = _new_session(user.id, self.session_ttl_seconds)
+        self.db.add(session)
         self.db.commit()
-        return token
+        return session.token
 
-    def user_from_session_token(self, token: str) -> User | None:
-        session = self.db.execute(select(UserSession).where(UserSession.token == token)).scalar_one_or_none()
-        if session is None:
+    def _poll_revocations(self, cache: SessionTokenCache) -> None:
+        if cache.revocation_cursor is None and self.codec is None:
+            latest = self.db.execute(_latest_revocation_query()).scalar()
+            cache.apply_revocations([], int(latest or 0))
+            return
+        rows = self.db.execute(_revocations_query(cache.revocation_cursor or 0)).all()
+        cursor = rows[-1].id if rows else (cache.revocation_cursor or 0)
+        cache.apply_revocations([row.token_hash for row in rows], cursor)
+
+    def cached_session(self, token: str, cache: SessionTokenCache) -> CachedSession | None:
+        """Sync twin of :meth:`AsyncAuthService.cached_session`."""
+        if cache.revocations_due():
+            self._poll_revocations(cache)
+        token_hash = hash_token(token)
+        if self.codec is not None:
+            return None if cache.is_revoked(token_hash) else self.codec.verify(token)
+        cached = cache.get(token_hash)
+        if cached is not None:
+            return cached
+        row = self.db.execute(_session_row_query(token)).one_or_none()
+        if row is None:
             return None
-        if session.expires_at < datetime.now(timezone.utc):
-            self.db.delete(session)
+        expires_at = _as_utc(row.expires_at)
+        if expires_at < datetime.now(UTC):
+            self.db.execute(delete(UserSession).where(UserSession.token == token))
             self.db.commit()
             return None
-        return self.db.get(User, session.user_id)
+        session = CachedSession(user_id=row.user_id, timezone=row.timezone, expires_at=expires_at)
+        cache.put(token_hash, session)
+        return session
+
+
+class AsyncAuthService:
+    """:class:`AuthService` for async routes; Argon2 runs in ``passwords``.
+
+    With a ``codec`` sessions are signed tokens instead of ``user_sessions`` rows.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        session_ttl_seconds: int = 86_400,
+        *,
+        codec: SignedSessionCodec | None = None,
+        passwords: PasswordHashPool | None = None,
+    ) -> None:
+        self.db = db
+        self.session_ttl_seconds = session_ttl_seconds
+        self.codec = codec
+        self.passwords = passwords or PasswordHashPool(PasswordHashingConfig(processes=0))
+
+    async def register_user(self, email: str, password: str, timezone_name: str) -> User:
+        existing = (
+            await self.db.execute(select(User).where(User.email == email))
+        ).scalar_one_or_none()
+        if existing is not None:
+            raise ValueError("Email already registered")
+        password_hash = await self.passwords.hash(password)
+        user = User(email=email, password_hash=password_hash, timezone=timezone_name)
+        self.db.add(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+
+    async def authenticate(self, email: str, password: str) -> str | None:
+        user = (
+            await self.db.execute(select(User).where(User.email == email))
+        ).scalar_one_or_none()
+        if user is None:
+            return None
+        result = await self.passwords.verify(user.password_hash, password)
+        if not result.ok:
+            return None
+        if result.new_hash is not None:
+            user.password_hash = result.new_hash
+            metrics.increment("password_rehash_total")
+        if self.codec is not None:
+            expires = datetime.now(UTC) + timedelta(seconds=self.session_ttl_seconds)
+            if result.new_hash is not None:
+                await self.db.commit()
+            return self.codec.issue(user.id, user.timezone, expires)
+        session = _new_session(user.id, self.session_ttl_seconds)
+        self.db.add(session)
+        await self.db.commit()
+        return session.token
+
+    async def _poll_revocations(self, cache: SessionTokenCache) -> None:
+        if cache.revocation_cursor is None and self.codec is None:
+            # Tokens revoked before this process started cannot be cached here.
+            latest = (await self.db.execute(_latest_revocation_query())).scalar()
+            cache.apply_revocations([], int(latest or 0))
+            return
+        rows = (await self.db.execute(_revocations_query(cache.revocation_cursor or 0))).all()
+        cursor = rows[-1].id if rows else (cache.revocation_cursor or 0)
+        cache.apply_revocations([row.token_hash for row in rows], cursor)
+
+    async def cached_session(self, token: str, cache: SessionTokenCache) -> CachedSession | None:
+        """Resolve ``token`` from ``cache`` when possible, else with one joined query."""
+        if cache.revocations_due():
+            await self._poll_revocations(cache)
+        token_hash = hash_token(token)
+        if self.codec is not None:
+            # Signed tokens are checked in memory; only the revocation poll touches the DB.
+            return None if cache.is_revoked(token_hash) else self.codec.verify(token)
+        cached = cache.get(token_hash)
+        if cached is not None:
+            return cached
+        row = (await self.db.execute(_session_row_query(token))).one_or_none()
+        if row is None:
+            return None
+        expires_at = _as_utc(row.expires_at)
+        if expires_at < datetime.now(UTC):
+            await self.db.execute(delete(UserSession).where(UserSession.token == token))
+            await self.db.commit()
+            return None
+        session = CachedSession(user_id=row.user_id, timezone=row.timezone, expires_at=expires_at)
+        cache.put(token_hash, session)
+        return session
+
+    async def revoke_session(self, token: str, cache: SessionTokenCache | None = None) -> None:
+        """Delete the session and record the revocation so every worker evicts it."""
+        token_hash = hash_token(token)
+        retention = REVOCATION_RETENTION
+        if self.codec is None:
+            await self.db.execute(delete(UserSession).where(UserSession.token == token))
+        else:
+            # A signed token stays valid until it expires, so its revocation must outlive it.
+            retention = max(retention, timedelta(seconds=self.session_ttl_seconds))
+        await self.db.execute(
+            delete(SessionRevocation).where(
+                SessionRevocation.revoked_at < datetime.now(UTC) - retention
+            )
+        )
+        self.db.add(SessionRevocation(token_hash=token_hash))
+        await self.db.commit()
+        if cache is not None:
+            cache.revoke(token_hash)
@@ -8,6 +8,8 @@ from typing import Callable
 from pydantic import ValidationError
 
 from ai_daily_journal.schemas.coordinator import Action, CoordinatorDecision
+from ai_daily_journal.services.deadline import Deadline, DeadlineExceededError
+from ai_daily_journal.services.model_client import ModelClientError
 
 
 class CoordinatorOutputError(RuntimeError):
@@ -21,6 +23,8 @@ class CoordinatorContext:
     candidate_entry_ids: list[int]
     top_similarity: float
     existing_entries_count: int
+    instruction: str | None = None
+    deadline: Deadline | None = None
 
 
 Responder = Callable[[CoordinatorContext], str]
@@ -46,12 +50,24 @@ class CoordinatorService:
         self.allow_fallback = allow_fallback
 
     def decide(self, context: CoordinatorContext) -> CoordinatorResult:
+        deadline = context.deadline
         errors: list[str] = []
         attempts = 0
+        budget_exhausted = False
         if self.responder is not None:
             for _ in range(self.max_retries + 1):
+                if deadline is not None and deadline.expired:
+                    budget_exhausted = True
+                    break
                 attempts += 1
-                raw = self.responder(context)
+                try:
+                    raw = self.responder(context)
+                except (DeadlineExceededError, ModelClientError) as exc:
+                    errors.append(str(exc))
+                    if deadline is not None and deadline.expired:
+                        budget_exhausted = True
+                        break
+                    continue
                 try:
                     data = json.loads(raw)
                     decision = CoordinatorDecision.model_validate(data)
@@ -61,10 +77,16 @@ class CoordinatorService:
                     continue
         if self.allow_fallback:
             fallback = CoordinatorDecision.model_validate(json.loads(self._local_responder(context)))
-            warning = (
-                "Coordinator model output was invalid or unavailable; "
-                "used deterministic fallback with explicit warning."
-            )
+            if budget_exhausted:
+                warning = (
+                    "Propose latency budget exhausted before the coordinator returned "
+                    "a valid decision; used deterministic fallback with explicit warning."
+                )
+            else:
+                warning = (
+                    "Coordinator model output was invalid or unavailable; "
+                    "used deterministic fallback with explicit warning."
+                )
             if errors:
                 warning += f" Last error: {errors[-1]}"
             return CoordinatorResult(decision=fallback, warnings=[warning], attempts=max(attempts, 1))
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from ai_daily_journal.db.models import JournalDay
+
+# Dialects without row locks (SQLite) serialize per day through striped
+# in-process locks; they only ever run inside one process.
+_STRIPES = [threading.Lock() for _ in range(64)]
+
+
+def _stripe(user_id: int, day_date: date) -> threading.Lock:
+    return _STRIPES[hash((user_id, day_date)) % len(_STRIPES)]
+
+
+def _select_day(user_id: int, day_date: date) -> Select[tuple[JournalDay]]:
+    # populate_existing so a row already in the session is re-read under the lock.
+    return (
+        select(JournalDay)
+        .where(JournalDay.user_id == user_id, JournalDay.day_date == day_date)
+        .execution_options(populate_existing=True)
+    )
+
+
+@contextmanager
+def locked_day(
+    db: Session, user_id: int, day_date: date, *, timezone_name: str = "Europe/Ljubljana"
+) -> Iterator[tuple[JournalDay, bool]]:
+    """Yield ``(day, created)`` with the day row held exclusively until the transaction ends.
+
+    On Postgres the row is created with ON CONFLICT DO NOTHING and then locked
+    with SELECT .. FOR UPDATE, so concurrent confirms for one day queue up
+    instead of racing on sequence numbers. Commit inside the block.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+
+        created = db.execute(
+            insert(JournalDay)
+            .values(user_id=user_id, day_date=day_date, timezone=timezone_name)
+            .on_conflict_do_nothing(index_elements=[JournalDay.user_id, JournalDay.day_date])
+            .returning(JournalDay.id)
+        ).first() is not None
+        day = db.execute(_select_day(user_id, day_date).with_for_update()).scalar_one()
+        yield day, created
+        return
+
+    with _stripe(user_id, day_date):
+        day = db.execute(_select_day(user_id, day_date)).scalar_one_or_none()
+        created = day is None
+        if day is None:
+            day = JournalDay(user_id=user_id, day_date=day_date, timezone=timezone_name)
+            db.add(day)
+            db.flush()
+        yield day, created
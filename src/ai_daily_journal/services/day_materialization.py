@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import hashlib
+
+from sqlalchemy import Select, select, update
+from sqlalchemy.orm import Session
+
+from ai_daily_journal.db.models import JournalDay, JournalEntry, User
+from ai_daily_journal.services.day_content import render_day_text
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def active_events_query(day_id: int) -> Select[tuple[str]]:
+    return (
+        select(JournalEntry.event_text_sl)
+        .where(
+            JournalEntry.day_id == day_id,
+            JournalEntry.superseded_by_entry_id.is_(None),
+        )
+        .order_by(JournalEntry.sequence_no.asc())
+    )
+
+
+def active_entries_query(day_id: int) -> Select[tuple[JournalEntry]]:
+    """Served by ``uq_entry_day_sequence_active`` without a sort."""
+    return (
+        select(JournalEntry)
+        .where(
+            JournalEntry.day_id == day_id,
+            JournalEntry.superseded_by_entry_id.is_(None),
+        )
+        .order_by(JournalEntry.sequence_no.asc())
+    )
+
+
+def active_events(db: Session, day_id: int) -> list[str]:
+    return list(db.execute(active_events_query(day_id)).scalars())
+
+
+def materialize_day(db: Session, day: JournalDay) -> str:
+    """Re-render ``day`` from its active entries and bump its version.
+
+    Must run in the same transaction that changed the entries so readers never
+    see content that disagrees with the entry rows.
+    """
+    db.flush()
+    content = render_day_text(day.day_date, active_events(db, day.id))
+    day.rendered_content = content
+    day.content_hash = content_hash(content)
+    day.version = (day.version or 0) + 1
+    return content
+
+
+def touch_journal(db: Session, user_id: int) -> None:
+    """Invalidate user-wide views (tree, latest) by bumping the journal version."""
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(journal_version=User.journal_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def day_content(db: Session, day: JournalDay) -> str:
+    """Materialized content of ``day``, rendering on the fly for rows never materialized."""
+    if day.rendered_content is not None:
+        return day.rendered_content
+    return render_day_text(day.day_date, active_events(db, day.id))
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+
+class DeadlineExceededError(RuntimeError):
+    pass
+
+
+class Deadline:
+    """End-to-end latency budget shared by every stage of one request."""
+
+    def __init__(
+        self, budget_seconds: float, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.budget_seconds = budget_seconds
+        self._clock = clock
+        self._started_at = clock()
+        self.expires_at = self._started_at + budget_seconds
+
+    def elapsed(self) -> float:
+        return self._clock() - self._started_at
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def timeout(self, cap: float) -> float:
+        """Per-call timeout: the remaining budget, never more than ``cap``."""
+        remaining = self.remaining()
+        if remaining <= 0.0:
+            raise DeadlineExceededError(f"Latency budget of {self.budget_seconds:g}s exhausted")
+        return min(cap, remaining)
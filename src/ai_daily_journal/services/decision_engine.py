@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from ai_daily_journal.config.schema import DecisionConfig
+from ai_daily_journal.metrics import metrics
+from ai_daily_journal.schemas.coordinator import Action
+from ai_daily_journal.services.semantic_search import semantic_relation
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RuleOutcome:
+    action: Action
+    rule: str
+    reason: str
+
+
+class DecisionEngine:
+    """Settles unambiguous propose decisions without calling the coordinator model.
+
+    The coordinator is only consulted when the top similarity falls inside the
+    configured ambiguity band; everywhere else the semantic overrides in
+    ``JournalWriteService.propose`` would decide the action anyway.
+    """
+
+    def __init__(self, config: DecisionConfig) -> None:
+        self.config = config
+
+    @property
+    def band(self) -> tuple[float, float]:
+        low = self.config.ambiguity_band_min
+        if low is None:
+            low = self.config.dedup_similarity_threshold
+        return low, self.config.ambiguity_band_max
+
+    def settle(
+        self,
+        *,
+        top_similarity: float,
+        existing_entries_count: int,
+        has_candidates: bool,
+    ) -> RuleOutcome | None:
+        if not self.config.fast_path_enabled:
+            return None
+        if existing_entries_count == 0:
+            return RuleOutcome(
+                action=Action.create,
+                rule="no_entries",
+                reason="Za ta dan še ni vnosa; ustvarimo nov zapis.",
+            )
+        relation = semantic_relation(
+            top_similarity,
+            dedup_threshold=self.config.dedup_similarity_threshold,
+        )
+        if relation == "same_event":
+            return RuleOutcome(
+                action=Action.noop,
+                rule="same_event",
+                reason="Vnos je skoraj enak obstoječemu dogodku.",
+            )
+        low, high = self.band
+        if low <= top_similarity < high:
+            return None
+        if relation == "potential_update" and has_candidates:
+            return RuleOutcome(
+                action=Action.update,
+                rule="potential_update",
+                reason="Vnos je podoben obstoječemu dogodku in ga je smiselno posodobiti.",
+            )
+        if relation == "distinct":
+            return RuleOutcome(
+                action=Action.append,
+                rule="distinct",
+                reason="Dan že vsebuje vnose; dodamo nov dogodek.",
+            )
+        return None
+
+
+def record_decision(source: str, rule: str | None, top_similarity: float) -> None:
+    metrics.increment("decision_total", source=source)
+    if rule is not None:
+        metrics.increment("decision_fast_path_total", rule=rule)
+    logger.info(
+        "propose decision source=%s rule=%s top_similarity=%.4f",
+        source,
+        rule or "-",
+        top_similarity,
+    )
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Callable
 
 from ai_daily_journal.schemas.coordinator import Action
+from ai_daily_journal.services.deadline import Deadline
 
 
 @dataclass(slots=True)
@@ -13,6 +14,7 @@ class EditorContext:
     instruction: str | None
     existing_entries: list[dict]
     candidate_entry_ids: list[int]
+    deadline: Deadline | None = None
 
 
 @dataclass(slots=True)
@@ -35,6 +37,11 @@ class EditorService:
         polished = self._polish_slovenian(ctx.source_text, ctx.instruction)
         if self.responder is None:
             warnings.append("Editor model unavailable; deterministic Slovenian fallback used.")
+        elif ctx.deadline is not None and ctx.deadline.expired:
+            warnings.append(
+                "Propose latency budget exhausted before the editor ran; "
+                "deterministic Slovenian fallback used."
+            )
         else:
             try:
                 polished = self.responder(ctx.source_text, ctx.instruction)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+
+from ai_daily_journal.services.coordinator import CoordinatorContext, Responder
+from ai_daily_journal.services.editor import TextResponder
+
+FUSED_SYSTEM_PROMPT = (
+    "You are coordinator and editor for AI Daily Journal. "
+    "Return strict JSON only with keys: "
+    "resolved_date (YYYY-MM-DD), action (noop|append|update|create), "
+    "candidate_entry_ids (array of ints), reason (Slovenian), "
+    "event_text_sl (one polished Slovenian event sentence; do not invent facts)."
+)
+
+
+class FusedDraftMissingError(RuntimeError):
+    pass
+
+
+class FusedResponder:
+    """Splits one fused model response into coordinator JSON and editor text.
+
+    The coordinator side strips ``event_text_sl`` before handing the payload to
+    ``CoordinatorService`` so its strict schema validation and retries still
+    apply. The drafted text is kept until the editor asks for it; when the
+    coordinator call was skipped or produced no usable text, the editor falls
+    back to its own responder (or to the deterministic editor fallback).
+    """
+
+    def __init__(self, call: Callable[[CoordinatorContext], str]) -> None:
+        self._call = call
+        self._drafts: dict[tuple[str, str | None], str] = {}
+
+    def coordinator(self, ctx: CoordinatorContext) -> str:
+        raw = self._call(ctx)
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            return raw
+        if not isinstance(data, dict):
+            return raw
+        event_text = data.pop("event_text_sl", None)
+        if isinstance(event_text, str) and event_text.strip():
+            self._drafts[(ctx.user_text, ctx.instruction)] = event_text.strip()
+        return json.dumps(data, ensure_ascii=False)
+
+    def editor(self, fallback: TextResponder | None) -> TextResponder:
+        def respond(source_text: str, instruction: str | None) -> str:
+            draft = self._drafts.pop((source_text, instruction), None)
+            if draft is not None:
+                return draft
+            if fallback is None:
+                raise FusedDraftMissingError("Fused response did not include event_text_sl")
+            return fallback(source_text, instruction)
+
+        return respond
+
+
+def fused_responders(
+    call: Callable[[CoordinatorContext], str],
+    editor_fallback: TextResponder | None,
+) -> tuple[Responder, TextResponder]:
+    fused = FusedResponder(call)
+    return fused.coordinator, fused.editor(editor_fallback)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ai_daily_journal.db.models import DayChangeKind, JournalChange, JournalDay
+
+CURSOR_PREFIX = "v1:"
+DEFAULT_CHANGES_LIMIT = 200
+MAX_CHANGES_LIMIT = 1000
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(change_id: int) -> str:
+    raw = f"{CURSOR_PREFIX}{change_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> int:
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursorError("Malformed sync cursor") from exc
+    if not raw.startswith(CURSOR_PREFIX) or not raw[len(CURSOR_PREFIX) :].isdigit():
+        raise InvalidCursorError("Malformed sync cursor")
+    return int(raw[len(CURSOR_PREFIX) :])
+
+
+def record_day_change(db: Session, day: JournalDay, kind: DayChangeKind) -> None:
+    """Append a change-log row; call in the transaction that changed ``day``."""
+    db.add(
+        JournalChange(
+            user_id=day.user_id,
+            day_id=day.id,
+            day_date=day.day_date,
+            change_kind=kind,
+            day_version=day.version,
+        )
+    )
+
+
+@dataclass(slots=True)
+class ChangeSet:
+    changes: list[dict[str, object]] = field(default_factory=list)
+    next_cursor: str = ""
+    has_more: bool = False
+
+
+class JournalChangesService:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def changes_since(
+        self,
+        user_id: int,
+        cursor: str | None,
+        *,
+        limit: int = DEFAULT_CHANGES_LIMIT,
+        include_content: bool = False,
+    ) -> ChangeSet:
+        since = decode_cursor(cursor)
+        limit = max(1, min(limit, MAX_CHANGES_LIMIT))
+        rows = list(
+            self.db.execute(
+                select(JournalChange)
+                .where(JournalChange.user_id == user_id, JournalChange.id > since)
+                .order_by(JournalChange.id.asc())
+                .limit(limit + 1)
+            ).scalars()
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if not rows:
+            return ChangeSet(next_cursor=encode_cursor(since))
+
+        # Several log rows for one day collapse into its latest state; a day
+        # created inside the window stays "created" for the client.
+        by_day: dict[str, dict[str, object]] = {}
+        for row in rows:
+            key = row.day_date.isoformat()
+            previous = by_day.pop(key, None)
+            kind = row.change_kind
+            if (
+                previous is not None
+                and previous["change"] == DayChangeKind.created.value
+                and kind == DayChangeKind.modified
+            ):
+                kind = DayChangeKind.created
+            by_day[key] = {
+                "day_date": key,
+                "change": kind.value,
+                "version": row.day_version,
+                "day_id": row.day_id,
+            }
+
+        if include_content:
+            # A day deleted after this window leaves its log rows with day_id NULL.
+            live = [
+                item
+                for item in by_day.values()
+                if item["change"] != DayChangeKind.deleted.value and item["day_id"] is not None
+            ]
+            contents: dict[int, str | None] = {}
+            if live:
+                contents = dict(
+                    self.db.execute(
+                        select(JournalDay.id, JournalDay.rendered_content).where(
+                            JournalDay.id.in_([item["day_id"] for item in live])
+                        )
+                    ).all()
+                )
+            for item in by_day.values():
+                if item["change"] != DayChangeKind.deleted.value:
+                    item["content"] = contents.get(item["day_id"])
+
+        changes = []
+        for item in by_day.values():
+            item.pop("day_id")
+            changes.append(item)
+        return ChangeSet(changes=changes, next_cursor=encode_cursor(rows[-1].id), has_more=has_more)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+import zlib
+from collections.abc import Iterator
+from datetime import date
+from typing import Literal
+
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+
+from ai_daily_journal.db.models import JournalDay, JournalEntry
+
+ExportFormat = Literal["ndjson", "markdown"]
+
+EXPORT_BATCH_SIZE = 500
+# Flush compressed output roughly every this many input bytes.
+GZIP_CHUNK_BYTES = 64 * 1024
+
+
+def _export_rows(db: Session, user_id: int, batch_size: int) -> Iterator[tuple]:
+    """Days joined with their active entries, streamed with a server-side cursor.
+
+    Plain column tuples keep the ORM identity map empty, so memory stays flat.
+    """
+    statement = (
+        select(
+            JournalDay.day_date,
+            JournalEntry.sequence_no,
+            JournalEntry.event_text_sl,
+            JournalEntry.source_user_text,
+        )
+        .outerjoin(
+            JournalEntry,
+            and_(
+                JournalEntry.day_id == JournalDay.id,
+                JournalEntry.superseded_by_entry_id.is_(None),
+            ),
+        )
+        .where(JournalDay.user_id == user_id)
+        .order_by(JournalDay.day_date.asc(), JournalEntry.sequence_no.asc())
+        .execution_options(stream_results=True, yield_per=batch_size)
+    )
+    yield from db.execute(statement)
+
+
+def iter_export_days(
+    db: Session, user_id: int, *, batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[tuple[date, list[dict[str, object]]]]:
+    """Yield ``(day_date, entries)`` one day at a time, oldest first."""
+    current: date | None = None
+    entries: list[dict[str, object]] = []
+    for day_date, sequence_no, event_text, source_text in _export_rows(db, user_id, batch_size):
+        if current is not None and day_date != current:
+            yield current, entries
+            entries = []
+        current = day_date
+        if sequence_no is not None:
+            entries.append(
+                {
+                    "sequence_no": sequence_no,
+                    "event_text_sl": event_text,
+                    "source_user_text": source_text,
+                }
+            )
+    if current is not None:
+        yield current, entries
+
+
+def _format_day(day_date: date, entries: list[dict[str, object]], fmt: ExportFormat) -> str:
+    if fmt == "ndjson":
+        payload = {"day_date": day_date.isoformat(), "entries": entries}
+        return json.dumps(payload, ensure_ascii=False) + "\n"
+    lines = [f"# Dnevnik za {day_date.isoformat()}", ""]
+    lines.extend(f"{idx}. {entry['event_text_sl']}" for idx, entry in enumerate(entries, start=1))
+    return "\n".join(lines) + "\n\n"
+
+
+def _gzip(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)
+    pending = 0
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        pending += len(chunk)
+        if pending >= GZIP_CHUNK_BYTES:
+            out += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def export_journal(
+    db: Session,
+    user_id: int,
+    *,
+    fmt: ExportFormat = "ndjson",
+    gzip: bool = False,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[bytes]:
+    """Encoded export stream; holds at most one day and one fetch batch in memory."""
+    chunks = (
+        _format_day(day_date, entries, fmt).encode("utf-8")
+        for day_date, entries in iter_export_days(db, user_id, batch_size=batch_size)
+    )
+    return _gzip(chunks) if gzip else chunks
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from ai_daily_journal.config.schema import AppConfig
+from ai_daily_journal.db.models import (
+    DayChangeKind,
+    JournalChange,
+    JournalDay,
+    JournalEntry,
+    SemanticDocument,
+    User,
+    utc_now,
+)
+from ai_daily_journal.services.day_content import parse_day_edit_text, render_day_text
+from ai_daily_journal.services.day_materialization import content_hash, touch_journal
+from ai_daily_journal.services.model_limiter import Priority
+from ai_daily_journal.services.model_router import build_router
+from ai_daily_journal.services.semantic_search import deterministic_embedding
+
+logger = logging.getLogger(__name__)
+
+BatchEmbedder = Callable[[list[str]], list[list[float]]]
+
+IMPORT_DAY_BATCH = 500
+EMBEDDING_BATCH = 256
+IMPORT_SUFFIXES = {".md", ".markdown", ".txt"}
+
+_DATE_IN_NAME = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_DAY_HEADING = re.compile(r"^#*\s*dnevnik za (\d{4}-\d{2}-\d{2})\s*$", re.IGNORECASE)
+_ENTRY_COLUMNS = ("day_id", "sequence_no", "event_text_sl", "source_user_text", "event_hash")
+
+
+class ImportSourceError(ValueError):
+    pass
+
+
+@dataclass(slots=True)
+class ImportStats:
+    days_imported: int = 0
+    days_skipped: int = 0
+    entries_imported: int = 0
+    embeddings_written: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "days_imported": self.days_imported,
+            "days_skipped": self.days_skipped,
+            "entries_imported": self.entries_imported,
+            "embeddings_written": self.embeddings_written,
+        }
+
+
+def parse_day_sections(text: str, fallback_date: date | None) -> Iterator[tuple[date, list[str]]]:
+    """Split a day file into ``(date, events)``.
+
+    A file either holds one day (date taken from its name) or several sections
+    headed ``# Dnevnik za YYYY-MM-DD`` as written by the Markdown export.
+    """
+    current = fallback_date
+    from_heading = False
+    lines: list[str] = []
+    for raw in text.splitlines():
+        heading = _DAY_HEADING.match(raw.strip())
+        if heading is None:
+            lines.append(raw)
+            continue
+        events = parse_day_edit_text("\n".join(lines))
+        if current is not None and (from_heading or events):
+            yield current, events
+        current = date.fromisoformat(heading.group(1))
+        from_heading = True
+        lines = []
+    events = parse_day_edit_text("\n".join(lines))
+    if current is None:
+        if events:
+            raise ImportSourceError("Day file has no date in its name or headings")
+        return
+    yield current, events
+
+
+def iter_import_days(source: Path) -> Iterator[tuple[date, list[str]]]:
+    """Days from a single file or from every Markdown/plaintext file under a directory."""
+    files = (
+        sorted(p for p in source.rglob("*") if p.is_file() and p.suffix.lower() in IMPORT_SUFFIXES)
+        if source.is_dir()
+        else [source]
+    )
+    for path in files:
+        match = _DATE_IN_NAME.search(path.stem)
+        fallback = date.fromisoformat(match.group(1)) if match else None
+        try:
+            yield from parse_day_sections(path.read_text(encoding="utf-8"), fallback)
+        except ImportSourceError as exc:
+            raise ImportSourceError(f"{path}: {exc}") from exc
+
+
+def _hash_text(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def build_batch_embedder(config: AppConfig, env: dict[str, str]) -> BatchEmbedder:
+    """Batch embedder for imports; runs at background priority behind interactive traffic."""
+    dimensions = config.models.embeddings.dimensions
+    if not config.models.embeddings.enabled:
+        return lambda texts: [deterministic_embedding(text, dimensions) for text in texts]
+    router = build_router(
+        "embeddings",
+        config.models.embeddings,
+        env,
+        model_name=config.models.embeddings.model_name,
+        timeout_seconds=config.models.request_timeout_seconds,
+        rate_limit_retries=config.models.rate_limit_retries,
+        priority=Priority.background,
+    )
+    return lambda texts: router.call(
+        lambda endpoint: endpoint.client.embeddings(model=endpoint.model_name, texts=texts)
+    )
+
+
+class JournalImportService:
+    """Bulk loader for historical journals that bypasses propose/confirm.
+
+    Each batch of days is one transaction, and days that already exist are
+    skipped, so an interrupted import can simply be re-run.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        *,
+        embeddings_model_name: str,
+        embeddings_dimensions: int,
+        batch_embedder: BatchEmbedder | None = None,
+        day_batch_size: int = IMPORT_DAY_BATCH,
+        embedding_batch_size: int = EMBEDDING_BATCH,
+    ) -> None:
+        self.db = db
+        self.embeddings_model_name = embeddings_model_name
+        self.embeddings_dimensions = embeddings_dimensions
+        self.batch_embedder = batch_embedder
+        self.day_batch_size = day_batch_size
+        self.embedding_batch_size = embedding_batch_size
+
+    def import_days(self, user_id: int, days: Iterable[tuple[date, list[str]]]) -> ImportStats:
+        timezone_name = self.db.execute(
+            select(User.timezone).where(User.id == user_id)
+        ).scalar_one()
+        stats = ImportStats()
+        seen: set[date] = set()
+        for batch in _batched(days, self.day_batch_size):
+            fresh: dict[date, list[str]] = {}
+            for day_date, events in batch:
+                if day_date in seen:
+                    stats.days_skipped += 1
+                    continue
+                seen.add(day_date)
+                fresh[day_date] = events
+            existing = set(
+                self.db.execute(
+                    select(JournalDay.day_date).where(
+                        JournalDay.user_id == user_id,
+                        JournalDay.day_date.in_(list(fresh)),
+                    )
+                ).scalars()
+            )
+            stats.days_skipped += len(existing)
+            for day_date in existing:
+                fresh.pop(day_date)
+            if fresh:
+                self._import_batch(user_id, timezone_name, fresh, stats)
+            self.db.commit()
+            logger.info("journal import batch committed", extra=stats.as_dict())
+        return stats
+
+    def _import_batch(
+        self,
+        user_id: int,
+        timezone_name: str,
+        days: dict[date, list[str]],
+        stats: ImportStats,
+    ) -> None:
+        day_rows = []
+        for day_date, events in days.items():
+            content = render_day_text(day_date, events)
+            day_rows.append(
+                {
+                    "user_id": user_id,
+                    "day_date": day_date,
+                    "timezone": timezone_name,
+                    "rendered_content": content,
+                    "content_hash": content_hash(content),
+                    "version": 1,
+                }
+            )
+        inserted = self.db.execute(
+            insert(JournalDay).returning(JournalDay.id, JournalDay.day_date), day_rows
+        )
+        day_ids = {row.day_date: row.id for row in inserted}
+
+        entry_rows = [
+            (day_ids[day_date], seq, text, text, _hash_text(text))
+            for day_date, events in days.items()
+            for seq, text in enumerate(events, start=1)
+        ]
+        self._insert_entries(entry_rows)
+        stats.entries_imported += len(entry_rows)
+        stats.days_imported += len(days)
+
+        self.db.execute(
+            insert(JournalChange),
+            [
+                {
+                    "user_id": user_id,
+                    "day_id": day_id,
+                    "day_date": day_date,
+                    "change_kind": DayChangeKind.created,
+                    "day_version": 1,
+                }
+                for day_date, day_id in day_ids.items()
+            ],
+        )
+        touch_journal(self.db, user_id)
+
+        if self.batch_embedder is not None and entry_rows:
+            stats.embeddings_written += self._embed_entries(list(day_ids.values()))
+
+    def _insert_entries(self, rows: list[tuple]) -> None:
+        if not rows:
+            return
+        connection = self.db.connection()
+        if connection.dialect.name == "postgresql":
+            # COPY streams all rows in one round trip and skips per-row INSERT overhead.
+            columns = ", ".join((*_ENTRY_COLUMNS, "created_at", "updated_at"))
+            statement = f"COPY ai_daily_journal_entries ({columns}) FROM STDIN"
+            now = utc_now()
+            cursor = connection.connection.driver_connection.cursor()
+            with cursor.copy(statement) as copy:
+                for row in rows:
+                    copy.write_row((*row, now, now))
+            return
+        self.db.execute(
+            insert(JournalEntry), [dict(zip(_ENTRY_COLUMNS, row, strict=True)) for row in rows]
+        )
+
+    def _embed_entries(self, day_ids: list[int]) -> int:
+        entries = self.db.execute(
+            select(JournalEntry.id, JournalEntry.event_text_sl)
+            .where(JournalEntry.day_id.in_(day_ids))
+            .order_by(JournalEntry.id)
+        ).all()
+        written = 0
+        for chunk in _batched(entries, self.embedding_batch_size):
+            vectors = self.batch_embedder([text for _, text in chunk])
+            if any(len(vector) != self.embeddings_dimensions for vector in vectors):
+                raise ValueError("Embedding dimensions mismatch")
+            self.db.execute(
+                insert(SemanticDocument),
+                [
+                    {
+                        "entry_id": entry_id,
+                        "embedding": vector,
+                        "model_name": self.embeddings_model_name,
+                    }
+                    for (entry_id, _), vector in zip(chunk, vectors, strict=True)
+                ],
+            )
+            written += len(chunk)
+        return written
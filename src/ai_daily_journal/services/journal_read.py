@@ -1,52 +1,269 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections.abc import Sequence
 from datetime import date
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, and_, extract, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ai_daily_journal.db.models import JournalDay, JournalEntry
+from ai_daily_journal.db.models import JournalDay, JournalEntry, User
 from ai_daily_journal.services.day_content import render_day_text
+from ai_daily_journal.services.day_materialization import (
+    active_events_query,
+    content_hash,
+    day_content,
+)
+
+MONTH_DAYS_LIMIT = 31
+DAY_RANGE_LIMIT = 62
+
+# Statements and result shaping are shared by the sync and async services so the
+# two cannot drift apart; only the execution differs.
+
+
+def _journal_version_query(user_id: int) -> Select:
+    return select(User.journal_version).where(User.id == user_id)
+
+
+def _latest_day_query(user_id: int) -> Select:
+    return (
+        select(JournalDay)
+        .where(JournalDay.user_id == user_id)
+        .order_by(JournalDay.day_date.desc())
+        .limit(1)
+    )
+
+
+def _day_query(user_id: int, day_date: str) -> Select:
+    parsed = date.fromisoformat(day_date)
+    return select(JournalDay).where(JournalDay.user_id == user_id, JournalDay.day_date == parsed)
+
+
+def _tree_query(user_id: int) -> Select:
+    year = extract("year", JournalDay.day_date).label("year")
+    month = extract("month", JournalDay.day_date).label("month")
+    return (
+        select(year, month, func.count().label("days"))
+        .where(JournalDay.user_id == user_id)
+        .group_by(year, month)
+        .order_by(year.desc(), month.desc())
+    )
+
+
+def _tree_nodes(rows: Sequence[Row]) -> list[dict[str, object]]:
+    output: list[dict[str, object]] = []
+    for row in rows:
+        if not output or output[-1]["year"] != int(row.year):
+            output.append({"year": int(row.year), "count": 0, "months": []})
+        node = output[-1]
+        node["months"].append({"month": int(row.month), "count": int(row.days)})
+        node["count"] = int(node["count"]) + int(row.days)
+    return output
+
+
+def _month_days_query(
+    user_id: int, year: int, month: int, after: date | None, limit: int
+) -> Select:
+    query = select(JournalDay.day_date).where(
+        JournalDay.user_id == user_id,
+        JournalDay.day_date >= date(year, month, 1),
+    )
+    if month < 12:
+        query = query.where(JournalDay.day_date < date(year, month + 1, 1))
+    elif year < date.max.year:
+        query = query.where(JournalDay.day_date < date(year + 1, 1, 1))
+    # 9999-12 has no following month, so it stays open-ended.
+    if after is not None:
+        query = query.where(JournalDay.day_date < after)
+    return query.order_by(JournalDay.day_date.desc()).limit(limit + 1)
+
+
+def _month_days_page(days: list[date], limit: int) -> tuple[list[str], str | None]:
+    page = [d.isoformat() for d in days[:limit]]
+    return page, (page[-1] if len(days) > limit else None)
+
+
+def _day_range_query(
+    user_id: int, start: date, end: date, after: date | None, limit: int
+) -> Select:
+    days = select(
+        JournalDay.id,
+        JournalDay.day_date,
+        JournalDay.rendered_content,
+        JournalDay.version,
+    ).where(
+        JournalDay.user_id == user_id,
+        JournalDay.day_date >= start,
+        JournalDay.day_date <= end,
+    )
+    if after is not None:
+        # Strictly greater, rather than after + 1 day, which overflows at 9999-12-31.
+        days = days.where(JournalDay.day_date > after)
+    page = days.order_by(JournalDay.day_date.asc()).limit(limit + 1).subquery()
+    return (
+        select(page, JournalEntry.event_text_sl)
+        .outerjoin(
+            JournalEntry,
+            and_(
+                JournalEntry.day_id == page.c.id,
+                JournalEntry.superseded_by_entry_id.is_(None),
+                page.c.rendered_content.is_(None),
+            ),
+        )
+        .order_by(page.c.day_date.asc(), JournalEntry.sequence_no.asc())
+    )
+
+
+def _day_range_page(
+    rows: Sequence[Row], limit: int
+) -> tuple[list[dict[str, object]], str | None]:
+    days: list[dict[str, object]] = []
+    events: dict[int, list[str]] = {}
+    for row in rows:
+        if not days or days[-1]["id"] != row.id:
+            days.append(
+                {
+                    "id": row.id,
+                    "day_date": row.day_date,
+                    "content": row.rendered_content,
+                    "version": row.version,
+                }
+            )
+            events[row.id] = []
+        if row.event_text_sl is not None:
+            events[row.id].append(row.event_text_sl)
+
+    has_more = len(days) > limit
+    output = []
+    for day in days[:limit]:
+        content = day["content"]
+        if content is None:
+            content = render_day_text(day["day_date"], events[day["id"]])
+        output.append(
+            {
+                "day_date": day["day_date"].isoformat(),
+                "content": content,
+                "version": day["version"],
+            }
+        )
+    return output, (output[-1]["day_date"] if has_more else None)
 
 
 class JournalReadService:
     def __init__(self, db: Session) -> None:
         self.db = db
 
+    def journal_version(self, user_id: int) -> int:
+        return int(self.db.execute(_journal_version_query(user_id)).scalar() or 0)
+
+    def day_content_hash(self, day: JournalDay) -> str:
+        if day.content_hash is not None:
+            return day.content_hash
+        return content_hash(self.day_content(day))
+
     def latest_day(self, user_id: int) -> JournalDay | None:
-        return self.db.execute(
-            select(JournalDay)
-            .where(JournalDay.user_id == user_id)
-            .order_by(JournalDay.day_date.desc())
-            .limit(1)
-        ).scalar_one_or_none()
+        return self.db.execute(_latest_day_query(user_id)).scalar_one_or_none()
 
     def tree(self, user_id: int) -> list[dict[str, object]]:
-        days = self.db.execute(
-            select(JournalDay.day_date).where(JournalDay.user_id == user_id).order_by(JournalDay.day_date.desc())
-        ).scalars()
-        grouped: dict[int, dict[int, list[str]]] = defaultdict(lambda: defaultdict(list))
-        for d in days:
-            grouped[d.year][d.month].append(d.isoformat())
-        output: list[dict[str, object]] = []
-        for year in sorted(grouped.keys(), reverse=True):
-            months = []
-            for month in sorted(grouped[year].keys(), reverse=True):
-                months.append({"month": month, "days": grouped[year][month]})
-            output.append({"year": year, "months": months})
-        return output
+        """Year/month skeleton with day counts; day lists are fetched per month."""
+        return _tree_nodes(self.db.execute(_tree_query(user_id)).all())
+
+    def month_days(
+        self,
+        user_id: int,
+        year: int,
+        month: int,
+        *,
+        after: date | None = None,
+        limit: int = MONTH_DAYS_LIMIT,
+    ) -> tuple[list[str], str | None]:
+        """Days of one month, newest first, keyset-paginated by ``day_date``.
+
+        Returns the page and the ``after`` value for the next page (None when done).
+        """
+        query = _month_days_query(user_id, year, month, after, limit)
+        return _month_days_page(list(self.db.execute(query).scalars()), limit)
+
+    def day_range(
+        self,
+        user_id: int,
+        start: date,
+        end: date,
+        *,
+        after: date | None = None,
+        limit: int = DAY_RANGE_LIMIT,
+    ) -> tuple[list[dict[str, object]], str | None]:
+        """Rendered days in ``start..end`` (inclusive), oldest first, in one statement.
+
+        Materialized days come straight from ``rendered_content``; entries are only
+        joined for rows that were never materialized.
+        """
+        query = _day_range_query(user_id, start, end, after, limit)
+        return _day_range_page(self.db.execute(query).all(), limit)
+
+    def get_day(self, user_id: int, day_date: str) -> JournalDay | None:
+        return self.db.execute(_day_query(user_id, day_date)).scalar_one_or_none()
+
+    def day_content(self, day: JournalDay) -> str:
+        return day_content(self.db, day)
 
     def render_day_content(self, user_id: int, day_date: str) -> str | None:
-        parsed = date.fromisoformat(day_date)
-        day = self.db.execute(
-            select(JournalDay).where(JournalDay.user_id == user_id, JournalDay.day_date == parsed)
-        ).scalar_one_or_none()
+        day = self.get_day(user_id, day_date)
         if day is None:
             return None
-        entries = self.db.execute(
-            select(JournalEntry)
-            .where(JournalEntry.day_id == day.id, JournalEntry.superseded_by_entry_id.is_(None))
-            .order_by(JournalEntry.sequence_no.asc())
-        ).scalars()
-        return render_day_text(day.day_date, [entry.event_text_sl for entry in entries])
+        return self.day_content(day)
+
+
+class AsyncJournalReadService:
+    """:class:`JournalReadService` over an ``AsyncSession`` for the API routes."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def journal_version(self, user_id: int) -> int:
+        return int((await self.db.execute(_journal_version_query(user_id))).scalar() or 0)
+
+    async def day_content_hash(self, day: JournalDay) -> str:
+        if day.content_hash is not None:
+            return day.content_hash
+        return content_hash(await self.day_content(day))
+
+    async def latest_day(self, user_id: int) -> JournalDay | None:
+        return (await self.db.execute(_latest_day_query(user_id))).scalar_one_or_none()
+
+    async def tree(self, user_id: int) -> list[dict[str, object]]:
+        return _tree_nodes((await self.db.execute(_tree_query(user_id))).all())
+
+    async def month_days(
+        self,
+        user_id: int,
+        year: int,
+        month: int,
+        *,
+        after: date | None = None,
+        limit: int = MONTH_DAYS_LIMIT,
+    ) -> tuple[list[str], str | None]:
+        query = _month_days_query(user_id, year, month, after, limit)
+        return _month_days_page(list((await self.db.execute(query)).scalars()), limit)
+
+    async def day_range(
+        self,
+        user_id: int,
+        start: date,
+        end: date,
+        *,
+        after: date | None = None,
+        limit: int = DAY_RANGE_LIMIT,
+    ) -> tuple[list[dict[str, object]], str | None]:
+        query = _day_range_query(user_id, start, end, after, limit)
+        return _day_range_page((await self.db.execute(query)).all(), limit)
+
+    async def get_day(self, user_id: int, day_date: str) -> JournalDay | None:
+        return (await self.db.execute(_day_query(user_id, day_date))).scalar_one_or_none()
+
+    async def day_content(self, day: JournalDay) -> str:
+        if day.rendered_content is not None:
+            return day.rendered_content
+        events = (await self.db.execute(active_events_query(day.id))).scalars().all()
+        return render_day_text(day.day_date, list(events))
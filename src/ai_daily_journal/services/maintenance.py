@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import partial
+
+from anyio import to_thread
+from sqlalchemy import ColumnElement, Connection, Engine, delete, exists, select, text
+from sqlalchemy.orm import InstrumentedAttribute
+
+from ai_daily_journal.config.schema import AppConfig
+from ai_daily_journal.db.models import (
+    IdempotencyKey,
+    SessionRevocation,
+    SessionStatus,
+    UserSession,
+    WriteOperation,
+    WriteSession,
+)
+from ai_daily_journal.metrics import metrics
+from ai_daily_journal.services.archival import archive_entries_batch, archive_operations_batch
+from ai_daily_journal.services.auth import REVOCATION_RETENTION
+
+logger = logging.getLogger(__name__)
+
+# Key of the Postgres advisory lock that elects one maintenance runner across all nodes.
+MAINTENANCE_LOCK_KEY = 0x61696A6D  # "aijm"
+
+# Other databases are single-node; one runner per process is enough.
+_LOCAL_LOCK = threading.Lock()
+
+# Run after the retention sweeps when maintenance.archive_after_days is set.
+ARCHIVE_JOBS: tuple[tuple[str, Callable[..., int]], ...] = (
+    ("archive_entries", archive_entries_batch),
+    ("archive_operations", archive_operations_batch),
+)
+
+
+@dataclass(slots=True)
+class SweepResult:
+    name: str
+    deleted: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, object]:
+        return {"deleted": self.deleted, "batches": self.batches, "seconds": round(self.seconds, 4)}
+
+
+@dataclass(slots=True, frozen=True)
+class Sweep:
+    name: str
+    key: InstrumentedAttribute
+    where: ColumnElement[bool]
+
+
+def retention_sweeps(config: AppConfig, now: datetime) -> list[Sweep]:
+    """The configured sweeps, in the order they must run (operations before their sessions)."""
+    retention = config.maintenance
+    revocation_cutoff = now - max(
+        REVOCATION_RETENTION, timedelta(seconds=config.api_ui.session_ttl_seconds)
+    )
+    draft_cutoff = now - timedelta(days=retention.draft_session_retention_days)
+    # propose adds operations without touching the session row, so a recent operation
+    # keeps a draft alive too.
+    abandoned = (
+        (WriteSession.status == SessionStatus.draft)
+        & (WriteSession.updated_at < draft_cutoff)
+        & ~exists().where(
+            WriteOperation.session_id == WriteSession.id,
+            WriteOperation.created_at >= draft_cutoff,
+        )
+    )
+    abandoned_drafts = select(WriteSession.id).where(abandoned)
+    return [
+        Sweep("expired_sessions", UserSession.token, UserSession.expires_at < now),
+        Sweep(
+            "session_revocations",
+            SessionRevocation.id,
+            SessionRevocation.revoked_at < revocation_cutoff,
+        ),
+        Sweep(
+            "idempotency_keys",
+            IdempotencyKey.id,
+            IdempotencyKey.last_seen_at
+            < now - timedelta(days=retention.idempotency_key_retention_days),
+        ),
+        Sweep(
+            "draft_operations",
+            WriteOperation.id,
+            WriteOperation.session_id.in_(abandoned_drafts),
+        ),
+        Sweep("draft_sessions", WriteSession.id, abandoned),
+    ]
+
+
+def delete_in_batches(
+    engine: Engine,
+    sweep: Sweep,
+    *,
+    batch_size: int,
+    pause_seconds: float = 0.0,
+    stop: threading.Event | None = None,
+) -> SweepResult:
+    """Delete the rows matched by ``sweep`` ``batch_size`` at a time, one transaction each."""
+    batch = select(sweep.key).where(sweep.where).limit(batch_size)
+    statement = delete(sweep.key.class_).where(sweep.key.in_(batch.scalar_subquery()))
+    return run_in_batches(
+        engine,
+        sweep.name,
+        lambda connection: connection.execute(statement).rowcount,
+        batch_size=batch_size,
+        pause_seconds=pause_seconds,
+        stop=stop,
+    )
+
+
+def run_in_batches(
+    engine: Engine,
+    name: str,
+    run_batch: Callable[[Connection], int],
+    *,
+    batch_size: int,
+    pause_seconds: float = 0.0,
+    stop: threading.Event | None = None,
+) -> SweepResult:
+    """Call ``run_batch`` in its own transaction until it handles fewer than ``batch_size`` rows."""
+    result = SweepResult(name)
+    started = time.monotonic()
+    while stop is None or not stop.is_set():
+        with engine.begin() as connection:
+            handled = run_batch(connection)
+        result.deleted += handled
+        result.batches += 1
+        if handled < batch_size:
+            break
+        if pause_seconds:
+            time.sleep(pause_seconds)
+    result.seconds = time.monotonic() - started
+    metrics.increment("maintenance_rows_deleted_total", result.deleted, sweep=name)
+    metrics.observe("maintenance_sweep_seconds", result.seconds, sweep=name)
+    return result
+
+
+@contextmanager
+def maintenance_lock(engine: Engine) -> Iterator[bool]:
+    """Yield whether this process won the single-runner lock; never waits for it."""
+    if engine.dialect.name != "postgresql":
+        acquired = _LOCAL_LOCK.acquire(blocking=False)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                _LOCAL_LOCK.release()
+        return
+    # Session-level lock: held by this connection, released if the process dies.
+    with engine.connect() as connection:
+        acquired = bool(
+            connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+            ).scalar()
+        )
+        connection.commit()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+                )
+                connection.commit()
+
+
+def run_maintenance(
+    config: AppConfig,
+    engine: Engine,
+    *,
+    stop: threading.Event | None = None,
+    now: datetime | None = None,
+) -> list[SweepResult] | None:
+    """Run every retention sweep, then archival, once; None if another runner holds the lock."""
+    with maintenance_lock(engine) as acquired:
+        if not acquired:
+            logger.info("maintenance skipped: another runner holds the lock")
+            return None
+        now = now or datetime.now(UTC)
+        results: list[SweepResult] = []
+        for sweep in retention_sweeps(config, now):
+            if stop is not None and stop.is_set():
+                break
+            result = delete_in_batches(
+                engine,
+                sweep,
+                batch_size=config.maintenance.batch_size,
+                pause_seconds=config.maintenance.batch_pause_seconds,
+                stop=stop,
+            )
+            logger.info(
+                "maintenance sweep finished",
+                extra={"sweep": sweep.name, **result.as_dict()},
+            )
+            results.append(result)
+        if config.maintenance.archive_after_days is None:
+            return results
+        cutoff = now - timedelta(days=config.maintenance.archive_after_days)
+        for name, archive_batch in ARCHIVE_JOBS:
+            if stop is not None and stop.is_set():
+                break
+            result = run_in_batches(
+                engine,
+                name,
+                partial(archive_batch, cutoff=cutoff, limit=config.maintenance.batch_size, now=now),
+                batch_size=config.maintenance.batch_size,
+                pause_seconds=config.maintenance.batch_pause_seconds,
+                stop=stop,
+            )
+            logger.info("maintenance sweep finished", extra={"sweep": name, **result.as_dict()})
+            results.append(result)
+        return results
+
+
+class MaintenanceScheduler:
+    """Runs :func:`run_maintenance` every ``maintenance.interval_seconds`` in a worker thread."""
+
+    def __init__(
+        self,
+        config: AppConfig,
+        engine: Engine,
+        *,
+        on_report: Callable[[dict[str, dict[str, object]]], None] | None = None,
+    ) -> None:
+        self.config = config
+        self.engine = engine
+        self.on_report = on_report
+        self._stop = threading.Event()
+
+    def run_once(self) -> list[SweepResult] | None:
+        results = run_maintenance(self.config, self.engine, stop=self._stop)
+        if results is not None and self.on_report is not None:
+            self.on_report({result.name: result.as_dict() for result in results})
+        return results
+
+    async def run_forever(self) -> None:
+        while not self._stop.is_set():
+            await asyncio.sleep(self.config.maintenance.interval_seconds)
+            try:
+                await to_thread.run_sync(self.run_once)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("maintenance failed: %s", exc)
+
+    def stop(self) -> None:
+        """Make a running sweep return after its current batch."""
+        self._stop.set()
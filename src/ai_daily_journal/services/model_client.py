@@ -1,22 +1,135 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from typing import Any
 
 import httpx
 
+from ai_daily_journal.services.model_limiter import (
+    EndpointLimiter,
+    LimiterTimeoutError,
+    Priority,
+    parse_retry_after,
+)
+
+RATE_LIMIT_BACKOFF_SECONDS = 0.5
+
 
 class ModelClientError(RuntimeError):
     pass
 
 
+class ModelTimeoutError(ModelClientError):
+    pass
+
+
+class ModelRateLimitedError(ModelClientError):
+    pass
+
+
+_HTTP_CLIENTS: dict[str, httpx.Client] = {}
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+def endpoint_http_client(base_url: str) -> httpx.Client:
+    """Process-wide keep-alive client per endpoint, so calls reuse open connections.
+
+    The API lifespan opens them during warmup and closes them on shutdown.
+    """
+    key = base_url.rstrip("/")
+    with _HTTP_CLIENTS_LOCK:
+        client = _HTTP_CLIENTS.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client()
+            _HTTP_CLIENTS[key] = client
+        return client
+
+
+def close_http_clients() -> None:
+    with _HTTP_CLIENTS_LOCK:
+        clients = list(_HTTP_CLIENTS.values())
+        _HTTP_CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
 class OpenAICompatibleClient:
-    def __init__(self, base_url: str, api_key: str, timeout_seconds: float = 30.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout_seconds: float = 30.0,
+        *,
+        limiter: EndpointLimiter | None = None,
+        priority: Priority = Priority.interactive,
+        rate_limit_retries: int = 2,
+        http_client: httpx.Client | None = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
+        self.http_client = http_client or endpoint_http_client(self.base_url)
         self.api_key = api_key
         self.timeout_seconds = timeout_seconds
+        self.limiter = limiter
+        self.priority = priority
+        self.rate_limit_retries = rate_limit_retries
+
+    def _send(self, path: str, payload: dict[str, Any], timeout_seconds: float) -> httpx.Response:
+        try:
+            return self.http_client.post(
+                f"{self.base_url}{path}",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                json=payload,
+                timeout=timeout_seconds,
+            )
+        except httpx.TimeoutException as exc:
+            raise ModelTimeoutError(f"Model request timed out: {exc}") from exc
+
+    def _post(
+        self, path: str, payload: dict[str, Any], timeout_seconds: float | None
+    ) -> httpx.Response:
+        timeout = timeout_seconds if timeout_seconds is not None else self.timeout_seconds
+        expires_at = time.monotonic() + timeout
+        for attempt in range(self.rate_limit_retries + 1):
+            remaining = expires_at - time.monotonic()
+            if remaining <= 0:
+                raise ModelTimeoutError("Model request timed out waiting for rate limit backoff")
+            if self.limiter is None:
+                response = self._send(path, payload, remaining)
+            else:
+                try:
+                    with self.limiter.slot(self.priority, timeout=remaining):
+                        response = self._send(
+                            path, payload, max(expires_at - time.monotonic(), 0.001)
+                        )
+                except LimiterTimeoutError as exc:
+                    raise ModelTimeoutError(str(exc)) from exc
+            if response.status_code != 429:
+                return response
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is None:
+                retry_after = RATE_LIMIT_BACKOFF_SECONDS * (2**attempt)
+            if self.limiter is not None:
+                # Every caller of this endpoint backs off, not just this request.
+                self.limiter.pause(retry_after)
+            if attempt == self.rate_limit_retries or retry_after >= expires_at - time.monotonic():
+                raise ModelRateLimitedError(
+                    f"Model endpoint rate limited: 429 (retry after {retry_after:g}s)"
+                )
+            if self.limiter is None:
+                time.sleep(retry_after)
+        raise ModelRateLimitedError("Model endpoint rate limited: 429")
 
-    def chat(self, *, model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
+    def chat(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        timeout_seconds: float | None = None,
+    ) -> str:
         payload: dict[str, Any] = {
             "model": model,
             "temperature": temperature,
@@ -26,32 +139,52 @@ class OpenAICompatibleClient:
             ],
             "response_format": {"type": "json_object"},
         }
-        response = httpx.post(
-            f"{self.base_url}/chat/completions",
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json=payload,
-            timeout=self.timeout_seconds,
-        )
+        response = self._post("/chat/completions", payload, timeout_seconds)
         if response.status_code >= 400:
             raise ModelClientError(f"Model request failed: {response.status_code} {response.text}")
         data = response.json()
         try:
             return str(data["choices"][0]["message"]["content"])
         except Exception as exc:  # noqa: BLE001
-            raise ModelClientError(f"Invalid model response shape: {json.dumps(data)[:500]}") from exc
+            raise ModelClientError(
+                f"Invalid model response shape: {json.dumps(data)[:500]}"
+            ) from exc
 
-    def embedding(self, *, model: str, text: str) -> list[float]:
+    def embedding(
+        self, *, model: str, text: str, timeout_seconds: float | None = None
+    ) -> list[float]:
         payload = {"model": model, "input": text}
-        response = httpx.post(
-            f"{self.base_url}/embeddings",
-            headers={"Authorization": f"Bearer {self.api_key}"},
-            json=payload,
-            timeout=self.timeout_seconds,
-        )
+        response = self._post("/embeddings", payload, timeout_seconds)
         if response.status_code >= 400:
-            raise ModelClientError(f"Embedding request failed: {response.status_code} {response.text}")
+            raise ModelClientError(
+                f"Embedding request failed: {response.status_code} {response.text}"
+            )
         data = response.json()
         try:
             return [float(v) for v in data["data"][0]["embedding"]]
         except Exception as exc:  # noqa: BLE001
-            raise ModelClientError(f"Invalid embeddings response shape: {json.dumps(data)[:500]}") from exc
+            raise ModelClientError(
+                f"Invalid embeddings response shape: {json.dumps(data)[:500]}"
+            ) from exc
+
+    def embeddings(
+        self, *, model: str, texts: list[str], timeout_seconds: float | None = None
+    ) -> list[list[float]]:
+        """Embed many texts in one request; vectors come back in input order."""
+        payload = {"model": model, "input": texts}
+        response = self._post("/embeddings", payload, timeout_seconds)
+        if response.status_code >= 400:
+            raise ModelClientError(
+                f"Embedding request failed: {response.status_code} {response.text}"
+            )
+        data = response.json()
+        try:
+            items = sorted(data["data"], key=lambda item: int(item["index"]))
+            vectors = [[float(v) for v in item["embedding"]] for item in items]
+        except Exception as exc:  # noqa: BLE001
+            raise ModelClientError(
+                f"Invalid embeddings response shape: {json.dumps(data)[:500]}"
+            ) from exc
+        if len(vectors) != len(texts):
+            raise ModelClientError(f"Expected {len(texts)} embeddings, got {len(vectors)}")
+        return vectors
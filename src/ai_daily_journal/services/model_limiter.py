@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+
+from ai_daily_journal.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+RPM_WINDOW_SECONDS = 60.0
+
+
+class Priority(IntEnum):
+    interactive = 0
+    background = 10
+
+
+class LimiterTimeoutError(TimeoutError):
+    pass
+
+
+class EndpointLimiter:
+    """Bulkhead for one provider endpoint.
+
+    Caps concurrent requests and requests per minute, hands free slots to the
+    highest-priority waiter first (FIFO within a priority) and honours pauses
+    requested by 429 ``Retry-After`` responses.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_in_flight: int,
+        requests_per_minute: int | None = None,
+    ) -> None:
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.requests_per_minute = requests_per_minute
+        self._cond = threading.Condition()
+        self._waiters: list[tuple[int, int, object]] = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._recent: deque[float] = deque()
+
+    def _wait_needed(self, now: float) -> float | None:
+        """Seconds until the head waiter may start; ``None`` means wait for a release."""
+        if self._in_flight >= self.max_in_flight:
+            return None
+        if self._paused_until > now:
+            return self._paused_until - now
+        if self.requests_per_minute is not None:
+            while self._recent and self._recent[0] <= now - RPM_WINDOW_SECONDS:
+                self._recent.popleft()
+            if len(self._recent) >= self.requests_per_minute:
+                return self._recent[0] + RPM_WINDOW_SECONDS - now
+        return 0.0
+
+    def acquire(
+        self,
+        priority: Priority = Priority.interactive,
+        timeout: float | None = None,
+    ) -> None:
+        started = time.monotonic()
+        token = object()
+        with self._cond:
+            heapq.heappush(self._waiters, (int(priority), next(self._seq), token))
+            self._publish()
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait: float | None = None
+                    if self._waiters[0][2] is token:
+                        wait = self._wait_needed(now)
+                        if wait == 0.0:
+                            break
+                    remaining = None if timeout is None else timeout - (now - started)
+                    if remaining is not None and remaining <= 0:
+                        raise LimiterTimeoutError(
+                            f"Timed out waiting for model endpoint capacity ({self.name})"
+                        )
+                    candidates = [value for value in (wait, remaining) if value is not None]
+                    self._cond.wait(min(candidates) if candidates else None)
+                heapq.heappop(self._waiters)
+                self._in_flight += 1
+                self._recent.append(time.monotonic())
+            except BaseException:
+                self._waiters = [item for item in self._waiters if item[2] is not token]
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise
+            finally:
+                self._publish()
+            # The next waiter may be eligible too (e.g. several free slots).
+            self._cond.notify_all()
+        metrics.observe(
+            "model_queue_wait_seconds",
+            time.monotonic() - started,
+            endpoint=self.name,
+            priority=priority.name,
+        )
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._publish()
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(
+        self,
+        priority: Priority = Priority.interactive,
+        timeout: float | None = None,
+    ) -> Iterator[None]:
+        self.acquire(priority, timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def tighten(self, max_in_flight: int, requests_per_minute: int | None) -> None:
+        """Lower the limits to the stricter of the current and the given ones."""
+        with self._cond:
+            self.max_in_flight = min(self.max_in_flight, max_in_flight)
+            if requests_per_minute is not None:
+                self.requests_per_minute = min(
+                    self.requests_per_minute or requests_per_minute, requests_per_minute
+                )
+
+    def pause(self, seconds: float) -> None:
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._cond.notify_all()
+        metrics.increment("model_rate_limited_total", endpoint=self.name)
+
+    def _publish(self) -> None:
+        metrics.set_gauge("model_queue_depth", len(self._waiters), endpoint=self.name)
+        metrics.set_gauge("model_in_flight", self._in_flight, endpoint=self.name)
+
+    def snapshot(self) -> dict[str, object]:
+        with self._cond:
+            return {
+                "max_in_flight": self.max_in_flight,
+                "requests_per_minute": self.requests_per_minute,
+                "in_flight": self._in_flight,
+                "queue_depth": len(self._waiters),
+                "paused_for_seconds": max(0.0, self._paused_until - time.monotonic()),
+            }
+
+
+_LIMITERS: dict[tuple[str, str], EndpointLimiter] = {}
+# Every (max_in_flight, requests_per_minute) a limiter was requested with, so a
+# conflict is reported once rather than each time a router is built.
+_CONFIGURED_LIMITS: dict[tuple[str, str], set[tuple[int, int | None]]] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def endpoint_limiter(
+    name: str,
+    *,
+    base_url: str,
+    api_key_env: str,
+    max_in_flight: int,
+    requests_per_minute: int | None,
+) -> EndpointLimiter:
+    """Process-wide limiter per provider endpoint and credential.
+
+    Roles pointing at the same endpoint with the same key share one limiter,
+    because that is where the provider enforces its rate limits. When they are
+    configured with different limits, the strictest ones apply to all of them.
+    """
+    key = (base_url.rstrip("/"), api_key_env)
+    limits = (max_in_flight, requests_per_minute)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = EndpointLimiter(
+                name,
+                max_in_flight=max_in_flight,
+                requests_per_minute=requests_per_minute,
+            )
+            _LIMITERS[key] = limiter
+            _CONFIGURED_LIMITS[key] = {limits}
+        elif limits not in _CONFIGURED_LIMITS[key]:
+            _CONFIGURED_LIMITS[key].add(limits)
+            limiter.tighten(max_in_flight, requests_per_minute)
+            logger.warning(
+                "model endpoint %s is shared with conflicting limits; using "
+                "max_in_flight=%s requests_per_minute=%s",
+                limiter.name,
+                limiter.max_in_flight,
+                limiter.requests_per_minute,
+            )
+        return limiter
+
+
+def limiter_snapshot() -> dict[str, dict[str, object]]:
+    with _LIMITERS_LOCK:
+        limiters = list(_LIMITERS.values())
+    return {limiter.name: limiter.snapshot() for limiter in limiters}
+
+
+def reset_limiters() -> None:
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+        _CONFIGURED_LIMITS.clear()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+import httpx
+
+from ai_daily_journal.config.loader import ConfigError, resolve_secret
+from ai_daily_journal.config.schema import RoutedRoleConfig
+from ai_daily_journal.services.model_client import ModelClientError, OpenAICompatibleClient
+from ai_daily_journal.services.model_limiter import Priority, endpoint_limiter
+
+T = TypeVar("T")
+
+EWMA_ALPHA = 0.3
+FAILURE_THRESHOLD = 3
+COOLDOWN_SECONDS = 30.0
+# Until measured, an endpoint is assumed to take this share of its request timeout.
+UNMEASURED_LATENCY_FRACTION = 0.1
+# Floor for latencies so one lucky sample cannot claim all the traffic.
+MIN_LATENCY_SECONDS = 0.001
+
+
+class EndpointHealth:
+    """Latency/error EWMAs for one endpoint, shared by every request in the process."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.ewma_latency: float | None = None
+        self.ewma_error_rate = 0.0
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self.requests = 0
+        self.failures = 0
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.consecutive_failures = 0
+            self.unhealthy_until = 0.0
+            self._update(latency, failed=False)
+
+    def record_failure(self, latency: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.failures += 1
+            self.consecutive_failures += 1
+            self._update(latency, failed=True)
+            if self.consecutive_failures >= FAILURE_THRESHOLD:
+                self.unhealthy_until = self._clock() + COOLDOWN_SECONDS
+
+    def _update(self, latency: float, *, failed: bool) -> None:
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * self.ewma_latency
+        sample = 1.0 if failed else 0.0
+        self.ewma_error_rate = EWMA_ALPHA * sample + (1 - EWMA_ALPHA) * self.ewma_error_rate
+
+    @property
+    def healthy(self) -> bool:
+        return self._clock() >= self.unhealthy_until
+
+    def score(self, weight: float, prior_latency: float) -> float:
+        """Expected cost per unit of weight; lower is better, never zero."""
+        latency = self.ewma_latency if self.ewma_latency is not None else prior_latency
+        return max(latency, MIN_LATENCY_SECONDS) * (1 + 4 * self.ewma_error_rate) / weight
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "healthy": self.healthy,
+                "ewma_latency_seconds": self.ewma_latency,
+                "ewma_error_rate": round(self.ewma_error_rate, 4),
+                "consecutive_failures": self.consecutive_failures,
+                "requests": self.requests,
+                "failures": self.failures,
+            }
+
+
+_HEALTH: dict[tuple[str, str], EndpointHealth] = {}
+_HEALTH_LOCK = threading.Lock()
+
+
+def endpoint_health(role: str, name: str) -> EndpointHealth:
+    with _HEALTH_LOCK:
+        health = _HEALTH.get((role, name))
+        if health is None:
+            health = EndpointHealth()
+            _HEALTH[(role, name)] = health
+        return health
+
+
+def routing_snapshot() -> dict[str, dict[str, dict[str, object]]]:
+    with _HEALTH_LOCK:
+        items = list(_HEALTH.items())
+    out: dict[str, dict[str, dict[str, object]]] = {}
+    for (role, name), health in items:
+        out.setdefault(role, {})[name] = health.snapshot()
+    return out
+
+
+def reset_routing_state() -> None:
+    with _HEALTH_LOCK:
+        _HEALTH.clear()
+
+
+@dataclass(slots=True)
+class RoutedEndpoint:
+    name: str
+    client: OpenAICompatibleClient
+    model_name: str
+    weight: float
+    health: EndpointHealth
+    # Assumed latency until the first measurement; build_router derives it from the timeout.
+    prior_latency: float = 30.0 * UNMEASURED_LATENCY_FRACTION
+
+    def score(self) -> float:
+        return self.health.score(self.weight, self.prior_latency)
+
+
+class ModelRouter:
+    """Spreads calls over the healthy endpoints of a role and fails over on errors.
+
+    Each call starts on an endpoint drawn with probability proportional to
+    ``weight / expected latency``, then falls back to the others, best score first.
+    """
+
+    def __init__(
+        self,
+        role: str,
+        endpoints: list[RoutedEndpoint],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        if not endpoints:
+            raise ValueError(f"No endpoints configured for {role}")
+        self.role = role
+        self.endpoints = endpoints
+        self._clock = clock
+        self._rng = rng or random.Random()
+
+    def ordered(self) -> list[RoutedEndpoint]:
+        healthy = [ep for ep in self.endpoints if ep.health.healthy]
+        cooling = [ep for ep in self.endpoints if not ep.health.healthy]
+        cooling.sort(key=lambda ep: ep.health.unhealthy_until)
+        if not healthy:
+            return cooling
+        scores = [ep.score() for ep in healthy]
+        first = self._rng.choices(range(len(healthy)), weights=[1 / score for score in scores])[0]
+        rest = sorted(
+            (index for index in range(len(healthy)) if index != first),
+            key=lambda index: scores[index],
+        )
+        return [healthy[first], *(healthy[index] for index in rest), *cooling]
+
+    def call(self, fn: Callable[[RoutedEndpoint], T]) -> T:
+        last_error: Exception | None = None
+        for endpoint in self.ordered():
+            started = self._clock()
+            try:
+                result = fn(endpoint)
+            except (ModelClientError, httpx.HTTPError) as exc:
+                endpoint.health.record_failure(self._clock() - started)
+                last_error = exc
+                continue
+            endpoint.health.record_success(self._clock() - started)
+            return result
+        assert last_error is not None
+        raise last_error
+
+
+def build_router(
+    role: str,
+    role_config: RoutedRoleConfig,
+    env: dict[str, str],
+    *,
+    model_name: str,
+    timeout_seconds: float,
+    rate_limit_retries: int = 2,
+    priority: Priority = Priority.interactive,
+) -> ModelRouter:
+    endpoints: list[RoutedEndpoint] = []
+    errors: list[str] = []
+    for endpoint in role_config.resolved_endpoints():
+        name = endpoint.name or endpoint.base_url
+        try:
+            api_key = resolve_secret(env, endpoint.api_key_env)
+        except ConfigError as exc:
+            errors.append(str(exc))
+            continue
+        endpoints.append(
+            RoutedEndpoint(
+                name=name,
+                client=OpenAICompatibleClient(
+                    base_url=endpoint.base_url,
+                    api_key=api_key,
+                    timeout_seconds=timeout_seconds,
+                    limiter=endpoint_limiter(
+                        name,
+                        base_url=endpoint.base_url,
+                        api_key_env=endpoint.api_key_env,
+                        max_in_flight=endpoint.max_in_flight or 1,
+                        requests_per_minute=endpoint.requests_per_minute,
+                    ),
+                    priority=priority,
+                    rate_limit_retries=rate_limit_retries,
+                ),
+                model_name=endpoint.model_name or model_name,
+                weight=endpoint.weight,
+                health=endpoint_health(role, name),
+                prior_latency=timeout_seconds * UNMEASURED_LATENCY_FRACTION,
+            )
+        )
+    if not endpoints:
+        raise ConfigError("; ".join(errors) or f"No endpoints configured for {role}")
+    return ModelRouter(role, endpoints)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TypeVar
+
+from anyio import to_thread
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from ai_daily_journal.config.schema import PasswordHashingConfig
+from ai_daily_journal.metrics import metrics
+
+T = TypeVar("T")
+
+# (time_cost, memory_cost_kib, parallelism, hash_len, salt_len); picklable for worker processes.
+HashParams = tuple[int, int, int, int, int]
+
+_BUILD_LOCK = threading.Lock()
+
+
+class PasswordHashBusyError(RuntimeError):
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class VerifyResult:
+    ok: bool
+    # Set when the stored hash used outdated parameters and the password was re-hashed.
+    new_hash: str | None = None
+
+
+def hash_params(config: PasswordHashingConfig) -> HashParams:
+    return (
+        config.time_cost,
+        config.memory_cost_kib,
+        config.parallelism,
+        config.hash_len,
+        config.salt_len,
+    )
+
+
+@lru_cache(maxsize=4)
+def _hasher(params: HashParams) -> PasswordHasher:
+    time_cost, memory_cost, parallelism, hash_len, salt_len = params
+    return PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        hash_len=hash_len,
+        salt_len=salt_len,
+    )
+
+
+def hash_password(params: HashParams, password: str) -> str:
+    return _hasher(params).hash(password)
+
+
+def verify_password(params: HashParams, password_hash: str, password: str) -> VerifyResult:
+    """Verify ``password`` and re-hash it in the same job if ``params`` have changed."""
+    hasher = _hasher(params)
+    try:
+        hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return VerifyResult(ok=False)
+    if hasher.check_needs_rehash(password_hash):
+        return VerifyResult(ok=True, new_hash=hasher.hash(password))
+    return VerifyResult(ok=True)
+
+
+class PasswordHashPool:
+    """Runs Argon2 jobs off the event loop with a bounded backlog.
+
+    With ``processes`` > 0 jobs go to worker processes, so a burst of logins cannot
+    starve the threadpool serving reads. At most ``max_queue`` jobs wait behind the
+    running ones; beyond that :class:`PasswordHashBusyError` is raised at once.
+    """
+
+    def __init__(self, config: PasswordHashingConfig) -> None:
+        self.params = hash_params(config)
+        self.processes = config.processes
+        self.capacity = max(config.processes, 1) + config.max_queue
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Spawned, not forked: the server process has live threads and connections.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    async def _run(self, fn: Callable[..., T], *args: object) -> T:
+        with self._lock:
+            if self._pending >= self.capacity:
+                metrics.increment("password_hash_rejected_total")
+                raise PasswordHashBusyError("Password hashing queue is full")
+            self._pending += 1
+            metrics.set_gauge("password_hash_pending", self._pending)
+        try:
+            if self.processes == 0:
+                return await to_thread.run_sync(fn, *args)
+            return await asyncio.wrap_future(self._get_executor().submit(fn, *args))
+        finally:
+            with self._lock:
+                self._pending -= 1
+                metrics.set_gauge("password_hash_pending", self._pending)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, self.params, password)
+
+    async def verify(self, password_hash: str, password: str) -> VerifyResult:
+        return await self._run(verify_password, self.params, password_hash, password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_password_pool_from_app(app) -> PasswordHashPool:  # noqa: ANN001
+    existing = getattr(app.state, "password_pool", None)
+    if existing is not None:
+        return existing
+    with _BUILD_LOCK:
+        existing = getattr(app.state, "password_pool", None)
+        if existing is not None:
+            return existing
+        cfg = app.state.config
+        if cfg is None:
+            raise RuntimeError("Configuration not loaded")
+        pool = PasswordHashPool(cfg.password_hashing)
+        app.state.password_pool = pool
+        return pool
+
+
+def shutdown_app_password_pool(app) -> None:  # noqa: ANN001
+    pool = getattr(app.state, "password_pool", None)
+    if pool is not None:
+        pool.shutdown()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import TypeVar
+
+import httpx
+from sqlalchemy import Engine
+
+from ai_daily_journal.config.schema import AppConfig
+from ai_daily_journal.db.migrations import current_migration_version, migration_head
+
+T = TypeVar("T")
+
+# A check returns an optional detail string and raises when the dependency is unhealthy.
+Check = Callable[[], str | None]
+
+# Checks run here so a hung dependency costs a worker, never the request.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="probe")
+
+
+@dataclass(slots=True)
+class ProbeResult:
+    ok: bool
+    latency_seconds: float
+    detail: str | None = None
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "ok": self.ok,
+            "latency_seconds": round(self.latency_seconds, 4),
+            "detail": self.detail,
+        }
+
+
+class ProbeCache:
+    """Keeps each probe result for ``ttl_seconds``; concurrent callers share one refresh."""
+
+    def __init__(self, ttl_seconds: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, object]] = {}
+
+    def get(self, key: str, compute: Callable[[], T]) -> T:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and self._clock() < cached[0]:
+                return cached[1]  # type: ignore[return-value]
+            value = compute()
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            return value
+
+
+def run_checks(checks: dict[str, Check], timeout_seconds: float) -> dict[str, ProbeResult]:
+    """Run checks in parallel; each one gets at most ``timeout_seconds``."""
+
+    def timed(check: Check) -> ProbeResult:
+        started = time.monotonic()
+        try:
+            detail, ok = check(), True
+        except Exception as exc:  # noqa: BLE001
+            detail, ok = str(exc), False
+        return ProbeResult(ok=ok, latency_seconds=time.monotonic() - started, detail=detail)
+
+    started = time.monotonic()
+    futures = {name: _EXECUTOR.submit(timed, check) for name, check in checks.items()}
+    results: dict[str, ProbeResult] = {}
+    for name, future in futures.items():
+        remaining = max(0.0, started + timeout_seconds - time.monotonic())
+        try:
+            results[name] = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            future.cancel()
+            results[name] = ProbeResult(False, timeout_seconds, "timed out")
+    return results
+
+
+def database_check(engine: Engine) -> Check:
+    def check() -> str | None:
+        with engine.connect() as conn:
+            conn.exec_driver_sql("SELECT 1")
+        return None
+
+    return check
+
+
+def migration_check(engine: Engine, head: str | None = None) -> Check:
+    def check() -> str | None:
+        expected = head or migration_head()
+        current = current_migration_version(engine)
+        if current != expected:
+            raise RuntimeError(f"database at {current or 'no revision'}, expected {expected}")
+        return current
+
+    return check
+
+
+def model_endpoint_check(base_url: str, timeout_seconds: float) -> Check:
+    def check() -> str | None:
+        # Any non-5xx answer (401 included) proves the endpoint is reachable.
+        response = httpx.get(f"{base_url.rstrip('/')}/models", timeout=timeout_seconds)
+        if response.status_code >= 500:
+            raise RuntimeError(f"HTTP {response.status_code}")
+        return f"HTTP {response.status_code}"
+
+    return check
+
+
+def model_endpoint_urls(config: AppConfig) -> dict[str, str]:
+    """``model:<role>:<name>`` -> base URL for every configured, enabled model endpoint."""
+    urls: dict[str, str] = {}
+    for role in ("coordinator", "editor", "embeddings"):
+        role_config = getattr(config.models, role)
+        if role == "embeddings" and not config.models.embeddings.enabled:
+            continue
+        for endpoint in role_config.resolved_endpoints():
+            name = endpoint.name or endpoint.base_url
+            urls[f"model:{role}:{name}"] = endpoint.base_url
+    return urls
+
+
+def model_endpoint_checks(config: AppConfig) -> dict[str, Check]:
+    timeout = float(config.diagnostics.readiness_timeout_seconds)
+    return {
+        name: model_endpoint_check(base_url, timeout)
+        for name, base_url in model_endpoint_urls(config).items()
+    }
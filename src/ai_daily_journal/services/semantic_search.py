@@ -8,7 +8,7 @@ from typing import Callable
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from ai_daily_journal.db.models import JournalEntry, SemanticDocument
+from ai_daily_journal.db.models import JournalEntry, SemanticDocument, utc_now
 
 
 def cosine_similarity(left: list[float], right: list[float]) -> float:
@@ -62,21 +62,61 @@ class SemanticSearchService:
         return vector
 
     def upsert_entry_embedding(self, entry_id: int, event_text_sl: str) -> None:
-        vector = self.embed(event_text_sl)
-        existing = self.db.execute(
-            select(SemanticDocument).where(SemanticDocument.entry_id == entry_id)
-        ).scalar_one_or_none()
-        if existing is None:
-            self.db.add(
-                SemanticDocument(
-                    entry_id=entry_id,
-                    embedding=vector,
-                    model_name=self.embeddings_model_name,
-                )
-            )
+        self.upsert_entry_embeddings([(entry_id, event_text_sl)])
+
+    def embed_many(self, texts: list[str]) -> dict[str, list[float]]:
+        return {text: self.embed(text) for text in dict.fromkeys(texts)}
+
+    def upsert_entry_embeddings(
+        self,
+        entries: list[tuple[int, str]],
+        vectors: dict[str, list[float]] | None = None,
+    ) -> None:
+        """Embed and store many entries with one INSERT .. ON CONFLICT (entry_id) DO UPDATE.
+
+        ``vectors`` holds embeddings computed ahead of time, keyed by text.
+        """
+        if not entries:
+            return
+        vectors = vectors or {}
+        rows = [
+            {
+                "entry_id": entry_id,
+                "embedding": vectors[text] if text in vectors else self.embed(text),
+                "model_name": self.embeddings_model_name,
+                "created_at": utc_now(),
+            }
+            for entry_id, text in entries
+        ]
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
         else:
-            existing.embedding = vector
-            existing.model_name = self.embeddings_model_name
+            self._upsert_rows_individually(rows)
+            return
+        statement = dialect_insert(SemanticDocument).values(rows)
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[SemanticDocument.entry_id],
+                set_={
+                    "embedding": statement.excluded.embedding,
+                    "model_name": statement.excluded.model_name,
+                },
+            )
+        )
+
+    def _upsert_rows_individually(self, rows: list[dict]) -> None:
+        for row in rows:
+            existing = self.db.execute(
+                select(SemanticDocument).where(SemanticDocument.entry_id == row["entry_id"])
+            ).scalar_one_or_none()
+            if existing is None:
+                self.db.add(SemanticDocument(**row))
+            else:
+                existing.embedding = row["embedding"]
+                existing.model_name = row["model_name"]
 
     def search_same_day_candidates(
         self,
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True, frozen=True)
+class CachedSession:
+    user_id: int
+    timezone: str
+    expires_at: datetime
+
+
+class SessionTokenCache:
+    """Bounded LRU of token hash -> session, each entry trusted for ``ttl_seconds``.
+
+    Logouts in other workers arrive through :meth:`apply_revocations`, fed from the
+    ``session_revocations`` table at most every ``poll_seconds``; the TTL bounds how
+    stale an entry can get if a poll is missed. Revoked hashes are also remembered for
+    ``revoked_ttl_seconds`` so signed tokens, which need no lookup, can be refused.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        poll_seconds: float,
+        revoked_ttl_seconds: float = 86_400,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.poll_seconds = poll_seconds
+        self.revoked_ttl_seconds = revoked_ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, CachedSession]] = OrderedDict()
+        # Revoked token hash -> clock reading after which it can be forgotten.
+        self._revoked: dict[str, float] = {}
+        self._next_poll = 0.0
+        # None until the first poll establishes where the revocation log stands.
+        self.revocation_cursor: int | None = None
+
+    def get(self, token_hash: str) -> CachedSession | None:
+        with self._lock:
+            cached = self._entries.get(token_hash)
+            if cached is None:
+                return None
+            fresh_until, session = cached
+            if self._clock() >= fresh_until or session.expires_at <= datetime.now(UTC):
+                del self._entries[token_hash]
+                return None
+            self._entries.move_to_end(token_hash)
+            return session
+
+    def put(self, token_hash: str, session: CachedSession) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[token_hash] = (self._clock() + self.ttl_seconds, session)
+            self._entries.move_to_end(token_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def revoke(self, token_hash: str) -> None:
+        """Revoke locally without waiting for the next poll."""
+        with self._lock:
+            self._entries.pop(token_hash, None)
+            self._revoked[token_hash] = self._clock() + self.revoked_ttl_seconds
+
+    def revocations_due(self) -> bool:
+        with self._lock:
+            return self._clock() >= self._next_poll
+
+    def is_revoked(self, token_hash: str) -> bool:
+        with self._lock:
+            forget_at = self._revoked.get(token_hash)
+            return forget_at is not None and forget_at > self._clock()
+
+    def apply_revocations(self, token_hashes: Iterable[str], cursor: int) -> None:
+        """Evict revoked tokens; ``cursor`` is the last revocation id seen."""
+        with self._lock:
+            now = self._clock()
+            self._revoked = {
+                token_hash: forget_at
+                for token_hash, forget_at in self._revoked.items()
+                if forget_at > now
+            }
+            for token_hash in token_hashes:
+                self._entries.pop(token_hash, None)
+                self._revoked[token_hash] = now + self.revoked_ttl_seconds
+            self.revocation_cursor = cursor
+            self._next_poll = now + self.poll_seconds
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def get_session_cache_from_app(app) -> SessionTokenCache:  # noqa: ANN001
+    existing = getattr(app.state, "session_cache", None)
+    if existing is not None:
+        return existing
+    cfg = app.state.config
+    if cfg is None:
+        raise RuntimeError("Configuration not loaded")
+    cache = SessionTokenCache(
+        ttl_seconds=cfg.api_ui.session_cache_ttl_seconds,
+        max_entries=cfg.api_ui.session_cache_max_entries,
+        poll_seconds=cfg.api_ui.session_revocation_poll_seconds,
+        revoked_ttl_seconds=cfg.api_ui.session_ttl_seconds,
+    )
+    # Two racing first requests may each build one; the loser's cache is simply dropped.
+    app.state.session_cache = cache
+    return cache
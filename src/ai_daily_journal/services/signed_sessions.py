@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from ai_daily_journal.config import resolve_secret
+from ai_daily_journal.db.session import load_app_env
+from ai_daily_journal.services.session_cache import CachedSession
+
+TOKEN_VERSION = "v1"
+MIN_SECRET_BYTES = 32
+
+
+class SigningKeyError(ValueError):
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class SigningKey:
+    key_id: str
+    secret: bytes
+
+
+def parse_signing_keys(value: str) -> list[SigningKey]:
+    """Parse ``"kid:secret,kid2:secret2"``; the first key signs, all of them verify."""
+    keys: list[SigningKey] = []
+    for item in value.split(","):
+        key_id, sep, secret = item.strip().partition(":")
+        if not sep or not key_id or "." in key_id:
+            raise SigningKeyError("Session signing keys must look like 'key_id:secret'")
+        if len(secret.encode("utf-8")) < MIN_SECRET_BYTES:
+            raise SigningKeyError(f"Session signing key '{key_id}' is shorter than 32 bytes")
+        keys.append(SigningKey(key_id, secret.encode("utf-8")))
+    if len({key.key_id for key in keys}) != len(keys):
+        raise SigningKeyError("Session signing key ids must be unique")
+    return keys
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+class SignedSessionCodec:
+    """Compact HMAC-SHA256 session tokens: ``v1.<key_id>.<claims>.<signature>``.
+
+    Claims carry the user id, timezone and expiry, so validating a token needs no
+    I/O. Rotate by prepending a new key and dropping the old one after one
+    session TTL.
+    """
+
+    def __init__(self, keys: list[SigningKey]) -> None:
+        if not keys:
+            raise SigningKeyError("At least one session signing key is required")
+        self._active = keys[0]
+        self._keys = {key.key_id: key.secret for key in keys}
+
+    def _sign(self, secret: bytes, signed_part: str) -> str:
+        return _b64encode(hmac.new(secret, signed_part.encode("ascii"), hashlib.sha256).digest())
+
+    def issue(self, user_id: int, timezone_name: str, expires_at: datetime) -> str:
+        claims = {
+            "u": user_id,
+            "tz": timezone_name,
+            "exp": int(expires_at.timestamp()),
+            # Distinguishes two logins in the same second so each can be revoked alone.
+            "n": secrets.token_urlsafe(6),
+        }
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+        signed_part = f"{TOKEN_VERSION}.{self._active.key_id}.{payload}"
+        return f"{signed_part}.{self._sign(self._active.secret, signed_part)}"
+
+    def verify(self, token: str) -> CachedSession | None:
+        parts = token.split(".")
+        if len(parts) != 4 or parts[0] != TOKEN_VERSION:
+            return None
+        _, key_id, payload, signature = parts
+        secret = self._keys.get(key_id)
+        if secret is None:
+            return None
+        expected = self._sign(secret, f"{TOKEN_VERSION}.{key_id}.{payload}")
+        if not hmac.compare_digest(expected, signature):
+            return None
+        try:
+            claims = json.loads(_b64decode(payload))
+            expires_at = datetime.fromtimestamp(int(claims["exp"]), tz=UTC)
+            session = CachedSession(
+                user_id=int(claims["u"]), timezone=str(claims["tz"]), expires_at=expires_at
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
+        if expires_at <= datetime.now(UTC):
+            return None
+        return session
+
+
+def get_session_codec_from_app(app) -> SignedSessionCodec | None:  # noqa: ANN001
+    """The app's token codec in ``signed`` session mode, else None (database sessions)."""
+    cfg = app.state.config
+    if cfg is None or cfg.api_ui.session_mode != "signed":
+        return None
+    existing = getattr(app.state, "session_codec", None)
+    if existing is not None:
+        return existing
+    value = resolve_secret(load_app_env(app), cfg.api_ui.session_signing_keys_env)
+    codec = SignedSessionCodec(parse_signing_keys(value))
+    app.state.session_codec = codec
+    return codec
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date
+
+import httpx
+from anyio import to_thread
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import configure_mappers
+
+from ai_daily_journal.config.schema import AppConfig
+from ai_daily_journal.db.session import AsyncSessionFactory, SessionFactory
+from ai_daily_journal.services.auth import hot_auth_statements
+from ai_daily_journal.services.journal_read import AsyncJournalReadService, JournalReadService
+from ai_daily_journal.services.model_client import endpoint_http_client
+from ai_daily_journal.services.readiness import model_endpoint_urls
+
+logger = logging.getLogger(__name__)
+
+# Never matches a real row; the hot statements only need to be compiled and executed once.
+_NO_USER = -1
+_PROBE_DAY = date(2000, 1, 1)
+
+
+def _pool_size(engine: Engine | AsyncEngine) -> int:
+    size = getattr(engine.pool, "size", None)
+    return size() if callable(size) else 0
+
+
+def prewarm_pool(engine: Engine) -> int:
+    """Check out ``pool_size`` connections at once so they all get opened, then return them."""
+    connections = [engine.connect() for _ in range(_pool_size(engine))]
+    for connection in connections:
+        connection.close()
+    return len(connections)
+
+
+async def prewarm_async_pool(engine: AsyncEngine) -> int:
+    connections = [await engine.connect() for _ in range(_pool_size(engine))]
+    for connection in connections:
+        await connection.close()
+    return len(connections)
+
+
+def run_hot_statements(session_factory: SessionFactory) -> None:
+    with session_factory() as db:
+        reader = JournalReadService(db)
+        reader.journal_version(_NO_USER)
+        reader.tree(_NO_USER)
+        reader.latest_day(_NO_USER)
+        reader.month_days(_NO_USER, _PROBE_DAY.year, _PROBE_DAY.month)
+        reader.day_range(_NO_USER, _PROBE_DAY, _PROBE_DAY)
+        reader.get_day(_NO_USER, _PROBE_DAY.isoformat())
+        for statement in hot_auth_statements():
+            db.execute(statement).all()
+
+
+async def run_async_hot_statements(session_factory: AsyncSessionFactory) -> None:
+    async with session_factory() as db:
+        reader = AsyncJournalReadService(db)
+        await reader.journal_version(_NO_USER)
+        await reader.tree(_NO_USER)
+        await reader.latest_day(_NO_USER)
+        await reader.month_days(_NO_USER, _PROBE_DAY.year, _PROBE_DAY.month)
+        await reader.day_range(_NO_USER, _PROBE_DAY, _PROBE_DAY)
+        await reader.get_day(_NO_USER, _PROBE_DAY.isoformat())
+        for statement in hot_auth_statements():
+            (await db.execute(statement)).all()
+
+
+def open_model_endpoints(config: AppConfig) -> int:
+    """Open a connection on each endpoint's shared client so the first model call reuses it."""
+    timeout = float(config.diagnostics.readiness_timeout_seconds)
+    opened = 0
+    for name, base_url in model_endpoint_urls(config).items():
+        try:
+            endpoint_http_client(base_url).get(f"{base_url.rstrip('/')}/models", timeout=timeout)
+        except httpx.HTTPError as exc:
+            logger.warning("warmup: model endpoint %s unreachable: %s", name, exc)
+            continue
+        opened += 1
+    return opened
+
+
+async def warm_up(
+    config: AppConfig,
+    *,
+    engine: Engine,
+    session_factory: SessionFactory,
+    async_engine: AsyncEngine | None,
+    async_session_factory: AsyncSessionFactory,
+) -> dict[str, dict[str, object]]:
+    """Run the configured warmup steps; a failing step is logged and reported, not raised."""
+    steps: list[tuple[str, Callable[[], Awaitable[object]]]] = [
+        ("mappers", lambda: to_thread.run_sync(configure_mappers)),
+    ]
+    if config.warmup.prewarm_pool:
+        steps.append(("db_pool", lambda: to_thread.run_sync(prewarm_pool, engine)))
+        if async_engine is not None:
+            steps.append(("async_db_pool", lambda: prewarm_async_pool(async_engine)))
+    if config.warmup.hot_statements:
+        steps.append(
+            ("hot_statements", lambda: to_thread.run_sync(run_hot_statements, session_factory))
+        )
+        steps.append(
+            ("async_hot_statements", lambda: run_async_hot_statements(async_session_factory))
+        )
+    if config.warmup.model_endpoints:
+        steps.append(("model_endpoints", lambda: to_thread.run_sync(open_model_endpoints, config)))
+
+    report: dict[str, dict[str, object]] = {}
+    for name, step in steps:
+        started = time.monotonic()
+        try:
+            result = await step()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("warmup: %s failed: %s", name, exc)
+            report[name] = {"ok": False, "error": str(exc)}
+            continue
+        report[name] = {"ok": True, "seconds": round(time.monotonic() - started, 4)}
+        if isinstance(result, int):
+            report[name]["count"] = result
+    return report
@@ -5,7 +5,7 @@ from datetime import date as date_cls, datetime, timezone
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from ai_daily_journal.config.loader import load_secrets, resolve_secret
+from ai_daily_journal.config.loader import load_secrets
 from ai_daily_journal.config.schema import AppConfig
 from ai_daily_journal.db.models import (
     JournalDay,
@@ -17,19 +17,43 @@ from ai_daily_journal.db.models import (
     WriteOperation,
     WriteSession,
 )
-from ai_daily_journal.schemas.coordinator import Action
-from ai_daily_journal.services.coordinator import CoordinatorContext, CoordinatorService
+from ai_daily_journal.metrics import metrics
+from ai_daily_journal.schemas.coordinator import Action, CoordinatorDecision
+from ai_daily_journal.services.coordinator import (
+    CoordinatorContext,
+    CoordinatorResult,
+    CoordinatorService,
+)
 from ai_daily_journal.services.day_content import parse_day_edit_text, render_day_text
+from ai_daily_journal.services.day_materialization import active_entries_query
 from ai_daily_journal.services.date_resolution import resolve_target_date
+from ai_daily_journal.services.deadline import Deadline, DeadlineExceededError
+from ai_daily_journal.services.decision_engine import DecisionEngine, record_decision
 from ai_daily_journal.services.diffing import generate_unified_diff
 from ai_daily_journal.services.editor import EditorContext, EditorService
+from ai_daily_journal.services.fused import FUSED_SYSTEM_PROMPT, fused_responders
 from ai_daily_journal.services.history_hygiene import sanitize_model_text
-from ai_daily_journal.services.model_client import OpenAICompatibleClient
-from ai_daily_journal.services.semantic_search import SemanticSearchService, semantic_relation
+from ai_daily_journal.services.model_client import ModelTimeoutError
+from ai_daily_journal.services.model_router import build_router
+from ai_daily_journal.services.semantic_search import (
+    SemanticCandidate,
+    SemanticSearchService,
+    semantic_relation,
+)
 from ai_daily_journal.services.write_transaction import WriteTransactionService
 from ai_daily_journal.paths import default_env_path
 
 
+def _coordinator_user_prompt(ctx: CoordinatorContext) -> str:
+    return (
+        f"resolved_date_hint={ctx.resolved_date.isoformat()}\n"
+        f"user_text={ctx.user_text}\n"
+        f"candidate_entry_ids={ctx.candidate_entry_ids}\n"
+        f"top_similarity={ctx.top_similarity}\n"
+        f"existing_entries_count={ctx.existing_entries_count}"
+    )
+
+
 class JournalWriteService:
     def __init__(self, db: Session, config: AppConfig | None) -> None:
         if config is None:
@@ -38,32 +62,47 @@ class JournalWriteService:
         self.config = config
         env = load_secrets(default_env_path())
         self.model_warnings: list[str] = []
+        self._deadline: Deadline | None = None
 
         coordinator_responder = None
         try:
-            coordinator_client = OpenAICompatibleClient(
-                base_url=config.models.coordinator.base_url,
-                api_key=resolve_secret(env, config.models.coordinator.api_key_env),
+            coordinator_router = build_router(
+                "coordinator",
+                config.models.coordinator,
+                env,
+                model_name=config.models.coordinator.model_name,
+                timeout_seconds=config.models.request_timeout_seconds,
+                rate_limit_retries=config.models.rate_limit_retries,
             )
 
             def coordinator_responder(ctx: CoordinatorContext) -> str:
-                user_prompt = (
-                    f"resolved_date_hint={ctx.resolved_date.isoformat()}\n"
-                    f"user_text={ctx.user_text}\n"
-                    f"candidate_entry_ids={ctx.candidate_entry_ids}\n"
-                    f"top_similarity={ctx.top_similarity}\n"
-                    f"existing_entries_count={ctx.existing_entries_count}"
+                return coordinator_router.call(
+                    lambda endpoint: endpoint.client.chat(
+                        model=endpoint.model_name,
+                        system_prompt=(
+                            "You are coordinator for AI Daily Journal. "
+                            "Return strict JSON only with keys: "
+                            "resolved_date (YYYY-MM-DD), action (noop|append|update|create), "
+                            "candidate_entry_ids (array of ints), reason (Slovenian)."
+                        ),
+                        user_prompt=_coordinator_user_prompt(ctx),
+                        temperature=config.models.coordinator.temperature,
+                        timeout_seconds=self._model_timeout(),
+                    )
                 )
-                return coordinator_client.chat(
-                    model=config.models.coordinator.model_name,
-                    system_prompt=(
-                        "You are coordinator for AI Daily Journal. "
-                        "Return strict JSON only with keys: "
-                        "resolved_date (YYYY-MM-DD), action (noop|append|update|create), "
-                        "candidate_entry_ids (array of ints), reason (Slovenian)."
-                    ),
-                    user_prompt=user_prompt,
-                    temperature=config.models.coordinator.temperature,
+
+            def fused_call(ctx: CoordinatorContext) -> str:
+                return coordinator_router.call(
+                    lambda endpoint: endpoint.client.chat(
+                        model=endpoint.model_name,
+                        system_prompt=FUSED_SYSTEM_PROMPT,
+                        user_prompt=(
+                            f"{_coordinator_user_prompt(ctx)}\n"
+                            f"instruction={ctx.instruction or ''}"
+                        ),
+                        temperature=config.models.coordinator.temperature,
+                        timeout_seconds=self._model_timeout(),
+                    )
                 )
         except Exception as exc:  # noqa: BLE001
             self.model_warnings.append(
@@ -72,9 +111,13 @@ class JournalWriteService:
 
         editor_responder = None
         try:
-            editor_client = OpenAICompatibleClient(
-                base_url=config.models.editor.base_url,
-                api_key=resolve_secret(env, config.models.editor.api_key_env),
+            editor_router = build_router(
+                "editor",
+                config.models.editor,
+                env,
+                model_name=config.models.editor.model_name,
+                timeout_seconds=config.models.request_timeout_seconds,
+                rate_limit_retries=config.models.rate_limit_retries,
             )
 
             def editor_responder(source_text: str, instruction: str | None) -> str:
@@ -83,14 +126,17 @@ class JournalWriteService:
                     f"instruction={instruction or ''}\n"
                     "Return one polished Slovenian event sentence."
                 )
-                raw = editor_client.chat(
-                    model=config.models.editor.model_name,
-                    system_prompt=(
-                        "Polish daily journal event in Slovenian. "
-                        "Do not invent facts. Return JSON: {\"event_text_sl\":\"...\"}."
-                    ),
-                    user_prompt=user_prompt,
-                    temperature=config.models.editor.temperature,
+                raw = editor_router.call(
+                    lambda endpoint: endpoint.client.chat(
+                        model=endpoint.model_name,
+                        system_prompt=(
+                            "Polish daily journal event in Slovenian. "
+                            "Do not invent facts. Return JSON: {\"event_text_sl\":\"...\"}."
+                        ),
+                        user_prompt=user_prompt,
+                        temperature=config.models.editor.temperature,
+                        timeout_seconds=self._model_timeout(),
+                    )
                 )
                 import json
 
@@ -101,26 +147,39 @@ class JournalWriteService:
         embeddings_embedder = None
         if config.models.embeddings.enabled:
             try:
-                embeddings_client = OpenAICompatibleClient(
-                    base_url=config.models.embeddings.base_url,
-                    api_key=resolve_secret(env, config.models.embeddings.api_key_env),
+                embeddings_router = build_router(
+                    "embeddings",
+                    config.models.embeddings,
+                    env,
+                    model_name=config.models.embeddings.model_name,
+                    timeout_seconds=config.models.request_timeout_seconds,
+                    rate_limit_retries=config.models.rate_limit_retries,
                 )
 
                 def embeddings_embedder(text: str) -> list[float]:
-                    return embeddings_client.embedding(
-                        model=config.models.embeddings.model_name,
-                        text=text,
+                    return embeddings_router.call(
+                        lambda endpoint: endpoint.client.embedding(
+                            model=endpoint.model_name,
+                            text=text,
+                            timeout_seconds=self._model_timeout(),
+                        )
                     )
             except Exception as exc:  # noqa: BLE001
                 self.model_warnings.append(
                     f"Embeddings model unavailable, deterministic fallback active: {exc}"
                 )
 
+        if config.models.fused and coordinator_responder is not None:
+            coordinator_responder, editor_responder = fused_responders(
+                fused_call, editor_responder
+            )
+
         self.coordinator = CoordinatorService(
             max_retries=config.models.coordinator.max_retries,
             responder=coordinator_responder,
             allow_fallback=True,
         )
+        self.decision_engine = DecisionEngine(config.decision)
         self.editor = EditorService(responder=editor_responder)
         self.semantic = SemanticSearchService(
             db,
@@ -132,8 +191,15 @@ class JournalWriteService:
             db,
             embeddings_model_name=config.models.embeddings.model_name,
             embeddings_dimensions=config.models.embeddings.dimensions,
+            embedder=embeddings_embedder,
         )
 
+    def _model_timeout(self) -> float:
+        cap = self.config.models.request_timeout_seconds
+        if self._deadline is None:
+            return cap
+        return self._deadline.timeout(cap)
+
     def propose(
         self,
         *,
@@ -141,6 +207,29 @@ class JournalWriteService:
         source_text: str,
         session_id: int | None,
         instruction: str | None,
+    ) -> dict[str, object]:
+        deadline = Deadline(self.config.models.propose_deadline_seconds)
+        self._deadline = deadline
+        try:
+            return self._propose(
+                user_id=user_id,
+                source_text=source_text,
+                session_id=session_id,
+                instruction=instruction,
+                deadline=deadline,
+            )
+        finally:
+            self._deadline = None
+            metrics.observe("propose_seconds", deadline.elapsed())
+
+    def _propose(
+        self,
+        *,
+        user_id: int,
+        source_text: str,
+        session_id: int | None,
+        instruction: str | None,
+        deadline: Deadline,
     ) -> dict[str, object]:
         sanitized_text = sanitize_model_text(source_text)
         sanitized_instruction = sanitize_model_text(instruction) if instruction else None
@@ -172,36 +261,58 @@ class JournalWriteService:
         ).scalar_one_or_none()
         active_entries: list[JournalEntry] = []
         if day is not None:
-            active_entries = list(
-                self.db.execute(
-                    select(JournalEntry)
-                    .where(
-                        JournalEntry.day_id == day.id,
-                        JournalEntry.superseded_by_entry_id.is_(None),
-                    )
-                    .order_by(JournalEntry.sequence_no.asc())
-                ).scalars()
-            )
+            active_entries = list(self.db.execute(active_entries_query(day.id)).scalars())
 
-        semantic_candidates = (
-            self.semantic.search_same_day_candidates(
-                day.id,
-                sanitized_text,
-                limit=self.config.decision.candidate_limit,
-            )
-            if day is not None
-            else []
-        )
+        budget_warnings: list[str] = []
+        semantic_candidates: list[SemanticCandidate] = []
+        if day is not None:
+            try:
+                semantic_candidates = self.semantic.search_same_day_candidates(
+                    day.id,
+                    sanitized_text,
+                    limit=self.config.decision.candidate_limit,
+                )
+            except (DeadlineExceededError, ModelTimeoutError):
+                if not deadline.expired:
+                    raise
+                metrics.increment("propose_deadline_exceeded_total", stage="embedding")
+                budget_warnings.append(
+                    "Propose latency budget exhausted while embedding the entry; "
+                    "semantic candidates were skipped."
+                )
         top_similarity = semantic_candidates[0].similarity if semantic_candidates else 0.0
-        coordinator_result = self.coordinator.decide(
-            CoordinatorContext(
-                resolved_date=resolved,
-                user_text=sanitized_text,
-                candidate_entry_ids=[candidate.entry_id for candidate in semantic_candidates],
-                top_similarity=top_similarity,
-                existing_entries_count=len(active_entries),
-            )
+        candidate_entry_ids = [candidate.entry_id for candidate in semantic_candidates]
+        rule = self.decision_engine.settle(
+            top_similarity=top_similarity,
+            existing_entries_count=len(active_entries),
+            has_candidates=bool(candidate_entry_ids),
         )
+        if rule is None:
+            decision_source = "model"
+            coordinator_result = self.coordinator.decide(
+                CoordinatorContext(
+                    resolved_date=resolved,
+                    user_text=sanitized_text,
+                    candidate_entry_ids=candidate_entry_ids,
+                    top_similarity=top_similarity,
+                    existing_entries_count=len(active_entries),
+                    instruction=sanitized_instruction,
+                    deadline=deadline,
+                )
+            )
+        else:
+            decision_source = "rule"
+            coordinator_result = CoordinatorResult(
+                decision=CoordinatorDecision(
+                    resolved_date=resolved,
+                    action=rule.action,
+                    candidate_entry_ids=candidate_entry_ids,
+                    reason=rule.reason,
+                ),
+                warnings=[],
+                attempts=0,
+            )
+        record_decision(decision_source, rule.rule if rule else None, top_similarity)
         decision = coordinator_result.decision
         relation = semantic_relation(
             top_similarity,
@@ -236,8 +347,11 @@ class JournalWriteService:
                 instruction=sanitized_instruction,
                 existing_entries=existing_entries,
                 candidate_entry_ids=decision.candidate_entry_ids,
+                deadline=deadline,
             )
         )
+        if deadline.expired:
+            metrics.increment("propose_deadline_exceeded_total", stage="models")
         proposed_entries = editor_result.entries
 
         current_day_text = render_day_text(resolved, [entry.event_text_sl for entry in active_entries])
@@ -257,6 +371,9 @@ class JournalWriteService:
                 "effective_action": effective_action.value,
                 "semantic_relation": relation,
                 "reason": decision_reason,
+                "decision_source": decision_source,
+                "decision_rule": rule.rule if rule else None,
+                "base_version": day.version if day is not None else 0,
             },
             proposed_entries_json=proposed_entries,
             diff_text=diff_text,
@@ -274,13 +391,19 @@ class JournalWriteService:
             "reason": decision_reason,
             "candidate_entry_ids": decision.candidate_entry_ids,
             "semantic_relation": relation,
+            "decision_source": decision_source,
             "semantic_candidates": [
                 {"entry_id": c.entry_id, "similarity": c.similarity, "event_text_sl": c.event_text_sl}
                 for c in semantic_candidates
             ],
             "proposed_entries": proposed_entries,
             "diff_text": diff_text,
-            "warnings": self.model_warnings + coordinator_result.warnings + editor_result.warnings,
+            "warnings": (
+                self.model_warnings
+                + budget_warnings
+                + coordinator_result.warnings
+                + editor_result.warnings
+            ),
         }
 
     def propose_day_edit(
@@ -320,16 +443,7 @@ class JournalWriteService:
         ).scalar_one_or_none()
         active_entries: list[JournalEntry] = []
         if day is not None:
-            active_entries = list(
-                self.db.execute(
-                    select(JournalEntry)
-                    .where(
-                        JournalEntry.day_id == day.id,
-                        JournalEntry.superseded_by_entry_id.is_(None),
-                    )
-                    .order_by(JournalEntry.sequence_no.asc())
-                ).scalars()
-            )
+            active_entries = list(self.db.execute(active_entries_query(day.id)).scalars())
 
         sanitized = sanitize_model_text(edited_content)
         proposed_events = parse_day_edit_text(sanitized)
@@ -370,6 +484,7 @@ class JournalWriteService:
                 "reason": reason,
                 "manual_edit": True,
                 "replace_all": True,
+                "base_version": day.version if day is not None else 0,
             },
             proposed_entries_json=proposed_entries,
             diff_text=diff_text,
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import hashlib
-from datetime import datetime, timezone
+import json
+import zlib
+from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import Select, case, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ai_daily_journal.db.models import (
+    DayChangeKind,
     IdempotencyKey,
     JournalDay,
     JournalEntry,
@@ -15,14 +19,46 @@ from ai_daily_journal.db.models import (
     WriteOperation,
     WriteSession,
 )
-from ai_daily_journal.services.day_content import render_day_text
-from ai_daily_journal.services.semantic_search import SemanticSearchService
+from ai_daily_journal.metrics import metrics
+from ai_daily_journal.services.day_lock import locked_day
+from ai_daily_journal.services.day_materialization import (
+    day_content,
+    materialize_day,
+    touch_journal,
+)
+from ai_daily_journal.services.journal_changes import record_day_change
+from ai_daily_journal.services.semantic_search import Embedder, SemanticSearchService
+
+# A unique violation from a concurrent confirm is retried this many times in total.
+CONFIRM_ATTEMPTS = 3
 
 
 def _hash_text(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
+def latest_operation_query(session_id: int) -> Select[tuple[WriteOperation]]:
+    """Served by ``ix_write_operations_session_id_id`` without a sort."""
+    return (
+        select(WriteOperation)
+        .where(WriteOperation.session_id == session_id)
+        .order_by(WriteOperation.id.desc())
+        .limit(1)
+    )
+
+
+def pack_response(response: dict[str, object]) -> bytes:
+    return zlib.compress(json.dumps(response, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def unpack_response(snapshot: bytes) -> dict[str, object]:
+    return json.loads(zlib.decompress(snapshot))
+
+
+class StaleProposalError(ValueError):
+    """The day changed after a proposal that cannot be rebased onto it."""
+
+
 class WriteTransactionService:
     def __init__(
         self,
@@ -30,12 +66,146 @@ class WriteTransactionService:
         *,
         embeddings_model_name: str,
         embeddings_dimensions: int,
+        embedder: Embedder | None = None,
     ) -> None:
         self.db = db
         self.semantic = SemanticSearchService(
             db,
             embeddings_model_name=embeddings_model_name,
             dimensions=embeddings_dimensions,
+            embedder=embedder,
+        )
+
+    def _planned_rows(
+        self, day: JournalDay, operation: WriteOperation
+    ) -> list[tuple[int, dict[str, object], int | None]]:
+        """``(sequence_no, proposed, replaced_entry_id)`` for every entry to write.
+
+        When the day moved on since the proposal (its version no longer matches
+        ``base_version``), the operation is rebased onto the current entries:
+        new events are appended after the last active one, updates land on their
+        target if it is still active, and entries carried over unchanged from the
+        stale snapshot are left alone. An update whose target was replaced, or a
+        manual edit (which replaces the whole day), cannot be rebased and raises
+        :class:`StaleProposalError` instead.
+        """
+        active = self.db.execute(
+            select(JournalEntry.id, JournalEntry.sequence_no, JournalEntry.event_text_sl).where(
+                JournalEntry.day_id == day.id,
+                JournalEntry.superseded_by_entry_id.is_(None),
+            )
+        ).all()
+        base_version = operation.decision_json.get("base_version")
+        up_to_date = base_version is None or base_version == (day.version or 0)
+        if operation.decision_json.get("replace_all", False):
+            if not up_to_date:
+                raise StaleProposalError(
+                    "Day changed since this edit was proposed; reload it and edit again"
+                )
+            kept = {int(proposed["sequence_no"]) for proposed in operation.proposed_entries_json}
+            removed = [row.id for row in active if row.sequence_no not in kept]
+            if removed:
+                # Self-superseded: gone from the day, kept as history.
+                self.db.execute(
+                    update(JournalEntry)
+                    .where(JournalEntry.id.in_(removed))
+                    .values(superseded_by_entry_id=JournalEntry.id)
+                    .execution_options(synchronize_session=False)
+                )
+
+        planned: list[tuple[int, dict[str, object], int | None]] = []
+        if up_to_date:
+            active_by_sequence = {row.sequence_no: (row.id, row.event_text_sl) for row in active}
+            for proposed in operation.proposed_entries_json:
+                seq = int(proposed["sequence_no"])
+                existing = active_by_sequence.get(seq)
+                if existing is not None and existing[1] == str(proposed["event_text_sl"]).strip():
+                    continue
+                planned.append((seq, proposed, existing[0] if existing is not None else None))
+            return planned
+
+        metrics.increment("confirm_rebase_total")
+        active_by_id = {row.id: (row.sequence_no, row.event_text_sl) for row in active}
+        next_seq = max((row.sequence_no for row in active), default=0) + 1
+        for proposed in operation.proposed_entries_json:
+            entry_id = proposed.get("id")
+            current = active_by_id.get(entry_id) if entry_id is not None else None
+            if current is not None:
+                if current[1] != str(proposed["event_text_sl"]).strip():
+                    planned.append((current[0], proposed, entry_id))
+            elif entry_id is None:
+                planned.append((next_seq, proposed, None))
+                next_seq += 1
+            elif proposed.get("updated_from_entry_id") == entry_id:
+                # Appending it would leave both versions of the event on the day.
+                raise StaleProposalError(
+                    "An entry this proposal updates was changed meanwhile; propose it again"
+                )
+        return planned
+
+    def _apply_entries(
+        self,
+        day: JournalDay,
+        operation: WriteOperation,
+        vectors: dict[str, list[float]],
+    ) -> None:
+        """Apply the proposed entries with a fixed number of statements.
+
+        The change set is computed in Python first; then rows being replaced are
+        parked (self-superseded) so the active-sequence index admits their
+        replacements, all new rows go in one multi-row INSERT .. RETURNING, one
+        CASE UPDATE links the supersede chain, and embeddings are upserted in one
+        statement.
+        """
+        new_rows: list[dict[str, object]] = []
+        for seq, proposed, replaced_id in self._planned_rows(day, operation):
+            text = str(proposed["event_text_sl"]).strip()
+            new_rows.append(
+                {
+                    "day_id": day.id,
+                    "sequence_no": seq,
+                    "event_text_sl": text,
+                    "source_user_text": str(proposed.get("source_user_text", "")),
+                    "event_hash": _hash_text(text),
+                    "updated_from_entry_id": replaced_id,
+                }
+            )
+        if not new_rows:
+            return
+
+        replaced_ids = [
+            row["updated_from_entry_id"]
+            for row in new_rows
+            if row["updated_from_entry_id"] is not None
+        ]
+        if replaced_ids:
+            self.db.execute(
+                update(JournalEntry)
+                .where(JournalEntry.id.in_(replaced_ids))
+                .values(superseded_by_entry_id=JournalEntry.id)
+                .execution_options(synchronize_session=False)
+            )
+        # Planned sequence numbers are unique, so they identify the returned ids.
+        result = self.db.execute(
+            insert(JournalEntry).returning(JournalEntry.sequence_no, JournalEntry.id),
+            new_rows,
+        )
+        inserted = {sequence_no: entry_id for sequence_no, entry_id in result}
+        links = {
+            row["updated_from_entry_id"]: inserted[row["sequence_no"]]
+            for row in new_rows
+            if row["updated_from_entry_id"] is not None
+        }
+        if links:
+            self.db.execute(
+                update(JournalEntry)
+                .where(JournalEntry.id.in_(list(links)))
+                .values(superseded_by_entry_id=case(links, value=JournalEntry.id))
+                .execution_options(synchronize_session=False)
+            )
+        self.semantic.upsert_entry_embeddings(
+            [(inserted[row["sequence_no"]], str(row["event_text_sl"])) for row in new_rows],
+            vectors,
         )
 
     def confirm(
@@ -45,6 +215,56 @@ class WriteTransactionService:
         session_id: int,
         idempotency_key: str,
     ) -> dict[str, object]:
+        """Apply the session's latest operation, serialized per day.
+
+        A unique violation means a concurrent request won a race (typically the
+        same idempotency key on two devices); the attempt is rolled back and
+        retried, and the retry replays or rebases instead of failing.
+        """
+        for attempt in range(1, CONFIRM_ATTEMPTS + 1):
+            try:
+                return self._confirm(
+                    user_id=user_id, session_id=session_id, idempotency_key=idempotency_key
+                )
+            except IntegrityError:
+                self.db.rollback()
+                if attempt == CONFIRM_ATTEMPTS:
+                    raise
+                metrics.increment("confirm_retry_total")
+        raise AssertionError("unreachable")
+
+    def _confirm(
+        self,
+        *,
+        user_id: int,
+        session_id: int,
+        idempotency_key: str,
+    ) -> dict[str, object]:
+        latest_operation_id = (
+            select(func.max(WriteOperation.id))
+            .where(WriteOperation.session_id == IdempotencyKey.session_id)
+            .scalar_subquery()
+        )
+        existing_key, latest_operation = self.db.execute(
+            select(IdempotencyKey, latest_operation_id).where(
+                IdempotencyKey.key == idempotency_key,
+                IdempotencyKey.user_id == user_id,
+            )
+        ).one_or_none() or (None, None)
+        if existing_key is not None and existing_key.response_snapshot is not None:
+            # Same session with no newer operation means the same request: replay verbatim.
+            same_request = (
+                existing_key.session_id == session_id
+                and latest_operation == existing_key.operation_id
+            )
+            if not same_request:
+                raise ValueError("Idempotency key reused with different request payload")
+            existing_key.last_seen_at = datetime.now(UTC)
+            replay = unpack_response(existing_key.response_snapshot)
+            replay["idempotent_replay"] = True
+            self.db.commit()
+            return replay
+
         session = self.db.execute(
             select(WriteSession).where(
                 WriteSession.id == session_id,
@@ -53,146 +273,84 @@ class WriteTransactionService:
         ).scalar_one_or_none()
         if session is None:
             raise ValueError("Write session not found")
-        operation = self.db.execute(
-            select(WriteOperation)
-            .where(WriteOperation.session_id == session.id)
-            .order_by(WriteOperation.id.desc())
-            .limit(1)
-        ).scalar_one_or_none()
+        operation = self.db.execute(latest_operation_query(session.id)).scalar_one_or_none()
         if operation is None:
             raise ValueError("No pending operation to confirm")
 
         request_hash = _hash_text(f"{session_id}:{operation.id}:{operation.diff_text}")
-        existing_key = self.db.execute(
-            select(IdempotencyKey).where(
-                IdempotencyKey.key == idempotency_key,
-                IdempotencyKey.user_id == user_id,
-            )
-        ).scalar_one_or_none()
         if existing_key is not None:
+            # Keys written before response snapshots existed.
             if existing_key.request_hash != request_hash:
                 raise ValueError("Idempotency key reused with different request payload")
-            existing_key.last_seen_at = datetime.now(timezone.utc)
-            self.db.commit()
+            existing_key.last_seen_at = datetime.now(UTC)
             day = self.db.execute(
                 select(JournalDay).where(
                     JournalDay.user_id == user_id,
                     JournalDay.day_date == session.day_date,
                 )
             ).scalar_one_or_none()
-            final_content = ""
-            if day is not None:
-                final_active = list(
-                    self.db.execute(
-                        select(JournalEntry)
-                        .where(
-                            JournalEntry.day_id == day.id,
-                            JournalEntry.superseded_by_entry_id.is_(None),
-                        )
-                        .order_by(JournalEntry.sequence_no.asc())
-                    ).scalars()
-                )
-                final_content = render_day_text(
-                    day.day_date, [entry.event_text_sl for entry in final_active]
-                )
-            return {
+            replay = {
                 "status": "ok",
                 "idempotent_replay": True,
                 "operation_id": existing_key.operation_id,
                 "day_date": session.day_date.isoformat(),
-                "final_content": final_content,
+                "final_content": day_content(self.db, day) if day is not None else "",
             }
+            self.db.commit()
+            return replay
 
-        day = self.db.execute(
-            select(JournalDay).where(
-                JournalDay.user_id == user_id,
-                JournalDay.day_date == session.day_date,
-            )
-        ).scalar_one_or_none()
-        if day is None:
-            day = JournalDay(user_id=user_id, day_date=session.day_date, timezone="Europe/Ljubljana")
-            self.db.add(day)
-            self.db.flush()
-
-        active_entries = list(
-            self.db.execute(
-                select(JournalEntry)
-                .where(
-                    JournalEntry.day_id == day.id,
-                    JournalEntry.superseded_by_entry_id.is_(None),
-                )
-                .order_by(JournalEntry.sequence_no.asc())
-            ).scalars()
-        )
-        replace_all = bool(operation.decision_json.get("replace_all", False))
-        if replace_all:
-            for active in active_entries:
-                self.db.delete(active)
-            self.db.flush()
-            active_by_sequence: dict[int, JournalEntry] = {}
-        else:
-            active_by_sequence = {entry.sequence_no: entry for entry in active_entries}
-
-        proposed_entries = operation.proposed_entries_json
-        for proposed in proposed_entries:
-            seq = int(proposed["sequence_no"])
-            text = str(proposed["event_text_sl"]).strip()
-            source = str(proposed.get("source_user_text", ""))
-            existing = active_by_sequence.get(seq)
-            if existing is None:
-                new_entry = JournalEntry(
-                    day_id=day.id,
-                    sequence_no=seq,
-                    event_text_sl=text,
-                    source_user_text=source,
-                    event_hash=_hash_text(text),
-                )
-                self.db.add(new_entry)
-                self.db.flush()
-                self.semantic.upsert_entry_embedding(new_entry.id, text)
-                continue
-            if existing.event_text_sl != text:
-                replacement = JournalEntry(
-                    day_id=day.id,
-                    sequence_no=seq,
-                    event_text_sl=text,
-                    source_user_text=source,
-                    event_hash=_hash_text(text),
-                    updated_from_entry_id=existing.id,
-                )
-                self.db.add(replacement)
-                self.db.flush()
-                existing.superseded_by_entry_id = replacement.id
-                self.semantic.upsert_entry_embedding(replacement.id, text)
-
-        operation.status = OperationStatus.applied
-        operation.applied_at = datetime.now(timezone.utc)
-        session.status = SessionStatus.confirmed
-        self.db.add(
-            IdempotencyKey(
-                key=idempotency_key,
-                user_id=user_id,
-                request_hash=request_hash,
-                operation_id=operation.id,
-            )
+        # Embedding calls are slow, so they run before the day lock is taken.
+        vectors = self.semantic.embed_many(
+            [
+                str(proposed["event_text_sl"]).strip()
+                for proposed in operation.proposed_entries_json
+                if proposed.get("id") is None
+                or proposed.get("updated_from_entry_id") == proposed.get("id")
+            ]
         )
-        self.db.commit()
 
-        final_active = list(
-            self.db.execute(
-                select(JournalEntry)
-                .where(
-                    JournalEntry.day_id == day.id,
-                    JournalEntry.superseded_by_entry_id.is_(None),
+        with locked_day(self.db, user_id, session.day_date) as (day, day_created):
+            status = self.db.execute(
+                select(WriteOperation.status).where(WriteOperation.id == operation.id)
+            ).scalar_one()
+            if status == OperationStatus.applied:
+                # Another request confirmed this operation while we waited for the lock.
+                response = {
+                    "status": "ok",
+                    "idempotent_replay": True,
+                    "operation_id": operation.id,
+                    "day_date": day.day_date.isoformat(),
+                    "final_content": day_content(self.db, day),
+                }
+                self.db.commit()
+                return response
+
+            self._apply_entries(day, operation, vectors)
+
+            final_content = materialize_day(self.db, day)
+            touch_journal(self.db, user_id)
+            record_day_change(
+                self.db, day, DayChangeKind.created if day_created else DayChangeKind.modified
+            )
+            operation.status = OperationStatus.applied
+            operation.applied_at = datetime.now(UTC)
+            session.status = SessionStatus.confirmed
+            response = {
+                "status": "ok",
+                "idempotent_replay": False,
+                "operation_id": operation.id,
+                "day_date": day.day_date.isoformat(),
+                "final_content": final_content,
+            }
+            self.db.add(
+                IdempotencyKey(
+                    key=idempotency_key,
+                    user_id=user_id,
+                    request_hash=request_hash,
+                    operation_id=operation.id,
+                    session_id=session.id,
+                    response_snapshot=pack_response(response),
                 )
-                .order_by(JournalEntry.sequence_no.asc())
-            ).scalars()
-        )
-        final_content = render_day_text(day.day_date, [entry.event_text_sl for entry in final_active])
-        return {
-            "status": "ok",
-            "idempotent_replay": False,
-            "operation_id": operation.id,
-            "day_date": day.day_date.isoformat(),
-            "final_content": final_content,
-        }
+            )
+            self.db.commit()
+            return response
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import secrets
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
+from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
-from ai_daily_journal.db.models import Base, User
+from ai_daily_journal.api.app import create_app
+from ai_daily_journal.db.models import Base, User, UserSession
+from ai_daily_journal.db.session import (
+    async_url,
+    build_async_session_factory,
+    build_session_factory,
+)
 from tests.helpers import make_config
 
 
@@ -42,3 +53,26 @@ def test_user(db_session: Session):
     db_session.commit()
     db_session.refresh(user)
     return user
+
+
+@pytest.fixture()
+def api_client(db_session: Session, test_config, test_user):
+    app = create_app()
+    app.state.config = test_config
+    app.state.session_factory = build_session_factory(db_session.get_bind())
+    # No pooling: async connections must not outlive the TestClient's event loop.
+    app.state.async_session_factory = build_async_session_factory(
+        create_async_engine(async_url(db_session.get_bind().url), poolclass=NullPool)
+    )
+    token = secrets.token_urlsafe(32)
+    db_session.add(
+        UserSession(
+            token=token,
+            user_id=test_user.id,
+            expires_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+    )
+    db_session.commit()
+    with TestClient(app) as client:
+        client.cookies.set(test_config.api_ui.session_cookie_name, token)
+        yield client
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import time
+
 from ai_daily_journal.config.schema import AppConfig
 
 
+def wait_for_warmup(api_client, timeout: float = 10.0) -> None:  # noqa: ANN001
+    """Block until the app's background warmup has finished touching the database."""
+    deadline = time.monotonic() + timeout
+    while not api_client.app.state.warmup_complete and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
 def make_config() -> AppConfig:
     return AppConfig.model_validate(
         {
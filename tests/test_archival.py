@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import func, select, update
+
+from ai_daily_journal.db.models import (
+    IdempotencyKey,
+    JournalDay,
+    JournalEntry,
+    JournalEntryArchive,
+    OperationAction,
+    OperationStatus,
+    SemanticDocument,
+    SessionStatus,
+    WriteOperation,
+    WriteOperationArchive,
+    WriteSession,
+)
+from ai_daily_journal.services.archival import entry_history_query, operation_history_query
+from ai_daily_journal.services.maintenance import run_maintenance
+from tests.helpers import make_config
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+OLD = NOW - timedelta(days=120)
+
+
+def _entry(day_id: int, text: str, **fields) -> JournalEntry:  # noqa: ANN003
+    return JournalEntry(
+        day_id=day_id,
+        sequence_no=1,
+        event_text_sl=text,
+        source_user_text=text,
+        event_hash="h",
+        created_at=OLD,
+        updated_at=OLD,
+        **fields,
+    )
+
+
+def _seed_entries(db_session, user_id: int) -> tuple[int, int]:  # noqa: ANN001
+    """A chain first -> second -> active, where only the first two are superseded."""
+    day = JournalDay(user_id=user_id, day_date=date(2026, 6, 1), timezone="Europe/Ljubljana")
+    db_session.add(day)
+    db_session.flush()
+    # Inserted newest first so each superseded_by target already exists.
+    active = _entry(day.id, "tretji", id=3)
+    second = _entry(day.id, "drugi", id=2, superseded_by_entry_id=3)
+    first = _entry(day.id, "prvi", id=1, superseded_by_entry_id=2)
+    for entry in (active, second, first):
+        db_session.add(entry)
+        db_session.flush()
+    db_session.execute(
+        update(JournalEntry)
+        .where(JournalEntry.id > 1)
+        .values(updated_from_entry_id=JournalEntry.id - 1, updated_at=OLD)
+    )
+    db_session.add(SemanticDocument(entry_id=first.id, embedding=[0.0] * 1536, model_name="m"))
+    db_session.commit()
+    return day.id, 3
+
+
+def _run(db_session):  # noqa: ANN001, ANN202
+    config = make_config()
+    config.maintenance.batch_pause_seconds = 0
+    results = run_maintenance(config, db_session.get_bind(), now=NOW)
+    db_session.expire_all()
+    return {result.name: result.deleted for result in results}
+
+
+def test_superseded_entries_move_to_archive_and_stay_in_history(db_session, test_user):
+    day_id, active_id = _seed_entries(db_session, test_user.id)
+
+    assert _run(db_session)["archive_entries"] == 2
+    assert _run(db_session)["archive_entries"] == 0
+
+    hot = db_session.execute(select(JournalEntry)).scalars().all()
+    assert [(entry.id, entry.superseded_by_entry_id) for entry in hot] == [(active_id, None)]
+    assert hot[0].updated_from_entry_id is None
+    assert hot[0].updated_at.replace(tzinfo=UTC) == OLD
+    assert db_session.execute(select(func.count()).select_from(SemanticDocument)).scalar_one() == 0
+
+    history = db_session.execute(entry_history_query(day_id)).mappings().all()
+    assert [row["event_text_sl"] for row in history] == ["prvi", "drugi", "tretji"]
+    assert [row["archived_at"] is None for row in history] == [False, False, True]
+    archived = db_session.execute(select(JournalEntryArchive).order_by(JournalEntryArchive.id))
+    assert [row.superseded_by_entry_id for row in archived.scalars()] == [2, active_id]
+
+
+def test_long_chain_drains_in_one_batch(db_session, test_user):
+    day = JournalDay(user_id=test_user.id, day_date=date(2026, 6, 2), timezone="Europe/Ljubljana")
+    db_session.add(day)
+    db_session.flush()
+    # 5 -> active; 1 -> 2 -> 3 -> 4 -> 5, inserted newest first.
+    for entry_id in range(6, 0, -1):
+        successor = entry_id + 1 if entry_id < 6 else None
+        entry = _entry(day.id, f"v{entry_id}", id=entry_id, superseded_by_entry_id=successor)
+        db_session.add(entry)
+        db_session.flush()
+    db_session.commit()
+
+    config = make_config()
+    config.maintenance.batch_pause_seconds = 0
+    [result] = [
+        result
+        for result in run_maintenance(config, db_session.get_bind(), now=NOW)
+        if result.name == "archive_entries"
+    ]
+
+    assert (result.deleted, result.batches) == (5, 1)
+    db_session.expire_all()
+    hot = db_session.execute(select(JournalEntry.id, JournalEntry.superseded_by_entry_id)).all()
+    assert hot == [(6, None)]
+
+
+def test_recent_superseded_row_pins_its_successors(db_session, test_user):
+    day_id, active_id = _seed_entries(db_session, test_user.id)
+    # The first entry was superseded recently, so neither it nor the entries after it move.
+    db_session.execute(update(JournalEntry).where(JournalEntry.id == 1).values(updated_at=NOW))
+    db_session.commit()
+
+    assert _run(db_session)["archive_entries"] == 0
+    links = db_session.execute(
+        select(JournalEntry.id, JournalEntry.superseded_by_entry_id).order_by(JournalEntry.id)
+    ).all()
+    assert links == [(1, 2), (2, active_id), (active_id, None)]
+
+
+def test_recent_history_stays_hot(db_session, test_user):
+    day_id, _ = _seed_entries(db_session, test_user.id)
+    db_session.execute(
+        update(JournalEntry).where(JournalEntry.day_id == day_id).values(updated_at=NOW)
+    )
+    db_session.commit()
+
+    assert _run(db_session)["archive_entries"] == 0
+    assert db_session.execute(select(func.count()).select_from(JournalEntry)).scalar_one() == 3
+
+
+def test_finished_sessions_operations_are_archived(db_session, test_user):
+    confirmed = WriteSession(
+        user_id=test_user.id,
+        day_date=date(2026, 6, 1),
+        status=SessionStatus.confirmed,
+        updated_at=OLD,
+    )
+    draft = WriteSession(user_id=test_user.id, day_date=date(2026, 10, 18))
+    db_session.add_all([confirmed, draft])
+    db_session.flush()
+    operations = [
+        WriteOperation(
+            session_id=session.id,
+            action=OperationAction.append,
+            decision_json={},
+            diff_text="+ entry",
+            status=status,
+            applied_at=OLD if status == OperationStatus.applied else None,
+            created_at=OLD,
+        )
+        for session, status in (
+            (confirmed, OperationStatus.cancelled),
+            (confirmed, OperationStatus.applied),
+            (draft, OperationStatus.pending),
+        )
+    ]
+    db_session.add_all(operations)
+    db_session.flush()
+    db_session.add(
+        IdempotencyKey(
+            key="confirm-1",
+            user_id=test_user.id,
+            session_id=confirmed.id,
+            request_hash="h",
+            operation_id=operations[1].id,
+            last_seen_at=NOW,
+        )
+    )
+    db_session.commit()
+
+    assert _run(db_session)["archive_operations"] == 2
+
+    hot = db_session.execute(select(WriteOperation.session_id)).scalars().all()
+    assert hot == [draft.id]
+    # A replay compares the key's operation with the session's latest hot one: both are None.
+    assert db_session.execute(select(IdempotencyKey.operation_id)).scalar_one() is None
+    archived = db_session.execute(select(WriteOperationArchive.status)).scalars().all()
+    assert sorted(status.value for status in archived) == ["applied", "cancelled"]
+    history = db_session.execute(operation_history_query(confirmed.id)).mappings().all()
+    assert [row["status"] for row in history] == [
+        OperationStatus.cancelled,
+        OperationStatus.applied,
+    ]
+
+
+def test_archival_can_be_disabled(db_session, test_user):
+    _seed_entries(db_session, test_user.id)
+    config = make_config()
+    config.maintenance.archive_after_days = None
+
+    results = run_maintenance(config, db_session.get_bind(), now=NOW)
+
+    assert "archive_entries" not in {result.name for result in results}
+    assert db_session.execute(select(func.count()).select_from(JournalEntry)).scalar_one() == 3
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from ai_daily_journal.db.models import JournalDay, JournalEntry
+from ai_daily_journal.db.session import async_url, build_async_session_factory
+from ai_daily_journal.services.auth import AsyncAuthService, AuthService
+from ai_daily_journal.services.journal_read import AsyncJournalReadService, JournalReadService
+from ai_daily_journal.services.session_cache import SessionTokenCache
+
+
+def test_async_url_switches_drivers():
+    assert str(async_url("sqlite+pysqlite:///tmp/x.db")) == "sqlite+aiosqlite:///tmp/x.db"
+    assert async_url("postgresql://u:p@db/journal").drivername == "postgresql+psycopg"
+    with pytest.raises(ValueError):
+        async_url("mysql://u:p@db/journal")
+
+
+@pytest.fixture()
+def async_factory(db_session):
+    engine = create_async_engine(async_url(db_session.get_bind().url), poolclass=NullPool)
+    return build_async_session_factory(engine)
+
+
+@pytest.mark.asyncio
+async def test_async_reads_match_sync_service(db_session, test_user, async_factory):
+    user_id = test_user.id
+    legacy = JournalDay(user_id=user_id, day_date=date(2026, 3, 2), timezone="Europe/Ljubljana")
+    db_session.add_all(
+        [
+            legacy,
+            JournalDay(
+                user_id=user_id,
+                day_date=date(2026, 4, 1),
+                timezone="Europe/Ljubljana",
+                rendered_content="Dnevnik za 2026-04-01\n\n1. Shranjeno.\n",
+                version=1,
+            ),
+        ]
+    )
+    db_session.flush()
+    db_session.add(
+        JournalEntry(
+            day_id=legacy.id,
+            sequence_no=1,
+            event_text_sl="Prvi dogodek.",
+            source_user_text="x",
+            event_hash="h",
+        )
+    )
+    db_session.commit()
+    sync = JournalReadService(db_session)
+
+    async with async_factory() as db:
+        service = AsyncJournalReadService(db)
+        assert await service.tree(user_id) == sync.tree(user_id)
+        assert await service.month_days(user_id, 2026, 3) == sync.month_days(user_id, 2026, 3)
+        assert await service.day_range(
+            user_id, date(2026, 3, 1), date(2026, 4, 30)
+        ) == sync.day_range(user_id, date(2026, 3, 1), date(2026, 4, 30))
+        day = await service.get_day(user_id, "2026-03-02")
+        assert await service.day_content(day) == sync.render_day_content(user_id, "2026-03-02")
+        latest = await service.latest_day(user_id)
+        assert latest.day_date == date(2026, 4, 1)
+        assert await service.journal_version(user_id) == sync.journal_version(user_id)
+
+
+@pytest.mark.asyncio
+async def test_async_auth_login_and_session_lookup(db_session, async_factory):
+    AuthService(db_session).register_user("async@example.com", "secret-pass", "Europe/Ljubljana")
+
+    async with async_factory() as db:
+        auth = AsyncAuthService(db)
+        assert await auth.authenticate("async@example.com", "wrong-pass") is None
+        token = await auth.authenticate("async@example.com", "secret-pass")
+        assert token is not None
+        cache = SessionTokenCache(ttl_seconds=60, max_entries=8, poll_seconds=60)
+        session = await auth.cached_session(token, cache)
+        assert session is not None and session.timezone == "Europe/Ljubljana"
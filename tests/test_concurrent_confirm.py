@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from ai_daily_journal.db.models import (
+    JournalDay,
+    JournalEntry,
+    OperationAction,
+    WriteOperation,
+    WriteSession,
+)
+from ai_daily_journal.services.write_transaction import (
+    StaleProposalError,
+    WriteTransactionService,
+)
+
+DAY = date(2026, 2, 20)
+
+
+def _session_with(
+    db_session, user_id: int, entries: list[dict], base_version: int, **decision: object
+) -> int:
+    session = WriteSession(user_id=user_id, day_date=DAY)
+    db_session.add(session)
+    db_session.flush()
+    db_session.add(
+        WriteOperation(
+            session_id=session.id,
+            action=OperationAction.append,
+            decision_json={"base_version": base_version, **decision},
+            proposed_entries_json=entries,
+            diff_text=f"diff-{session.id}",
+        )
+    )
+    db_session.commit()
+    return session.id
+
+
+def _confirm_all(db_session, user_id: int, requests: list[tuple[int, str]]) -> list:
+    factory = sessionmaker(bind=db_session.get_bind(), autoflush=False, future=True)
+
+    def confirm(request: tuple[int, str]) -> dict[str, object]:
+        session_id, key = request
+        with factory() as db:
+            service = WriteTransactionService(
+                db, embeddings_model_name="embedding-test", embeddings_dimensions=64
+            )
+            return service.confirm(user_id=user_id, session_id=session_id, idempotency_key=key)
+
+    def attempt(request: tuple[int, str]) -> dict[str, object] | Exception:
+        try:
+            return confirm(request)
+        except StaleProposalError as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+        return list(pool.map(attempt, requests))
+
+
+def _active_entries(db_session) -> list[tuple[int, str]]:
+    db_session.expire_all()
+    return [
+        (row.sequence_no, row.event_text_sl)
+        for row in db_session.execute(
+            select(JournalEntry.sequence_no, JournalEntry.event_text_sl)
+            .join(JournalDay, JournalDay.id == JournalEntry.day_id)
+            .where(JournalEntry.superseded_by_entry_id.is_(None))
+            .order_by(JournalEntry.sequence_no)
+        )
+    ]
+
+
+def test_parallel_confirms_for_one_day_all_succeed(db_session, test_user):
+    user_id = test_user.id
+    # Every proposal was made against the same empty day, so all claim sequence 1.
+    session_ids = [
+        _session_with(
+            db_session,
+            user_id,
+            [{"sequence_no": 1, "event_text_sl": f"Dogodek {idx}.", "source_user_text": "x"}],
+            base_version=0,
+        )
+        for idx in range(16)
+    ]
+
+    results = _confirm_all(
+        db_session, user_id, [(session_id, f"key-{session_id}") for session_id in session_ids]
+    )
+
+    assert all(result["status"] == "ok" for result in results)
+    active = _active_entries(db_session)
+    assert [seq for seq, _ in active] == list(range(1, 17))
+    assert sorted(text for _, text in active) == sorted(f"Dogodek {idx}." for idx in range(16))
+    day = db_session.execute(select(JournalDay)).scalar_one()
+    assert day.version == 16
+
+
+def test_same_key_from_two_devices_applies_once(db_session, test_user):
+    user_id = test_user.id
+    session_id = _session_with(
+        db_session,
+        user_id,
+        [{"sequence_no": 1, "event_text_sl": "Šel sem na sprehod.", "source_user_text": "x"}],
+        base_version=0,
+    )
+
+    results = _confirm_all(db_session, user_id, [(session_id, "same-device-key")] * 4)
+
+    assert sorted(result["idempotent_replay"] for result in results) == [False, True, True, True]
+    assert {result["operation_id"] for result in results} == {results[0]["operation_id"]}
+    assert _active_entries(db_session) == [(1, "Šel sem na sprehod.")]
+
+
+def test_stale_update_is_rebased_onto_current_entries(db_session, test_user):
+    user_id = test_user.id
+    first = _session_with(
+        db_session,
+        user_id,
+        [{"sequence_no": 1, "event_text_sl": "Tekel sem.", "source_user_text": "tek"}],
+        base_version=0,
+    )
+    _confirm_all(db_session, user_id, [(first, "key-first")])
+    entry_id = db_session.execute(select(JournalEntry.id)).scalar_one()
+
+    # Both proposals saw version 1 with a single entry.
+    appended = _session_with(
+        db_session,
+        user_id,
+        [
+            {"id": entry_id, "sequence_no": 1, "event_text_sl": "Tekel sem."},
+            {"sequence_no": 2, "event_text_sl": "Kuhal sem.", "source_user_text": "x"},
+        ],
+        base_version=1,
+    )
+    updated = _session_with(
+        db_session,
+        user_id,
+        [
+            {
+                "id": entry_id,
+                "sequence_no": 1,
+                "event_text_sl": "Tekel sem 10 km.",
+                "source_user_text": "tek",
+                "updated_from_entry_id": entry_id,
+            }
+        ],
+        base_version=1,
+    )
+    _confirm_all(db_session, user_id, [(appended, "key-append")])
+    _confirm_all(db_session, user_id, [(updated, "key-update")])
+
+    assert _active_entries(db_session) == [(1, "Tekel sem 10 km."), (2, "Kuhal sem.")]
+
+
+def test_stale_update_of_a_replaced_entry_is_rejected(db_session, test_user):
+    user_id = test_user.id
+    first = _session_with(
+        db_session,
+        user_id,
+        [{"sequence_no": 1, "event_text_sl": "Tekel sem.", "source_user_text": "tek"}],
+        base_version=0,
+    )
+    _confirm_all(db_session, user_id, [(first, "key-first")])
+    entry_id = db_session.execute(select(JournalEntry.id)).scalar_one()
+
+    # Both proposals saw version 1 and update the same entry.
+    updates = [
+        _session_with(
+            db_session,
+            user_id,
+            [
+                {
+                    "id": entry_id,
+                    "sequence_no": 1,
+                    "event_text_sl": text,
+                    "source_user_text": "tek",
+                    "updated_from_entry_id": entry_id,
+                }
+            ],
+            base_version=1,
+        )
+        for text in ("Tekel sem 5 km.", "Tekel sem 10 km.")
+    ]
+    [applied] = _confirm_all(db_session, user_id, [(updates[0], "key-5")])
+    [rejected] = _confirm_all(db_session, user_id, [(updates[1], "key-10")])
+
+    assert applied["status"] == "ok"
+    assert isinstance(rejected, StaleProposalError)
+    assert _active_entries(db_session) == [(1, "Tekel sem 5 km.")]
+
+
+def test_manual_edit_racing_an_append_never_drops_the_append(db_session, test_user):
+    user_id = test_user.id
+    first = _session_with(
+        db_session,
+        user_id,
+        [{"sequence_no": 1, "event_text_sl": "Tekel sem.", "source_user_text": "tek"}],
+        base_version=0,
+    )
+    _confirm_all(db_session, user_id, [(first, "key-first")])
+
+    # Both proposals saw version 1 with a single entry.
+    edited = _session_with(
+        db_session,
+        user_id,
+        [{"sequence_no": 1, "event_text_sl": "Tekel sem 10 km.", "source_user_text": "x"}],
+        base_version=1,
+        replace_all=True,
+    )
+    appended = _session_with(
+        db_session,
+        user_id,
+        [{"sequence_no": 2, "event_text_sl": "Kuhal sem.", "source_user_text": "x"}],
+        base_version=1,
+    )
+    results = _confirm_all(db_session, user_id, [(edited, "key-edit"), (appended, "key-append")])
+
+    active = _active_entries(db_session)
+    assert (2, "Kuhal sem.") in active
+    if isinstance(results[0], StaleProposalError):
+        # The append won: the edit was proposed against a version that no longer exists.
+        assert active == [(1, "Tekel sem."), (2, "Kuhal sem.")]
+    else:
+        assert active == [(1, "Tekel sem 10 km."), (2, "Kuhal sem.")]
+    # History is superseded, never deleted.
+    assert "Tekel sem." in db_session.execute(select(JournalEntry.event_text_sl)).scalars().all()
+
+
+def test_stale_manual_edit_is_rejected(db_session, test_user):
+    user_id = test_user.id
+    first = _session_with(
+        db_session,
+        user_id,
+        [{"sequence_no": 1, "event_text_sl": "Tekel sem.", "source_user_text": "tek"}],
+        base_version=0,
+    )
+    edited = _session_with(
+        db_session,
+        user_id,
+        [{"sequence_no": 1, "event_text_sl": "Bral sem.", "source_user_text": "x"}],
+        base_version=0,
+        replace_all=True,
+    )
+    _confirm_all(db_session, user_id, [(first, "key-first")])
+
+    [result] = _confirm_all(db_session, user_id, [(edited, "key-edit")])
+
+    assert isinstance(result, StaleProposalError)
+    assert _active_entries(db_session) == [(1, "Tekel sem.")]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from ai_daily_journal.services.write_flow import JournalWriteService
+
+
+def _confirm(db_session, test_config, user_id: int, text: str, key: str) -> dict[str, object]:
+    service = JournalWriteService(db_session, test_config)
+    proposal = service.propose(user_id=user_id, source_text=text, session_id=None, instruction=None)
+    return service.confirm(
+        user_id=user_id, session_id=int(proposal["session_id"]), idempotency_key=key
+    )
+
+
+def test_day_read_returns_304_for_matching_etag(api_client, db_session, test_config, test_user):
+    confirmed = _confirm(db_session, test_config, test_user.id, "Danes sem tekel", "etag-key-001")
+    path = f"/api/journal/days/{confirmed['day_date']}"
+
+    first = api_client.get(path)
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+    etag = first.headers["etag"]
+
+    second = api_client.get(path, headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+
+    _confirm(db_session, test_config, test_user.id, "Danes sem kuhal", "etag-key-002")
+    third = api_client.get(path, headers={"If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["etag"] != etag
+
+
+def test_tree_and_latest_etags_follow_journal_version(
+    api_client, db_session, test_config, test_user
+):
+    tree = api_client.get("/api/journal/tree")
+    latest = api_client.get("/api/journal/latest")
+    assert (
+        api_client.get(
+            "/api/journal/tree", headers={"If-None-Match": tree.headers["etag"]}
+        ).status_code
+        == 304
+    )
+    assert (
+        api_client.get(
+            "/api/journal/latest", headers={"If-None-Match": latest.headers["etag"]}
+        ).status_code
+        == 304
+    )
+
+    _confirm(db_session, test_config, test_user.id, "Danes sem bral", "etag-key-003")
+    refreshed = api_client.get("/api/journal/tree", headers={"If-None-Match": tree.headers["etag"]})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["tree"]
@@ -58,3 +58,32 @@ def test_day_edit_replaces_day_content(db_session, test_config, test_user):
         ).scalars()
     )
     assert [entry.event_text_sl for entry in active_entries] == ["Tekel sem in nato počival."]
+
+    # The replaced and the removed entries stay as superseded history.
+    history = db_session.execute(
+        select(JournalEntry.event_text_sl, JournalEntry.superseded_by_entry_id).where(
+            JournalEntry.superseded_by_entry_id.is_not(None)
+        )
+    ).all()
+    assert sorted(text for text, _ in history) == ["Popoldne sem bral.", "Tekel sem zjutraj."]
+
+
+def test_confirming_a_stale_day_edit_returns_409(api_client, db_session, test_user):
+    day = JournalDay(user_id=test_user.id, day_date=date(2026, 2, 20), timezone="Europe/Ljubljana")
+    db_session.add(day)
+    db_session.commit()
+    proposal = api_client.post(
+        "/api/journal/days/2026-02-20/edit-propose",
+        json={"content": "Dnevnik za 2026-02-20\n\n1. Bral sem."},
+    ).json()
+    # Another device confirmed something for the day in the meantime.
+    day.version += 1
+    db_session.commit()
+
+    response = api_client.post(
+        "/api/journal/confirm",
+        json={"session_id": proposal["session_id"], "idempotency_key": "stale-edit-key"},
+    )
+
+    assert response.status_code == 409
+    assert db_session.execute(select(JournalEntry)).first() is None
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from sqlalchemy import select
+
+from ai_daily_journal.db.models import JournalDay, JournalEntry
+from ai_daily_journal.services.day_materialization import content_hash
+from ai_daily_journal.services.journal_read import JournalReadService
+from ai_daily_journal.services.write_flow import JournalWriteService
+
+
+def _confirm(service: JournalWriteService, user_id: int, text: str, key: str) -> dict[str, object]:
+    proposal = service.propose(user_id=user_id, source_text=text, session_id=None, instruction=None)
+    return service.confirm(
+        user_id=user_id, session_id=int(proposal["session_id"]), idempotency_key=key
+    )
+
+
+def test_confirm_materializes_content_and_bumps_version(db_session, test_config, test_user):
+    service = JournalWriteService(db_session, test_config)
+    first = _confirm(service, test_user.id, "Danes sem tekel", "materialize-001")
+    day = db_session.execute(
+        select(JournalDay).where(JournalDay.user_id == test_user.id)
+    ).scalar_one()
+    assert day.version == 1
+    assert day.rendered_content == first["final_content"]
+    assert day.content_hash == content_hash(str(first["final_content"]))
+
+    second = _confirm(service, test_user.id, "Danes sem kuhal večerjo", "materialize-002")
+    db_session.refresh(day)
+    assert day.version == 2
+    assert day.rendered_content == second["final_content"]
+
+
+def test_read_serves_materialized_row_without_entry_scan(db_session, test_config, test_user):
+    service = JournalWriteService(db_session, test_config)
+    confirmed = _confirm(service, test_user.id, "Danes sem bral", "materialize-003")
+    day_date = str(confirmed["day_date"])
+    db_session.execute(
+        JournalEntry.__table__.update().values(event_text_sl="Spremenjeno mimo confirm.")
+    )
+    db_session.commit()
+
+    reader = JournalReadService(db_session)
+    assert reader.render_day_content(test_user.id, day_date) == confirmed["final_content"]
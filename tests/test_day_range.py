@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import event
+
+from ai_daily_journal.db.models import JournalDay, JournalEntry
+from ai_daily_journal.services.journal_read import JournalReadService
+
+
+def _seed(db_session, user_id: int) -> None:
+    materialized = JournalDay(
+        user_id=user_id,
+        day_date=date(2026, 3, 1),
+        timezone="Europe/Ljubljana",
+        rendered_content="Dnevnik za 2026-03-01\n\n1. Shranjeno.\n",
+        version=1,
+    )
+    legacy = JournalDay(user_id=user_id, day_date=date(2026, 3, 2), timezone="Europe/Ljubljana")
+    empty = JournalDay(user_id=user_id, day_date=date(2026, 3, 5), timezone="Europe/Ljubljana")
+    db_session.add_all([materialized, legacy, empty])
+    db_session.flush()
+    for seq, text in [(2, "Drugi dogodek."), (1, "Prvi dogodek.")]:
+        db_session.add(
+            JournalEntry(
+                day_id=legacy.id,
+                sequence_no=seq,
+                event_text_sl=text,
+                source_user_text=text,
+                event_hash=str(seq),
+            )
+        )
+    db_session.commit()
+
+
+def test_day_range_renders_all_days_in_one_statement(db_session, test_user):
+    _seed(db_session, test_user.id)
+    user_id = test_user.id
+    statements: list[str] = []
+    bind = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(bind, "before_cursor_execute", listener)
+    try:
+        days, next_after = JournalReadService(db_session).day_range(
+            user_id, date(2026, 3, 1), date(2026, 3, 31)
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert next_after is None
+    assert [day["day_date"] for day in days] == ["2026-03-01", "2026-03-02", "2026-03-05"]
+    assert days[0]["content"].endswith("1. Shranjeno.\n")
+    assert days[1]["content"] == "Dnevnik za 2026-03-02\n\n1. Prvi dogodek.\n2. Drugi dogodek.\n"
+    assert days[2]["content"].endswith("Brez vnosov.\n")
+
+
+def test_day_range_endpoint_paginates(api_client, db_session, test_user):
+    _seed(db_session, test_user.id)
+    march = {"from": "2026-03-01", "to": "2026-03-31"}
+    body = api_client.get("/api/journal/days", params={**march, "limit": 2}).json()
+    assert [day["day_date"] for day in body["days"]] == ["2026-03-01", "2026-03-02"]
+    assert body["next_after"] == "2026-03-02"
+
+    rest = api_client.get("/api/journal/days", params={**march, "after": body["next_after"]}).json()
+    assert [day["day_date"] for day in rest["days"]] == ["2026-03-05"]
+    assert rest["next_after"] is None
+    last = {"from": "9999-12-01", "to": "9999-12-31", "after": "9999-12-31"}
+    assert api_client.get("/api/journal/days", params=last).json()["days"] == []
+
+    bad = api_client.get("/api/journal/days", params={"from": "2026-03-31", "to": "2026-03-01"})
+    assert bad.status_code == 400
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from ai_daily_journal.schemas.coordinator import Action
+from ai_daily_journal.services.coordinator import CoordinatorContext, CoordinatorService
+from ai_daily_journal.services.deadline import Deadline, DeadlineExceededError
+from ai_daily_journal.services.editor import EditorContext, EditorService
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _context(deadline: Deadline | None = None) -> CoordinatorContext:
+    return CoordinatorContext(
+        resolved_date=date(2026, 2, 20),
+        user_text="Danes sem tekel",
+        candidate_entry_ids=[],
+        top_similarity=0.9,
+        existing_entries_count=1,
+        deadline=deadline,
+    )
+
+
+def test_deadline_timeout_is_capped_by_remaining_budget() -> None:
+    clock = FakeClock()
+    deadline = Deadline(5.0, clock=clock)
+    assert deadline.timeout(30.0) == 5.0
+    clock.now += 4.0
+    assert deadline.timeout(30.0) == pytest.approx(1.0)
+    clock.now += 2.0
+    assert deadline.expired
+    with pytest.raises(DeadlineExceededError):
+        deadline.timeout(30.0)
+
+
+def test_coordinator_stops_retrying_when_budget_runs_out() -> None:
+    clock = FakeClock()
+    deadline = Deadline(3.0, clock=clock)
+    calls = {"count": 0}
+
+    def slow_invalid_responder(_ctx: CoordinatorContext) -> str:
+        calls["count"] += 1
+        clock.now += 2.0
+        return "not-json"
+
+    service = CoordinatorService(max_retries=5, responder=slow_invalid_responder)
+    result = service.decide(_context(deadline))
+    assert calls["count"] == 2
+    assert "latency budget" in result.warnings[0]
+    assert result.decision.action == Action.append
+
+
+def test_editor_skips_model_once_budget_is_spent() -> None:
+    clock = FakeClock()
+    deadline = Deadline(1.0, clock=clock)
+    clock.now += 5.0
+
+    def responder(_source: str, _instruction: str | None) -> str:
+        raise AssertionError("editor model must not be called")
+
+    result = EditorService(responder=responder).propose(
+        EditorContext(
+            action=Action.create,
+            source_text="danes sem tekel",
+            instruction=None,
+            existing_entries=[],
+            candidate_entry_ids=[],
+            deadline=deadline,
+        )
+    )
+    assert result.entries[0]["event_text_sl"] == "Danes sem tekel."
+    assert "latency budget" in result.warnings[0]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from ai_daily_journal.config.schema import DecisionConfig
+from ai_daily_journal.metrics import metrics
+from ai_daily_journal.services.decision_engine import DecisionEngine
+from ai_daily_journal.services.write_flow import JournalWriteService
+
+
+def test_empty_day_always_creates() -> None:
+    engine = DecisionEngine(DecisionConfig())
+    outcome = engine.settle(top_similarity=0.0, existing_entries_count=0, has_candidates=False)
+    assert outcome is not None
+    assert outcome.action.value == "create"
+    assert outcome.rule == "no_entries"
+
+
+def test_same_event_and_distinct_are_settled_by_rules() -> None:
+    engine = DecisionEngine(DecisionConfig())
+    same = engine.settle(top_similarity=0.99, existing_entries_count=2, has_candidates=True)
+    distinct = engine.settle(top_similarity=0.20, existing_entries_count=2, has_candidates=True)
+    assert same is not None and same.action.value == "noop"
+    assert distinct is not None and distinct.action.value == "append"
+
+
+def test_ambiguity_band_defers_to_model() -> None:
+    engine = DecisionEngine(DecisionConfig(ambiguity_band_min=0.80, ambiguity_band_max=0.95))
+    assert engine.settle(top_similarity=0.85, existing_entries_count=1, has_candidates=True) is None
+    outcome = engine.settle(top_similarity=0.96, existing_entries_count=1, has_candidates=True)
+    assert outcome is not None and outcome.action.value == "update"
+
+
+def test_fast_path_can_be_disabled() -> None:
+    engine = DecisionEngine(DecisionConfig(fast_path_enabled=False))
+    assert engine.settle(top_similarity=0.0, existing_entries_count=0, has_candidates=False) is None
+
+
+def test_propose_skips_coordinator_for_empty_day(db_session, test_config, test_user):
+    metrics.reset()
+    service = JournalWriteService(db_session, test_config)
+
+    def fail_decide(_ctx):
+        raise AssertionError("coordinator must not be called")
+
+    service.coordinator.decide = fail_decide
+    result = service.propose(
+        user_id=test_user.id,
+        source_text="Danes sem pekel kruh",
+        session_id=None,
+        instruction=None,
+    )
+    assert result["action"] == "create"
+    assert result["decision_source"] == "rule"
+    assert metrics.counter("decision_total", source="rule") == 1
+    assert metrics.counter("decision_fast_path_total", rule="no_entries") == 1
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from ai_daily_journal.schemas.coordinator import Action
+from ai_daily_journal.services.coordinator import CoordinatorContext, CoordinatorService
+from ai_daily_journal.services.editor import EditorContext, EditorService
+from ai_daily_journal.services.fused import fused_responders
+
+
+def _context() -> CoordinatorContext:
+    return CoordinatorContext(
+        resolved_date=date(2026, 2, 20),
+        user_text="Danes sem tekel",
+        candidate_entry_ids=[],
+        top_similarity=0.9,
+        existing_entries_count=1,
+        instruction="bolj jedrnato",
+    )
+
+
+def _editor_context() -> EditorContext:
+    return EditorContext(
+        action=Action.append,
+        source_text="Danes sem tekel",
+        instruction="bolj jedrnato",
+        existing_entries=[],
+        candidate_entry_ids=[],
+    )
+
+
+def test_single_fused_call_feeds_coordinator_and_editor() -> None:
+    calls = {"fused": 0, "editor": 0}
+
+    def fused_call(_ctx: CoordinatorContext) -> str:
+        calls["fused"] += 1
+        return json.dumps(
+            {
+                "resolved_date": "2026-02-20",
+                "action": "append",
+                "candidate_entry_ids": [],
+                "reason": "Nov dogodek.",
+                "event_text_sl": "Tekel sem.",
+            }
+        )
+
+    def editor_call(_source: str, _instruction: str | None) -> str:
+        calls["editor"] += 1
+        return "Ločen klic."
+
+    coordinator_responder, editor_responder = fused_responders(fused_call, editor_call)
+    decision = CoordinatorService(max_retries=1, responder=coordinator_responder).decide(_context())
+    edited = EditorService(responder=editor_responder).propose(_editor_context())
+
+    assert decision.decision.action == Action.append
+    assert edited.entries[-1]["event_text_sl"] == "Tekel sem."
+    assert calls == {"fused": 1, "editor": 0}
+
+
+def test_fused_retries_on_invalid_decision_and_falls_back_for_missing_text() -> None:
+    responses = iter(
+        [
+            "not-json",
+            json.dumps(
+                {
+                    "resolved_date": "2026-02-20",
+                    "action": "append",
+                    "candidate_entry_ids": [],
+                    "reason": "Nov dogodek.",
+                }
+            ),
+        ]
+    )
+    coordinator_responder, editor_responder = fused_responders(lambda _ctx: next(responses), None)
+    decision = CoordinatorService(max_retries=1, responder=coordinator_responder).decide(_context())
+    edited = EditorService(responder=editor_responder).propose(_editor_context())
+
+    assert decision.attempts == 2
+    assert decision.warnings == []
+    assert edited.warnings and "fallback" in edited.warnings[0]
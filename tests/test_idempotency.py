@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import pytest
+from sqlalchemy import event, update
 
+from ai_daily_journal.db.models import IdempotencyKey
 from ai_daily_journal.services.write_flow import JournalWriteService
 
 
@@ -51,3 +53,60 @@ def test_idempotency_key_reuse_with_different_request_fails(db_session, test_con
             session_id=int(next_proposal["session_id"]),
             idempotency_key="dup-key-456",
         )
+
+
+def test_replay_returns_original_snapshot_with_single_lookup(db_session, test_config, test_user):
+    service = JournalWriteService(db_session, test_config)
+    proposal = service.propose(
+        user_id=test_user.id, source_text="Danes sem plaval", session_id=None, instruction=None
+    )
+    session_id = int(proposal["session_id"])
+    first = service.confirm(
+        user_id=test_user.id, session_id=session_id, idempotency_key="snap-key-001"
+    )
+    later = service.propose(
+        user_id=test_user.id,
+        source_text="Danes sem kuhal kosilo",
+        session_id=None,
+        instruction=None,
+    )
+    service.confirm(
+        user_id=test_user.id, session_id=int(later["session_id"]), idempotency_key="snap-key-002"
+    )
+
+    user_id = test_user.id
+    statements: list[str] = []
+    bind = db_session.get_bind()
+
+    def listener(*args) -> None:  # noqa: ANN002
+        statements.append(args[2])
+
+    event.listen(bind, "before_cursor_execute", listener)
+    try:
+        replay = service.confirm(
+            user_id=user_id, session_id=session_id, idempotency_key="snap-key-001"
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", listener)
+
+    assert replay == {**first, "idempotent_replay": True}
+    assert [sql.split()[0] for sql in statements] == ["SELECT", "UPDATE"]
+
+
+def test_legacy_key_without_snapshot_still_replays(db_session, test_config, test_user):
+    service = JournalWriteService(db_session, test_config)
+    proposal = service.propose(
+        user_id=test_user.id, source_text="Danes sem bral", session_id=None, instruction=None
+    )
+    session_id = int(proposal["session_id"])
+    first = service.confirm(
+        user_id=test_user.id, session_id=session_id, idempotency_key="legacy-001"
+    )
+    db_session.execute(update(IdempotencyKey).values(response_snapshot=None, session_id=None))
+    db_session.commit()
+
+    replay = service.confirm(
+        user_id=test_user.id, session_id=session_id, idempotency_key="legacy-001"
+    )
+    assert replay["idempotent_replay"] is True
+    assert replay["final_content"] == first["final_content"]
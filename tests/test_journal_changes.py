@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from ai_daily_journal.db.models import DayChangeKind, JournalChange
+from ai_daily_journal.services.journal_changes import (
+    InvalidCursorError,
+    JournalChangesService,
+    decode_cursor,
+    encode_cursor,
+)
+from ai_daily_journal.services.write_flow import JournalWriteService
+
+
+def _confirm(db_session, test_config, user_id: int, text: str, key: str) -> dict[str, object]:
+    service = JournalWriteService(db_session, test_config)
+    proposal = service.propose(user_id=user_id, source_text=text, session_id=None, instruction=None)
+    return service.confirm(
+        user_id=user_id, session_id=int(proposal["session_id"]), idempotency_key=key
+    )
+
+
+def test_cursor_round_trip_and_rejects_garbage() -> None:
+    assert decode_cursor(encode_cursor(42)) == 42
+    assert decode_cursor(None) == 0
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+
+def test_changes_collapse_per_day_and_advance_cursor(db_session, test_config, test_user):
+    service = JournalChangesService(db_session)
+    start = service.changes_since(test_user.id, None)
+    assert start.changes == []
+
+    first = _confirm(db_session, test_config, test_user.id, "Danes sem tekel", "changes-key-001")
+    _confirm(db_session, test_config, test_user.id, "Danes sem kuhal", "changes-key-002")
+
+    delta = service.changes_since(test_user.id, start.next_cursor, include_content=True)
+    assert delta.changes == [
+        {
+            "day_date": first["day_date"],
+            "change": "created",
+            "version": 2,
+            "content": delta.changes[0]["content"],
+        }
+    ]
+    assert "kuhal" in str(delta.changes[0]["content"])
+    assert service.changes_since(test_user.id, delta.next_cursor).changes == []
+
+
+def test_changes_endpoint_pages_with_limit(api_client, db_session, test_config, test_user):
+    _confirm(db_session, test_config, test_user.id, "Danes sem tekel", "changes-key-003")
+    _confirm(db_session, test_config, test_user.id, "Danes sem bral", "changes-key-004")
+
+    page = api_client.get("/api/journal/changes", params={"limit": 1}).json()
+    assert page["has_more"] is True
+    assert page["changes"][0]["change"] == "created"
+
+    rest = api_client.get("/api/journal/changes", params={"since": page["next_cursor"]}).json()
+    assert rest["has_more"] is False
+    assert rest["changes"][0]["change"] == "modified"
+
+    assert api_client.get("/api/journal/changes", params={"since": "%%%"}).status_code == 400
+
+
+def test_deleted_day_changes_with_content(db_session, test_user):
+    # The day behind these rows is gone, so the FK left day_id NULL on all of them.
+    db_session.add_all(
+        [
+            JournalChange(
+                user_id=test_user.id,
+                day_id=None,
+                day_date=date(2026, 3, 1),
+                change_kind=DayChangeKind.modified,
+                day_version=3,
+            ),
+            JournalChange(
+                user_id=test_user.id,
+                day_id=None,
+                day_date=date(2026, 3, 2),
+                change_kind=DayChangeKind.created,
+                day_version=1,
+            ),
+            JournalChange(
+                user_id=test_user.id,
+                day_id=None,
+                day_date=date(2026, 3, 2),
+                change_kind=DayChangeKind.deleted,
+                day_version=1,
+            ),
+        ]
+    )
+    db_session.commit()
+
+    delta = JournalChangesService(db_session).changes_since(
+        test_user.id, None, include_content=True
+    )
+
+    assert delta.changes == [
+        {"day_date": "2026-03-01", "change": "modified", "version": 3, "content": None},
+        {"day_date": "2026-03-02", "change": "deleted", "version": 1},
+    ]
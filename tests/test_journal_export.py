@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import date
+from pathlib import Path
+
+import yaml
+from typer.testing import CliRunner
+
+from ai_daily_journal.cli.main import app
+from ai_daily_journal.db.models import JournalDay, JournalEntry
+from ai_daily_journal.services.journal_export import export_journal
+from tests.helpers import make_config
+
+
+def _seed(db_session, user_id: int) -> None:
+    day = JournalDay(user_id=user_id, day_date=date(2026, 1, 2), timezone="Europe/Ljubljana")
+    empty = JournalDay(user_id=user_id, day_date=date(2026, 1, 3), timezone="Europe/Ljubljana")
+    db_session.add_all([day, empty])
+    db_session.flush()
+    old = JournalEntry(
+        day_id=day.id, sequence_no=9, event_text_sl="Stara.", source_user_text="s", event_hash="a"
+    )
+    db_session.add(old)
+    db_session.flush()
+    new = JournalEntry(
+        day_id=day.id,
+        sequence_no=1,
+        event_text_sl="Nova.",
+        source_user_text="n",
+        event_hash="b",
+        updated_from_entry_id=old.id,
+    )
+    db_session.add(new)
+    db_session.flush()
+    old.superseded_by_entry_id = new.id
+    db_session.add(
+        JournalEntry(
+            day_id=day.id,
+            sequence_no=2,
+            event_text_sl="Druga.",
+            source_user_text="d",
+            event_hash="c",
+        )
+    )
+    db_session.commit()
+
+
+def test_ndjson_export_streams_active_entries_per_day(db_session, test_user):
+    _seed(db_session, test_user.id)
+    user_id = test_user.id
+    loaded = len(db_session.identity_map)
+    lines = b"".join(export_journal(db_session, user_id, batch_size=1)).decode().splitlines()
+    days = [json.loads(line) for line in lines]
+    assert [day["day_date"] for day in days] == ["2026-01-02", "2026-01-03"]
+    assert [entry["event_text_sl"] for entry in days[0]["entries"]] == ["Nova.", "Druga."]
+    assert days[1]["entries"] == []
+    assert len(db_session.identity_map) == loaded
+
+
+def test_gzip_markdown_export_round_trips(db_session, test_user):
+    _seed(db_session, test_user.id)
+    plain = b"".join(export_journal(db_session, test_user.id, fmt="markdown"))
+    packed = b"".join(export_journal(db_session, test_user.id, fmt="markdown", gzip=True))
+    assert gzip.decompress(packed) == plain
+    assert plain.decode().startswith("# Dnevnik za 2026-01-02\n\n1. Nova.\n2. Druga.\n")
+
+
+def test_export_endpoint_streams_ndjson(api_client, db_session, test_user):
+    _seed(db_session, test_user.id)
+    response = api_client.get("/api/journal/export", params={"gzip": "true"})
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="journal.ndjson.gz"'
+    lines = gzip.decompress(response.content).decode().splitlines()
+    assert json.loads(lines[0])["day_date"] == "2026-01-02"
+
+
+def test_export_cli_writes_file(monkeypatch, tmp_path: Path, db_session, test_user):
+    _seed(db_session, test_user.id)
+    config_path = tmp_path / "config.yaml"
+    env_path = tmp_path / ".env"
+    config_path.write_text(yaml.safe_dump(make_config().model_dump(mode="json")), encoding="utf-8")
+    env_path.write_text(
+        f"AI_DAILY_JOURNAL_DB_URL={db_session.get_bind().url.render_as_string(hide_password=False)}\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("AI_DAILY_JOURNAL_CONFIG", str(config_path))
+    monkeypatch.setenv("AI_DAILY_JOURNAL_ENV", str(env_path))
+    output = tmp_path / "journal.md"
+
+    result = CliRunner().invoke(
+        app, ["export", "--email", test_user.email, "--format", "markdown", "--output", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "1. Nova." in output.read_text(encoding="utf-8")
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+import httpx
+import yaml
+from sqlalchemy import func, select
+from typer.testing import CliRunner
+
+from ai_daily_journal.cli.main import app
+from ai_daily_journal.db.models import (
+    JournalChange,
+    JournalDay,
+    JournalEntry,
+    SemanticDocument,
+    User,
+)
+from ai_daily_journal.services.journal_export import export_journal
+from ai_daily_journal.services.journal_import import (
+    JournalImportService,
+    iter_import_days,
+    parse_day_sections,
+)
+from ai_daily_journal.services.model_client import OpenAICompatibleClient
+from ai_daily_journal.services.semantic_search import deterministic_embedding
+from tests.helpers import make_config
+
+
+def _service(db_session, **kwargs) -> JournalImportService:
+    return JournalImportService(
+        db_session,
+        embeddings_model_name="embedding-test",
+        embeddings_dimensions=64,
+        batch_embedder=lambda texts: [deterministic_embedding(text, 64) for text in texts],
+        **kwargs,
+    )
+
+
+def test_parse_day_sections_handles_single_day_and_export_format() -> None:
+    single = "Dnevnik za 2026-01-05\n\n1. Tekel sem.\n2. Bral sem.\n"
+    assert list(parse_day_sections(single, date(2026, 1, 5))) == [
+        (date(2026, 1, 5), ["Tekel sem.", "Bral sem."])
+    ]
+    combined = "# Dnevnik za 2026-01-01\n\n1. Prvi.\n\n# Dnevnik za 2026-01-02\n\n"
+    assert list(parse_day_sections(combined, None)) == [
+        (date(2026, 1, 1), ["Prvi."]),
+        (date(2026, 1, 2), []),
+    ]
+
+
+def test_import_is_batched_idempotent_and_materialized(db_session, test_user, tmp_path: Path):
+    for day in range(1, 6):
+        (tmp_path / f"2025-03-0{day}.md").write_text(f"1. Dogodek {day}.\n2. Drugi {day}.\n")
+    user_id = test_user.id
+
+    stats = _service(db_session, day_batch_size=2).import_days(user_id, iter_import_days(tmp_path))
+    assert stats.as_dict() == {
+        "days_imported": 5,
+        "days_skipped": 0,
+        "entries_imported": 10,
+        "embeddings_written": 10,
+    }
+    again = _service(db_session).import_days(user_id, iter_import_days(tmp_path))
+    assert again.days_imported == 0 and again.days_skipped == 5
+
+    assert db_session.execute(select(func.count()).select_from(JournalEntry)).scalar() == 10
+    assert db_session.execute(select(func.count()).select_from(SemanticDocument)).scalar() == 10
+    assert db_session.execute(select(func.count()).select_from(JournalChange)).scalar() == 5
+    day = db_session.execute(
+        select(JournalDay).where(JournalDay.day_date == date(2025, 3, 2))
+    ).scalar_one()
+    assert day.version == 1
+    assert day.rendered_content == "Dnevnik za 2025-03-02\n\n1. Dogodek 2.\n2. Drugi 2.\n"
+
+
+def test_markdown_export_imports_back(db_session, test_user, tmp_path: Path):
+    user_id = test_user.id
+    _service(db_session).import_days(
+        user_id, [(date(2025, 4, 1), ["Ena."]), (date(2025, 4, 2), ["Dve.", "Tri."])]
+    )
+    exported = b"".join(export_journal(db_session, user_id, fmt="markdown")).decode()
+    other = User(email="copy@example.com", password_hash="x", timezone="Europe/Ljubljana")
+    db_session.add(other)
+    db_session.commit()
+
+    source = tmp_path / "journal.md"
+    source.write_text(exported, encoding="utf-8")
+    stats = _service(db_session).import_days(other.id, iter_import_days(source))
+    assert stats.days_imported == 2
+    assert b"".join(export_journal(db_session, other.id, fmt="markdown")).decode() == exported
+
+
+def test_batch_embeddings_request_preserves_input_order() -> None:
+    captured: dict[str, object] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.update(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={"data": [{"index": 1, "embedding": [2.0]}, {"index": 0, "embedding": [1.0]}]},
+        )
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    client = OpenAICompatibleClient("http://localhost", "key", http_client=http_client)
+    assert client.embeddings(model="m", texts=["a", "b"]) == [[1.0], [2.0]]
+    assert captured["input"] == ["a", "b"]
+
+
+def test_import_cli_reports_stats(monkeypatch, tmp_path: Path, db_session, test_user):
+    config_path = tmp_path / "config.yaml"
+    env_path = tmp_path / ".env"
+    config_path.write_text(yaml.safe_dump(make_config().model_dump(mode="json")), encoding="utf-8")
+    url = db_session.get_bind().url.render_as_string(hide_password=False)
+    env_path.write_text(f"AI_DAILY_JOURNAL_DB_URL={url}\n", encoding="utf-8")
+    monkeypatch.setenv("AI_DAILY_JOURNAL_CONFIG", str(config_path))
+    monkeypatch.setenv("AI_DAILY_JOURNAL_ENV", str(env_path))
+    source = tmp_path / "days"
+    source.mkdir()
+    (source / "2025-05-01.txt").write_text("Sprehod ob reki.\n", encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["import", str(source), "--email", test_user.email])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout)["days_imported"] == 1
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from ai_daily_journal.db.models import JournalDay
+from ai_daily_journal.services.journal_read import JournalReadService
+
+
+def _add_days(db_session, user_id: int, start: date, count: int) -> None:
+    for offset in range(count):
+        db_session.add(
+            JournalDay(
+                user_id=user_id,
+                day_date=start + timedelta(days=offset),
+                timezone="Europe/Ljubljana",
+            )
+        )
+    db_session.commit()
+
+
+def test_tree_groups_years_and_months_with_counts(db_session, test_user):
+    _add_days(db_session, test_user.id, date(2025, 12, 30), 4)
+    tree = JournalReadService(db_session).tree(test_user.id)
+    assert tree == [
+        {"year": 2026, "count": 2, "months": [{"month": 1, "count": 2}]},
+        {"year": 2025, "count": 2, "months": [{"month": 12, "count": 2}]},
+    ]
+
+
+def test_month_days_keyset_pagination(db_session, test_user):
+    _add_days(db_session, test_user.id, date(2026, 1, 28), 6)
+    service = JournalReadService(db_session)
+
+    page, next_after = service.month_days(test_user.id, 2026, 1, limit=2)
+    assert page == ["2026-01-31", "2026-01-30"]
+    assert next_after == "2026-01-30"
+
+    page, next_after = service.month_days(
+        test_user.id, 2026, 1, after=date.fromisoformat(next_after), limit=2
+    )
+    assert page == ["2026-01-29", "2026-01-28"]
+    assert next_after is None
+    assert service.month_days(test_user.id, 2026, 2)[0] == ["2026-02-01", "2026-02-02"][::-1]
+
+
+def test_month_endpoint_returns_days_and_rejects_bad_month(api_client, db_session, test_user):
+    _add_days(db_session, test_user.id, date(2026, 12, 30), 3)
+    body = api_client.get("/api/journal/tree/2026/12").json()
+    assert body == {
+        "year": 2026,
+        "month": 12,
+        "days": ["2026-12-31", "2026-12-30"],
+        "next_after": None,
+    }
+    assert api_client.get("/api/journal/tree/2026/13").status_code == 400
+    assert api_client.get("/api/journal/tree/2027/1").json()["days"] == ["2027-01-01"]
+    assert api_client.get("/api/journal/tree/9999/12").json()["days"] == []
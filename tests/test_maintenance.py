@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+import yaml
+from sqlalchemy import create_engine, func, select
+from typer.testing import CliRunner
+
+from ai_daily_journal.cli.main import app
+from ai_daily_journal.db.models import (
+    Base,
+    IdempotencyKey,
+    OperationAction,
+    SessionRevocation,
+    SessionStatus,
+    UserSession,
+    WriteOperation,
+    WriteSession,
+)
+from ai_daily_journal.services.maintenance import maintenance_lock, run_maintenance
+from tests.helpers import make_config
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+
+
+def _count(db_session, model) -> int:  # noqa: ANN001
+    return db_session.execute(select(func.count()).select_from(model)).scalar_one()
+
+
+def _seed(db_session, user_id: int) -> None:  # noqa: ANN001
+    old = NOW - timedelta(days=40)
+    for index in range(5):
+        db_session.add(UserSession(token=f"expired-{index}", user_id=user_id, expires_at=old))
+    db_session.add(UserSession(token="live", user_id=user_id, expires_at=NOW + timedelta(hours=1)))
+    db_session.add_all(
+        [
+            IdempotencyKey(key="old-key-1", user_id=user_id, request_hash="h", last_seen_at=old),
+            IdempotencyKey(key="fresh-key", user_id=user_id, request_hash="h", last_seen_at=NOW),
+            SessionRevocation(token_hash="a" * 64, revoked_at=old),
+            SessionRevocation(token_hash="b" * 64, revoked_at=NOW),
+        ]
+    )
+    abandoned = WriteSession(user_id=user_id, day_date=date(2026, 9, 1), updated_at=old)
+    fresh = WriteSession(user_id=user_id, day_date=date(2026, 10, 18), updated_at=NOW)
+    confirmed = WriteSession(
+        user_id=user_id, day_date=date(2026, 9, 2), status=SessionStatus.confirmed, updated_at=old
+    )
+    db_session.add_all([abandoned, fresh, confirmed])
+    db_session.flush()
+    for session in (abandoned, abandoned, abandoned, fresh, confirmed):
+        db_session.add(
+            WriteOperation(
+                session_id=session.id,
+                action=OperationAction.append,
+                decision_json={},
+                diff_text="+ entry",
+                created_at=session.updated_at,
+            )
+        )
+    db_session.commit()
+
+
+def test_sweeps_delete_only_expired_rows_in_batches(db_session, test_user):
+    _seed(db_session, test_user.id)
+    config = make_config()
+    config.maintenance.batch_size = 2
+    config.maintenance.batch_pause_seconds = 0
+
+    results = run_maintenance(config, db_session.get_bind(), now=NOW)
+
+    report = {result.name: (result.deleted, result.batches) for result in results}
+    assert report == {
+        "expired_sessions": (5, 3),
+        "session_revocations": (1, 1),
+        "idempotency_keys": (1, 1),
+        "draft_operations": (3, 2),
+        "draft_sessions": (1, 1),
+        "archive_entries": (0, 1),
+        "archive_operations": (0, 1),
+    }
+    db_session.expire_all()
+    assert db_session.execute(select(UserSession.token)).scalars().all() == ["live"]
+    assert _count(db_session, IdempotencyKey) == 1
+    assert _count(db_session, SessionRevocation) == 1
+    assert _count(db_session, WriteSession) == 2
+    assert _count(db_session, WriteOperation) == 2
+
+
+def test_draft_with_a_recent_operation_is_kept(db_session, test_user):
+    old = NOW - timedelta(days=40)
+    session = WriteSession(user_id=test_user.id, day_date=date(2026, 9, 1), updated_at=old)
+    db_session.add(session)
+    db_session.flush()
+    # propose appended to the session yesterday without touching its updated_at.
+    for created_at in (old, NOW - timedelta(days=1)):
+        db_session.add(
+            WriteOperation(
+                session_id=session.id,
+                action=OperationAction.append,
+                decision_json={},
+                diff_text="+ entry",
+                created_at=created_at,
+            )
+        )
+    db_session.commit()
+
+    results = run_maintenance(make_config(), db_session.get_bind(), now=NOW)
+
+    report = {result.name: result.deleted for result in results}
+    assert report["draft_operations"] == 0
+    assert report["draft_sessions"] == 0
+    db_session.expire_all()
+    assert _count(db_session, WriteOperation) == 2
+
+
+def test_only_one_runner_at_a_time(db_session):
+    engine = db_session.get_bind()
+    with maintenance_lock(engine) as acquired:
+        assert acquired is True
+        assert run_maintenance(make_config(), engine, now=NOW) is None
+    assert run_maintenance(make_config(), engine, now=NOW) is not None
+
+
+def test_stop_request_ends_the_run(db_session):
+    stop = threading.Event()
+    stop.set()
+
+    assert run_maintenance(make_config(), db_session.get_bind(), stop=stop, now=NOW) == []
+
+
+def test_maintenance_run_command(monkeypatch, tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    env_path = tmp_path / ".env"
+    db_path = tmp_path / "maintenance.db"
+    cfg = make_config()
+    cfg.logging.log_dir = str((tmp_path / "logs").resolve())
+    config_path.write_text(yaml.safe_dump(cfg.model_dump(mode="json")), encoding="utf-8")
+    env_path.write_text(f"AI_DAILY_JOURNAL_DB_URL=sqlite+pysqlite:///{db_path}\n", encoding="utf-8")
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    monkeypatch.setenv("AI_DAILY_JOURNAL_CONFIG", str(config_path))
+    monkeypatch.setenv("AI_DAILY_JOURNAL_ENV", str(env_path))
+
+    result = CliRunner().invoke(app, ["maintenance", "run"])
+
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["skipped"] is False
+    assert payload["sweeps"]["expired_sessions"]["deleted"] == 0
@@ -38,3 +38,72 @@ def test_initial_migration_uses_non_duplicating_enum_strategy() -> None:
     text = migration.read_text(encoding="utf-8")
     assert "postgresql.ENUM(" in text
     assert "create_type=False" in text
+
+
+def test_materialized_content_migration_follows_initial_revision() -> None:
+    migration = Path("migrations/versions/20261018_000002_materialize_day_content.py")
+    text = migration.read_text(encoding="utf-8")
+    assert 'down_revision = "20260220_000001"' in text
+    for column_name in ["rendered_content", "content_hash", "version"]:
+        assert column_name in text
+    # The backfill must not change with later versions of the application's helpers.
+    assert "from ai_daily_journal" not in text
+
+
+def test_change_log_migration_indexes_cursor_per_user() -> None:
+    migration = Path("migrations/versions/20261018_000004_journal_change_log.py")
+    text = migration.read_text(encoding="utf-8")
+    assert 'down_revision = "20261018_000003"' in text
+    assert '"journal_changes", ["user_id", "id"]' in text
+    assert "create_type=False" in text
+
+
+def test_active_sequence_migration_replaces_full_unique_constraint() -> None:
+    migration = Path("migrations/versions/20261018_000005_active_entry_sequence_index.py")
+    text = migration.read_text(encoding="utf-8")
+    assert 'down_revision = "20261018_000004"' in text
+    assert 'drop_constraint("uq_entry_day_sequence"' in text
+    assert "superseded_by_entry_id IS NULL" in text
+
+
+def test_idempotency_snapshot_migration_adds_columns() -> None:
+    migration = Path("migrations/versions/20261018_000006_idempotency_response_snapshot.py")
+    text = migration.read_text(encoding="utf-8")
+    assert 'down_revision = "20261018_000005"' in text
+    assert '"response_snapshot", sa.LargeBinary()' in text
+
+
+def test_session_revocation_migration_creates_table() -> None:
+    migration = Path("migrations/versions/20261018_000007_session_revocations.py")
+    text = migration.read_text(encoding="utf-8")
+    assert 'down_revision = "20261018_000006"' in text
+    assert '"session_revocations"' in text
+    assert '"token_hash", sa.String(length=64)' in text
+
+
+def test_retention_sweep_migration_indexes_sweep_predicates() -> None:
+    migration = Path("migrations/versions/20261018_000008_retention_sweep_indexes.py")
+    text = migration.read_text(encoding="utf-8")
+    assert 'down_revision = "20261018_000007"' in text
+    assert '"ix_user_sessions_expires_at"' in text
+    assert '["status", "updated_at"]' in text
+
+
+def test_history_archive_migration_creates_tables_and_views() -> None:
+    migration = Path("migrations/versions/20261018_000009_history_archive.py")
+    text = migration.read_text(encoding="utf-8")
+    assert 'down_revision = "20261018_000008"' in text
+    assert '"ai_daily_journal_entries_archive"' in text
+    assert '"write_operations_archive"' in text
+    assert "CREATE VIEW journal_entry_history" in text
+    assert "UNION ALL" in text
+    assert "create_type=False" in text
+
+
+def test_latest_operation_index_migration_replaces_session_index() -> None:
+    migration = Path("migrations/versions/20261018_000010_latest_operation_index.py")
+    text = migration.read_text(encoding="utf-8")
+    assert 'down_revision = "20261018_000009"' in text
+    assert '"ix_write_operations_session_id_id"' in text
+    assert 'sa.text("id DESC")' in text
+    assert 'op.drop_index("ix_write_operations_session_id"' in text
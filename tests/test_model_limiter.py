@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+import httpx
+import pytest
+
+from ai_daily_journal.metrics import metrics
+from ai_daily_journal.services.model_client import ModelRateLimitedError, OpenAICompatibleClient
+from ai_daily_journal.services.model_limiter import (
+    EndpointLimiter,
+    LimiterTimeoutError,
+    Priority,
+    endpoint_limiter,
+    parse_retry_after,
+    reset_limiters,
+)
+
+
+def test_interactive_waiters_are_served_before_background() -> None:
+    limiter = EndpointLimiter("test", max_in_flight=1)
+    limiter.acquire()
+    order: list[str] = []
+
+    def worker(label: str, priority: Priority) -> None:
+        with limiter.slot(priority):
+            order.append(label)
+
+    background = threading.Thread(target=worker, args=("background", Priority.background))
+    background.start()
+    time.sleep(0.05)
+    interactive = threading.Thread(target=worker, args=("interactive", Priority.interactive))
+    interactive.start()
+    time.sleep(0.05)
+    limiter.release()
+    background.join(timeout=2)
+    interactive.join(timeout=2)
+    assert order == ["interactive", "background"]
+
+
+def test_requests_per_minute_cap_times_out_excess_callers() -> None:
+    limiter = EndpointLimiter("rpm", max_in_flight=5, requests_per_minute=2)
+    with limiter.slot():
+        pass
+    with limiter.slot():
+        pass
+    with pytest.raises(LimiterTimeoutError):
+        limiter.acquire(timeout=0.05)
+    assert limiter.snapshot()["queue_depth"] == 0
+
+
+def test_client_backs_off_on_429_and_pauses_endpoint() -> None:
+    metrics.reset()
+    limiter = EndpointLimiter("provider", max_in_flight=2)
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0.05"}),
+        httpx.Response(200, json={"choices": [{"message": {"content": "{}"}}]}),
+    ]
+    http_client = httpx.Client(transport=httpx.MockTransport(lambda _request: responses.pop(0)))
+    client = OpenAICompatibleClient(
+        "http://localhost", "key", limiter=limiter, http_client=http_client
+    )
+    started = time.monotonic()
+    assert client.chat(model="m", system_prompt="s", user_prompt="u", temperature=0.0) == "{}"
+    assert time.monotonic() - started >= 0.05
+    assert metrics.counter("model_rate_limited_total", endpoint="provider") == 1
+
+
+def test_client_gives_up_when_retry_after_exceeds_timeout() -> None:
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda _request: httpx.Response(429, headers={"Retry-After": "120"})
+        )
+    )
+    client = OpenAICompatibleClient(
+        "http://localhost", "key", timeout_seconds=1.0, http_client=http_client
+    )
+    with pytest.raises(ModelRateLimitedError):
+        client.embedding(model="m", text="x")
+
+
+def test_parse_retry_after_accepts_seconds_and_dates() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_shared_endpoint_takes_the_strictest_limits(caplog: pytest.LogCaptureFixture) -> None:
+    reset_limiters()
+    shared = {"base_url": "http://models.local/v1", "api_key_env": "KEY"}
+    editor = endpoint_limiter("editor", **shared, max_in_flight=8, requests_per_minute=None)
+    with caplog.at_level(logging.WARNING):
+        coordinator = endpoint_limiter(
+            "coordinator",
+            base_url="http://models.local/v1/",
+            api_key_env="KEY",
+            max_in_flight=2,
+            requests_per_minute=60,
+        )
+        again = endpoint_limiter("embeddings", **shared, max_in_flight=4, requests_per_minute=120)
+        # Routers are rebuilt per request: the same configured limits warn only once.
+        for _ in range(3):
+            endpoint_limiter("editor", **shared, max_in_flight=8, requests_per_minute=None)
+            endpoint_limiter("coordinator", **shared, max_in_flight=2, requests_per_minute=60)
+
+    assert coordinator is editor is again
+    assert (editor.max_in_flight, editor.requests_per_minute) == (2, 60)
+    assert caplog.text.count("conflicting limits") == 2
+    reset_limiters()
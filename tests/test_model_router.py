@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+import pytest
+
+from ai_daily_journal.config.schema import SingleModelRoleConfig
+from ai_daily_journal.services.model_client import ModelClientError
+from ai_daily_journal.services.model_router import (
+    EndpointHealth,
+    ModelRouter,
+    RoutedEndpoint,
+    endpoint_health,
+    reset_routing_state,
+    routing_snapshot,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeClient:
+    def __init__(self, clock: FakeClock, latency: float, *, fail: bool = False) -> None:
+        self.clock = clock
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+
+    def chat(self, **_kwargs) -> str:
+        self.calls += 1
+        self.clock.now += self.latency
+        if self.fail:
+            raise ModelClientError("Model request failed: 503")
+        return "{}"
+
+
+def _endpoint(
+    name: str, client: FakeClient, clock: FakeClock, weight: float = 1.0
+) -> RoutedEndpoint:
+    return RoutedEndpoint(
+        name=name,
+        client=client,  # type: ignore[arg-type]
+        model_name="m",
+        weight=weight,
+        health=EndpointHealth(clock=clock),
+    )
+
+
+def _first_picks(router: ModelRouter, rounds: int = 3000) -> Counter[str]:
+    return Counter(router.ordered()[0].name for _ in range(rounds))
+
+
+def test_router_fails_over_and_then_skips_broken_endpoint() -> None:
+    clock = FakeClock()
+    broken = FakeClient(clock, 0.1, fail=True)
+    working = FakeClient(clock, 0.5)
+    router = ModelRouter(
+        "editor",
+        [_endpoint("broken", broken, clock), _endpoint("working", working, clock)],
+        clock=clock,
+        rng=random.Random(7),
+    )
+
+    for _ in range(50):
+        assert router.call(lambda ep: ep.client.chat()) == "{}"
+        if not router.endpoints[0].health.healthy:
+            break
+
+    assert broken.calls == 3
+    calls = working.calls
+    assert router.call(lambda ep: ep.client.chat()) == "{}"
+    assert broken.calls == 3
+    assert working.calls == calls + 1
+
+
+def test_router_favours_lower_latency_endpoint() -> None:
+    clock = FakeClock()
+    router = ModelRouter(
+        "coordinator",
+        [
+            _endpoint("slow", FakeClient(clock, 2.0), clock),
+            _endpoint("fast", FakeClient(clock, 0.2), clock),
+        ],
+        clock=clock,
+        rng=random.Random(7),
+    )
+    router.endpoints[0].health.record_success(2.0)
+    router.endpoints[1].health.record_success(0.2)
+
+    picks = _first_picks(router)
+
+    # Shares follow 1 / latency: 10 to 1.
+    assert 0.85 < picks["fast"] / 3000 < 0.96
+
+
+def test_router_splits_traffic_by_weight() -> None:
+    clock = FakeClock()
+    router = ModelRouter(
+        "editor",
+        [
+            _endpoint("big", FakeClient(clock, 0.5), clock, weight=2.0),
+            _endpoint("small", FakeClient(clock, 0.5), clock, weight=1.0),
+        ],
+        clock=clock,
+        rng=random.Random(7),
+    )
+    for _ in range(300):
+        router.call(lambda ep: ep.client.chat())
+
+    big, small = (ep.client.calls for ep in router.endpoints)
+    assert 1.7 < big / small < 2.3
+
+
+def test_unmeasured_endpoint_gets_a_share_from_its_timeout_prior() -> None:
+    clock = FakeClock()
+    measured = _endpoint("measured", FakeClient(clock, 0.3), clock)
+    measured.health.record_success(0.3)
+    fresh = _endpoint("fresh", FakeClient(clock, 0.3), clock)
+    fresh.prior_latency = 3.0
+    router = ModelRouter("editor", [measured, fresh], clock=clock, rng=random.Random(7))
+
+    picks = _first_picks(router)
+
+    # Neither starved nor flooded before its first measurement: about 1 in 11.
+    assert 0.05 < picks["fresh"] / 3000 < 0.15
+
+
+def test_router_raises_last_error_when_all_endpoints_fail() -> None:
+    clock = FakeClock()
+    router = ModelRouter(
+        "editor",
+        [_endpoint("a", FakeClient(clock, 0.1, fail=True), clock)],
+        clock=clock,
+    )
+    with pytest.raises(ModelClientError):
+        router.call(lambda ep: ep.client.chat())
+
+
+def test_role_config_accepts_endpoint_list() -> None:
+    role = SingleModelRoleConfig.model_validate(
+        {
+            "model_name": "gpt-4.1",
+            "endpoints": [
+                {
+                    "name": "local",
+                    "base_url": "http://127.0.0.1:8000/v1",
+                    "api_key_env": "K1",
+                    "weight": 2,
+                },
+                {"base_url": "https://api.openai.com/v1", "api_key_env": "K2"},
+            ],
+        }
+    )
+    assert [ep.weight for ep in role.resolved_endpoints()] == [2.0, 1.0]
+    with pytest.raises(ValueError):
+        SingleModelRoleConfig.model_validate({"model_name": "gpt-4.1"})
+
+
+def test_routing_snapshot_lists_shared_health() -> None:
+    reset_routing_state()
+    endpoint_health("embeddings", "primary").record_success(0.3)
+    snapshot = routing_snapshot()
+    assert snapshot["embeddings"]["primary"]["requests"] == 1
+    reset_routing_state()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from ai_daily_journal.config.schema import PasswordHashingConfig
+from ai_daily_journal.db.models import User
+from ai_daily_journal.db.session import async_url, build_async_session_factory
+from ai_daily_journal.services.auth import AsyncAuthService
+from ai_daily_journal.services.password_hashing import (
+    PasswordHashBusyError,
+    PasswordHashPool,
+    VerifyResult,
+    hash_params,
+    hash_password,
+    verify_password,
+)
+
+WEAK = PasswordHashingConfig(time_cost=1, memory_cost_kib=1024, parallelism=1, processes=0)
+STRONG = PasswordHashingConfig(time_cost=2, memory_cost_kib=2048, parallelism=1, processes=0)
+
+
+def test_verify_rehashes_outdated_parameters():
+    stored = hash_password(hash_params(WEAK), "secret-pass")
+
+    assert verify_password(hash_params(WEAK), stored, "secret-pass") == VerifyResult(ok=True)
+    assert verify_password(hash_params(STRONG), stored, "wrong-pass").ok is False
+    assert verify_password(hash_params(STRONG), "not-a-hash", "secret-pass").ok is False
+
+    upgraded = verify_password(hash_params(STRONG), stored, "secret-pass")
+    assert upgraded.ok is True and upgraded.new_hash is not None
+    assert verify_password(hash_params(STRONG), upgraded.new_hash, "secret-pass").new_hash is None
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_jobs_beyond_queue_limit():
+    pool = PasswordHashPool(WEAK.model_copy(update={"max_queue": 0}))
+
+    results = await asyncio.gather(
+        pool.hash("first-pass"), pool.hash("second-pass"), return_exceptions=True
+    )
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], PasswordHashBusyError)
+    assert isinstance(await pool.hash("third-pass"), str)
+
+
+@pytest.mark.asyncio
+async def test_pool_hashes_in_worker_processes():
+    pool = PasswordHashPool(WEAK.model_copy(update={"processes": 1}))
+    try:
+        stored = await pool.hash("secret-pass")
+        assert (await pool.verify(stored, "secret-pass")).ok is True
+        assert (await pool.verify(stored, "wrong-pass")).ok is False
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_login_upgrades_stored_hash(db_session):
+    engine = create_async_engine(async_url(db_session.get_bind().url), poolclass=NullPool)
+    factory = build_async_session_factory(engine)
+    try:
+        async with factory() as db:
+            weak = AsyncAuthService(db, passwords=PasswordHashPool(WEAK))
+            user = await weak.register_user("rehash@example.com", "secret-pass", "UTC")
+            original = user.password_hash
+
+            strong = AsyncAuthService(db, passwords=PasswordHashPool(STRONG))
+            assert await strong.authenticate("rehash@example.com", "secret-pass") is not None
+        async with factory() as db:
+            stored = (
+                await db.execute(select(User.password_hash).where(User.id == user.id))
+            ).scalar_one()
+        assert stored != original
+        assert verify_password(hash_params(STRONG), stored, "secret-pass") == VerifyResult(ok=True)
+    finally:
+        await engine.dispose()
+
+
+def test_login_returns_429_when_hashing_queue_is_full(api_client, monkeypatch):
+    pool = PasswordHashPool(WEAK)
+    api_client.app.state.password_pool = pool
+
+    async def busy(password_hash: str, password: str) -> VerifyResult:
+        raise PasswordHashBusyError("Password hashing queue is full")
+
+    monkeypatch.setattr(pool, "verify", busy)
+    response = api_client.post(
+        "/api/auth/login", json={"email": "user@example.com", "password": "secret-pass"}
+    )
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
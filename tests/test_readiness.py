@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+
+from sqlalchemy import event, text
+
+from ai_daily_journal.db.migrations import migration_head
+from ai_daily_journal.services.readiness import ProbeCache, run_checks
+from tests.helpers import wait_for_warmup
+
+
+def test_probe_cache_reuses_results_within_ttl():
+    now = [0.0]
+    calls: list[int] = []
+    cache = ProbeCache(5.0, clock=lambda: now[0])
+
+    def compute() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get("readyz", compute) == 1
+    now[0] = 4.9
+    assert cache.get("readyz", compute) == 1
+    now[0] = 5.0
+    assert cache.get("readyz", compute) == 2
+
+
+def test_run_checks_bounds_slow_dependencies():
+    def slow() -> None:
+        time.sleep(2)
+
+    def broken() -> None:
+        raise RuntimeError("boom")
+
+    started = time.monotonic()
+    results = run_checks({"slow": slow, "broken": broken, "fine": lambda: "ok"}, 0.2)
+
+    assert time.monotonic() - started < 1.5
+    assert results["slow"].ok is False and results["slow"].detail == "timed out"
+    assert results["broken"].ok is False and results["broken"].detail == "boom"
+    assert results["fine"].ok is True and results["fine"].detail == "ok"
+
+
+def _stamp_head(db_session) -> None:
+    db_session.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+    db_session.execute(text("INSERT INTO alembic_version VALUES (:v)"), {"v": migration_head()})
+    db_session.commit()
+
+
+def test_readyz_uses_shared_engine_and_caches_probes(api_client, db_session):
+    _stamp_head(db_session)
+    wait_for_warmup(api_client)
+    statements: list[str] = []
+    bind = db_session.get_bind()
+
+    def listener(conn, cursor, statement, params, context, executemany):  # noqa: ANN001
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", listener)
+    try:
+        first = api_client.get("/readyz")
+        probed = len(statements)
+        second = api_client.get("/readyz")
+    finally:
+        event.remove(bind, "before_cursor_execute", listener)
+
+    assert first.status_code == 200
+    assert first.json()["checks"]["migrations"]["detail"] == migration_head()
+    assert second.json() == first.json()
+    assert probed > 0
+    assert len(statements) == probed
+
+
+def test_readyz_not_ready_while_warming_up(api_client, db_session):
+    _stamp_head(db_session)
+    wait_for_warmup(api_client)
+    api_client.app.state.warmup_complete = False
+
+    response = api_client.get("/readyz")
+
+    assert response.status_code == 503
+    assert response.json()["reason"] == "warming_up"
+
+
+def test_readyz_not_ready_when_migrations_behind(api_client):
+    wait_for_warmup(api_client)
+    response = api_client.get("/readyz")
+
+    assert response.status_code == 503
+    assert response.json()["reason"].startswith("migrations:")
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from ai_daily_journal.api.dependencies import CurrentUser, DbSession
+from ai_daily_journal.db.models import JournalDay
+from ai_daily_journal.metrics import metrics
+from tests.helpers import wait_for_warmup
+
+
+def _checkouts() -> dict[str, float]:
+    return metrics.snapshot()["summaries"]["db_checkouts_per_request"]
+
+
+def test_auth_and_read_share_one_checkout(api_client):
+    wait_for_warmup(api_client)
+    metrics.reset()
+
+    # Cache miss: the token lookup and the read run on the same session.
+    assert api_client.get("/api/journal/latest").status_code == 200
+    assert api_client.get("/api/journal/changes").status_code == 200
+
+    assert _checkouts()["count"] == 2
+    assert _checkouts()["sum"] == 2
+    assert metrics.counter("db_pool_checkout_total") == 2
+
+
+def test_request_session_commits_or_rolls_back(api_client, db_session, test_user):
+    app = FastAPI()
+    app.state.config = api_client.app.state.config
+    app.state.async_session_factory = api_client.app.state.async_session_factory
+
+    @app.post("/days/{day_date}")
+    async def add_day(day_date: str, db: DbSession, user: CurrentUser, fail: bool = False):
+        day = date.fromisoformat(day_date)
+        db.add(JournalDay(user_id=user.user_id, day_date=day, timezone=user.timezone))
+        await db.flush()
+        if fail:
+            raise HTTPException(status_code=409, detail="rejected")
+        return {"ok": True}
+
+    with TestClient(app) as client:
+        client.cookies = api_client.cookies
+        assert client.post("/days/2026-10-01").status_code == 200
+        assert client.post("/days/2026-10-02", params={"fail": True}).status_code == 409
+
+    stored = db_session.execute(select(JournalDay.day_date)).scalars().all()
+    assert [day.isoformat() for day in stored] == ["2026-10-01"]
+
+
+def test_write_service_is_built_off_the_event_loop(api_client, monkeypatch):
+    built_on_loop: list[bool] = []
+
+    class RecordingService:
+        def __init__(self, *_args) -> None:  # noqa: ANN002
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                built_on_loop.append(False)
+            else:
+                built_on_loop.append(True)
+
+        def cancel(self, *, user_id: int, session_id: int) -> dict[str, object]:
+            return {"status": "cancelled", "session_id": session_id}
+
+    monkeypatch.setattr("ai_daily_journal.api.routes.journal.JournalWriteService", RecordingService)
+
+    assert api_client.post("/api/journal/cancel", json={"session_id": 1}).status_code == 200
+    assert built_on_loop == [False]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from ai_daily_journal.db.session import async_url, build_async_session_factory
+from ai_daily_journal.services.auth import AsyncAuthService
+from ai_daily_journal.services.session_cache import CachedSession, SessionTokenCache
+from tests.helpers import wait_for_warmup
+
+
+def _session(user_id: int = 1, *, hours: float = 1) -> CachedSession:
+    expires = datetime.now(UTC) + timedelta(hours=hours)
+    return CachedSession(user_id=user_id, timezone="Europe/Ljubljana", expires_at=expires)
+
+
+def test_cache_is_bounded_and_expires_entries():
+    now = [0.0]
+    cache = SessionTokenCache(ttl_seconds=10, max_entries=2, poll_seconds=1, clock=lambda: now[0])
+    cache.put("a", _session(1))
+    cache.put("b", _session(2))
+    assert cache.get("a") is not None
+    cache.put("c", _session(3))
+
+    assert cache.get("b") is None  # least recently used
+    assert cache.get("a").user_id == 1
+    now[0] = 10.0
+    assert cache.get("a") is None
+    cache.put("d", _session(4, hours=-1))
+    assert cache.get("d") is None
+
+
+def _auth_statements(api_client) -> list[str]:
+    statements: list[str] = []
+    engine = api_client.app.state.async_session_factory.kw["bind"].sync_engine
+
+    def listener(conn, cursor, statement, params, context, executemany):  # noqa: ANN001
+        if "user_sessions" in statement or "session_revocations" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    return statements
+
+
+def test_authenticated_reads_skip_auth_queries_once_cached(api_client):
+    api_client.app.state.config.api_ui.session_revocation_poll_seconds = 3600
+    wait_for_warmup(api_client)
+    statements = _auth_statements(api_client)
+
+    assert api_client.get("/api/journal/latest").status_code == 200
+    first = len(statements)
+    for _ in range(3):
+        assert api_client.get("/api/journal/latest").status_code == 200
+
+    assert first > 0
+    assert len(statements) == first
+
+
+@pytest.mark.asyncio
+async def test_logout_revocation_reaches_other_workers(db_session, test_user):
+    engine = create_async_engine(async_url(db_session.get_bind().url), poolclass=NullPool)
+    factory = build_async_session_factory(engine)
+    now = [0.0]
+    worker_a = SessionTokenCache(ttl_seconds=60, max_entries=10, poll_seconds=0)
+    worker_b = SessionTokenCache(
+        ttl_seconds=60, max_entries=10, poll_seconds=2, clock=lambda: now[0]
+    )
+    try:
+        async with factory() as db:
+            auth = AsyncAuthService(db)
+            await auth.register_user("cache@example.com", "secret-pass", "Europe/Ljubljana")
+            token = await auth.authenticate("cache@example.com", "secret-pass")
+            assert (await auth.cached_session(token, worker_a)) is not None
+            assert (await auth.cached_session(token, worker_b)) is not None
+
+            await auth.revoke_session(token, worker_a)
+
+            assert await auth.cached_session(token, worker_a) is None
+            # Worker B keeps serving its cached entry until its next revocation poll.
+            assert await auth.cached_session(token, worker_b) is not None
+            now[0] = 2.0
+            assert await auth.cached_session(token, worker_b) is None
+    finally:
+        await engine.dispose()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import event, select
+
+from ai_daily_journal.db.models import (
+    JournalDay,
+    JournalEntry,
+    OperationAction,
+    SemanticDocument,
+    WriteOperation,
+    WriteSession,
+)
+from ai_daily_journal.services.write_transaction import WriteTransactionService
+
+
+def _operation(db_session, user_id: int, day_date: date, new_count: int) -> int:
+    session = WriteSession(user_id=user_id, day_date=day_date)
+    db_session.add(session)
+    db_session.flush()
+    entries = [
+        {"sequence_no": 1, "event_text_sl": "Tekel sem dlje.", "source_user_text": "tek"},
+        *(
+            {"sequence_no": seq, "event_text_sl": f"Dogodek {seq}.", "source_user_text": "x"}
+            for seq in range(2, new_count + 2)
+        ),
+    ]
+    db_session.add(
+        WriteOperation(
+            session_id=session.id,
+            action=OperationAction.update,
+            decision_json={},
+            proposed_entries_json=entries,
+            diff_text=f"diff-{new_count}",
+        )
+    )
+    db_session.commit()
+    return session.id
+
+
+def _seed_day(db_session, user_id: int, day_date: date) -> int:
+    day = JournalDay(user_id=user_id, day_date=day_date, timezone="Europe/Ljubljana")
+    db_session.add(day)
+    db_session.flush()
+    db_session.add(
+        JournalEntry(
+            day_id=day.id,
+            sequence_no=1,
+            event_text_sl="Tekel sem.",
+            source_user_text="tek",
+            event_hash="h",
+        )
+    )
+    db_session.commit()
+    return day.id
+
+
+def _confirm_counting(db_session, user_id: int, session_id: int, key: str) -> int:
+    statements: list[str] = []
+    bind = db_session.get_bind()
+
+    def listener(*args) -> None:  # noqa: ANN002
+        statements.append(args[2])
+
+    event.listen(bind, "before_cursor_execute", listener)
+    try:
+        WriteTransactionService(
+            db_session, embeddings_model_name="embedding-test", embeddings_dimensions=64
+        ).confirm(user_id=user_id, session_id=session_id, idempotency_key=key)
+    finally:
+        event.remove(bind, "before_cursor_execute", listener)
+    return len(statements)
+
+
+def test_update_supersedes_entry_with_same_sequence(db_session, test_user):
+    user_id = test_user.id
+    day_id = _seed_day(db_session, user_id, date(2026, 5, 1))
+    session_id = _operation(db_session, user_id, date(2026, 5, 1), new_count=1)
+    _confirm_counting(db_session, user_id, session_id, "set-based-001")
+
+    rows = db_session.execute(
+        select(JournalEntry).where(JournalEntry.day_id == day_id).order_by(JournalEntry.id)
+    ).scalars().all()
+    original, replacement, appended = rows
+    assert original.superseded_by_entry_id == replacement.id
+    assert replacement.updated_from_entry_id == original.id
+    assert replacement.sequence_no == 1 and replacement.superseded_by_entry_id is None
+    assert appended.sequence_no == 2
+    documents = db_session.execute(select(SemanticDocument.entry_id)).scalars().all()
+    assert sorted(documents) == [replacement.id, appended.id]
+
+
+def test_confirm_round_trips_do_not_grow_with_entry_count(db_session, test_user):
+    user_id = test_user.id
+    _seed_day(db_session, user_id, date(2026, 5, 2))
+    _seed_day(db_session, user_id, date(2026, 5, 3))
+    small = _operation(db_session, user_id, date(2026, 5, 2), new_count=2)
+    large = _operation(db_session, user_id, date(2026, 5, 3), new_count=25)
+
+    assert _confirm_counting(db_session, user_id, small, "set-based-002") == _confirm_counting(
+        db_session, user_id, large, "set-based-003"
+    )
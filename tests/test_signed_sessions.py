@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from argon2 import PasswordHasher
+from sqlalchemy import event
+
+from ai_daily_journal.services.signed_sessions import (
+    SignedSessionCodec,
+    SigningKeyError,
+    parse_signing_keys,
+)
+from tests.helpers import wait_for_warmup
+
+OLD_KEY = "k1:" + "a" * 32
+NEW_KEY = "k2:" + "b" * 32
+
+
+def _expires(hours: float = 1) -> datetime:
+    return datetime.now(UTC) + timedelta(hours=hours)
+
+
+def test_signed_token_round_trip_and_tamper():
+    codec = SignedSessionCodec(parse_signing_keys(OLD_KEY))
+    token = codec.issue(7, "Europe/Ljubljana", _expires())
+
+    session = codec.verify(token)
+    assert session is not None
+    assert (session.user_id, session.timezone) == (7, "Europe/Ljubljana")
+
+    prefix, key_id, payload, signature = token.split(".")
+    assert codec.verify(f"{prefix}.{key_id}.{payload}x.{signature}") is None
+    assert codec.verify(f"{prefix}.{key_id}.{payload}.{signature[:-2]}AA") is None
+    assert codec.verify("not-a-token") is None
+    assert codec.verify(codec.issue(7, "Europe/Ljubljana", _expires(-1))) is None
+
+
+def test_signing_key_rotation():
+    old_codec = SignedSessionCodec(parse_signing_keys(OLD_KEY))
+    old_token = old_codec.issue(1, "UTC", _expires())
+
+    rotated = SignedSessionCodec(parse_signing_keys(f"{NEW_KEY},{OLD_KEY}"))
+    assert rotated.verify(old_token) is not None
+    assert rotated.issue(1, "UTC", _expires()).split(".")[1] == "k2"
+
+    retired = SignedSessionCodec(parse_signing_keys(NEW_KEY))
+    assert retired.verify(old_token) is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["", "k1", "k1:short", "k.1:" + "a" * 32, f"{OLD_KEY},{OLD_KEY}"],
+)
+def test_parse_signing_keys_rejects_bad_values(value):
+    with pytest.raises(SigningKeyError):
+        parse_signing_keys(value)
+
+
+def test_signed_mode_login_skips_session_table(api_client, db_session, test_user):
+    cfg = api_client.app.state.config
+    cfg.api_ui.session_mode = "signed"
+    api_client.app.state.session_codec = SignedSessionCodec(parse_signing_keys(OLD_KEY))
+    test_user.password_hash = PasswordHasher().hash("secret-pass")
+    db_session.commit()
+    wait_for_warmup(api_client)
+    api_client.cookies.clear()
+
+    login = api_client.post(
+        "/api/auth/login", json={"email": test_user.email, "password": "secret-pass"}
+    )
+    assert login.status_code == 200
+    token = login.cookies[cfg.api_ui.session_cookie_name]
+    assert token.startswith("v1.k1.")
+    api_client.cookies.set(cfg.api_ui.session_cookie_name, token)
+
+    statements: list[str] = []
+    engine = api_client.app.state.async_session_factory.kw["bind"].sync_engine
+
+    def listener(conn, cursor, statement, params, context, executemany):  # noqa: ANN001
+        if "user_sessions" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    assert api_client.get("/api/journal/latest").status_code == 200
+    assert api_client.get("/api/auth/me").json()["id"] == test_user.id
+    assert statements == []
+
+    assert api_client.post("/api/auth/logout").status_code == 200
+    api_client.cookies.set(cfg.api_ui.session_cookie_name, token)
+    assert api_client.get("/api/journal/latest").status_code == 401
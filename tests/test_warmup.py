@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from ai_daily_journal.db.session import async_url, build_async_session_factory
+from ai_daily_journal.services.model_client import OpenAICompatibleClient, close_http_clients
+from ai_daily_journal.services.warmup import open_model_endpoints, run_hot_statements, warm_up
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_pools_and_runs_hot_statements(db_session, test_config):
+    engine = db_session.get_bind()
+    engine.dispose()
+    async_engine = create_async_engine(async_url(engine.url), pool_size=3)
+    test_config.warmup.model_endpoints = False
+
+    try:
+        report = await warm_up(
+            test_config,
+            engine=engine,
+            session_factory=sessionmaker(bind=engine),
+            async_engine=async_engine,
+            async_session_factory=build_async_session_factory(async_engine),
+        )
+
+        assert all(step["ok"] for step in report.values()), report
+        assert set(report) == {
+            "mappers",
+            "db_pool",
+            "async_db_pool",
+            "hot_statements",
+            "async_hot_statements",
+        }
+        assert report["db_pool"]["count"] == engine.pool.size()
+        assert engine.pool.checkedin() == engine.pool.size()
+        assert async_engine.pool.checkedin() == 3
+    finally:
+        await async_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reports_failing_steps(db_session, test_config):
+    engine = db_session.get_bind()
+    async_engine = create_async_engine("sqlite+aiosqlite:////nonexistent/dir/x.db")
+    test_config.warmup.model_endpoints = False
+    test_config.warmup.prewarm_pool = False
+
+    try:
+        report = await warm_up(
+            test_config,
+            engine=engine,
+            session_factory=sessionmaker(bind=engine),
+            async_engine=async_engine,
+            async_session_factory=build_async_session_factory(async_engine),
+        )
+    finally:
+        await async_engine.dispose()
+
+    assert report["hot_statements"]["ok"] is True
+    assert report["async_hot_statements"]["ok"] is False
+
+
+def test_hot_statements_include_the_session_lookups(db_session):
+    engine = db_session.get_bind()
+    statements: list[str] = []
+
+    def listener(*args) -> None:  # noqa: ANN002
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        run_hot_statements(sessionmaker(bind=engine))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    auth = [sql for sql in statements if "session_revocations" in sql or "user_sessions" in sql]
+    assert len(auth) == 3
+    assert any("JOIN users" in sql for sql in auth)
+
+
+class _ModelServer(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self) -> None:
+        type(self).connections += 1
+        super().setup()
+
+    def _reply(self, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._reply({"data": []})
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply({"choices": [{"message": {"content": "{}"}}]})
+
+    def log_message(self, *_args) -> None:  # noqa: ANN002
+        pass
+
+
+def test_first_model_call_reuses_the_warmed_connection(test_config):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ModelServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    test_config.models.coordinator.base_url = base_url
+    test_config.models.editor.base_url = base_url
+    try:
+        assert open_model_endpoints(test_config) == 2
+        client = OpenAICompatibleClient(base_url, "key")
+        assert client.chat(model="m", system_prompt="s", user_prompt="u", temperature=0.0) == "{}"
+
+        assert _ModelServer.connections == 1
+    finally:
+        close_http_clients()
+        server.shutdown()
+        server.server_close()
@@ -1,8 +1,11 @@
 export type JournalTree = Array<{
   year: number;
-  months: Array<{ month: number; days: string[] }>;
+  count: number;
+  months: Array<{ month: number; count: number }>;
 }>;
 
+export type MonthDays = { year: number; month: number; days: string[]; next_after: string | null };
+
 export type ProposalResponse = {
   session_id: number;
   operation_id: number;
@@ -35,21 +38,65 @@ async function req<T>(path: string, init?: RequestInit): Promise<T> {
   return (await response.json()) as T;
 }
 
+// Last body + ETag per GET path; the server answers 304 when nothing changed.
+const etagCache = new Map<string, { etag: string; body: unknown }>();
+
+async function cachedGet<T>(path: string): Promise<T> {
+  const cached = etagCache.get(path);
+  const response = await fetch(path, {
+    credentials: "include",
+    cache: "no-store",
+    headers: cached ? { "If-None-Match": cached.etag } : {}
+  });
+  if (response.status === 304 && cached) {
+    return cached.body as T;
+  }
+  if (!response.ok) {
+    const text = await response.text();
+    throw new Error(`${response.status}: ${text}`);
+  }
+  const body = (await response.json()) as T;
+  const etag = response.headers.get("ETag");
+  if (etag) {
+    etagCache.set(path, { etag, body });
+  } else {
+    etagCache.delete(path);
+  }
+  return body;
+}
+
 export const api = {
   register: (email: string, password: string, timezone: string) =>
     req("/api/auth/register", {
       method: "POST",
       body: JSON.stringify({ email, password, timezone })
     }),
-  login: (email: string, password: string) =>
-    req("/api/auth/login", {
+  login: (email: string, password: string) => {
+    etagCache.clear();
+    return req("/api/auth/login", {
       method: "POST",
       body: JSON.stringify({ email, password })
-    }),
+    });
+  },
   me: () => req<{ id: number; email: string; timezone: string }>("/api/auth/me"),
-  latest: () => req<{ day_date: string | null; content: string }>("/api/journal/latest"),
-  tree: () => req<{ tree: JournalTree }>("/api/journal/tree"),
-  dayFile: (dayDate: string) => req<{ day_date: string; content: string }>(`/api/journal/days/${dayDate}`),
+  latest: () => cachedGet<{ day_date: string | null; content: string }>("/api/journal/latest"),
+  tree: () => cachedGet<{ tree: JournalTree }>("/api/journal/tree"),
+  monthDays: (year: number, month: number, after?: string) =>
+    cachedGet<MonthDays>(
+      `/api/journal/tree/${year}/${month}${after ? `?after=${encodeURIComponent(after)}` : ""}`
+    ),
+  changes: (since: string | null) =>
+    req<{
+      changes: Array<{ day_date: string; change: "created" | "modified" | "deleted"; version: number }>;
+      next_cursor: string;
+      has_more: boolean;
+    }>(`/api/journal/changes${since ? `?since=${encodeURIComponent(since)}` : ""}`),
+  dayRange: (from: string, to: string, after?: string) =>
+    cachedGet<{ days: Array<{ day_date: string; content: string; version: number }>; next_after: string | null }>(
+      `/api/journal/days?from=${from}&to=${to}${after ? `&after=${after}` : ""}`
+    ),
+  dayFile: (dayDate: string) =>
+    cachedGet<{ day_date: string; content: string }>(`/api/journal/days/${dayDate}`),
   propose: (text: string, sessionId?: number, instruction?: string) =>
     req<ProposalResponse>("/api/journal/propose", {
       method: "POST",
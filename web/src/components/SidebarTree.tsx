@@ -1,4 +1,5 @@
-import type { JournalTree } from "../api";
+import { useEffect, useState } from "react";
+import { api, type JournalTree } from "../api";
 
 type Props = {
   tree: JournalTree;
@@ -6,31 +7,117 @@ type Props = {
   onSelectDay: (day: string) => void;
 };
 
+type MonthState = { days: string[]; nextAfter: string | null; loading: boolean };
+
+function monthKey(year: number, month: number) {
+  return `${year}-${month}`;
+}
+
 export function SidebarTree({ tree, selectedDay, onSelectDay }: Props) {
+  const [months, setMonths] = useState<Record<string, MonthState>>({});
+  const [openMonths, setOpenMonths] = useState<Set<string>>(new Set());
+
+  async function loadMonth(year: number, month: number, after?: string) {
+    const key = monthKey(year, month);
+    setMonths((prev) => ({
+      ...prev,
+      [key]: { days: prev[key]?.days ?? [], nextAfter: prev[key]?.nextAfter ?? null, loading: true }
+    }));
+    try {
+      const page = await api.monthDays(year, month, after);
+      setMonths((prev) => ({
+        ...prev,
+        [key]: {
+          days: after ? [...(prev[key]?.days ?? []), ...page.days] : page.days,
+          nextAfter: page.next_after,
+          loading: false
+        }
+      }));
+    } catch {
+      setMonths((prev) => ({ ...prev, [key]: { days: [], nextAfter: null, loading: false } }));
+    }
+  }
+
+  // Open the newest month by default and refetch open months whenever the tree changes.
+  useEffect(() => {
+    const open = new Set(openMonths);
+    const newest = tree[0]?.months[0];
+    if (open.size === 0 && newest) {
+      open.add(monthKey(tree[0].year, newest.month));
+    }
+    setOpenMonths(open);
+    for (const yearNode of tree) {
+      for (const monthNode of yearNode.months) {
+        if (open.has(monthKey(yearNode.year, monthNode.month))) {
+          void loadMonth(yearNode.year, monthNode.month);
+        }
+      }
+    }
+  }, [tree]);
+
+  function toggleMonth(year: number, month: number, isOpen: boolean) {
+    const key = monthKey(year, month);
+    setOpenMonths((prev) => {
+      const next = new Set(prev);
+      if (isOpen) {
+        next.add(key);
+      } else {
+        next.delete(key);
+      }
+      return next;
+    });
+    if (isOpen && !months[key]) {
+      void loadMonth(year, month);
+    }
+  }
+
   return (
     <aside className="sidebar">
       <h2>Dnevi</h2>
       {tree.length === 0 && <p className="muted">Ni vnosov.</p>}
       {tree.map((yearNode) => (
         <details key={yearNode.year} open>
-          <summary>{yearNode.year}</summary>
-          {yearNode.months.map((monthNode) => (
-            <details key={`${yearNode.year}-${monthNode.month}`} open>
-              <summary>{monthNode.month}</summary>
-              <ul>
-                {monthNode.days.map((day) => (
-                  <li key={day}>
-                    <button
-                      className={selectedDay === day ? "day-button active" : "day-button"}
-                      onClick={() => onSelectDay(day)}
-                    >
-                      {day}
-                    </button>
-                  </li>
-                ))}
-              </ul>
-            </details>
-          ))}
+          <summary>
+            {yearNode.year} <span className="muted">({yearNode.count})</span>
+          </summary>
+          {yearNode.months.map((monthNode) => {
+            const key = monthKey(yearNode.year, monthNode.month);
+            const state = months[key];
+            return (
+              <details
+                key={key}
+                open={openMonths.has(key)}
+                onToggle={(event) =>
+                  toggleMonth(yearNode.year, monthNode.month, (event.target as HTMLDetailsElement).open)
+                }
+              >
+                <summary>
+                  {monthNode.month} <span className="muted">({monthNode.count})</span>
+                </summary>
+                <ul>
+                  {(state?.days ?? []).map((day) => (
+                    <li key={day}>
+                      <button
+                        className={selectedDay === day ? "day-button active" : "day-button"}
+                        onClick={() => onSelectDay(day)}
+                      >
+                        {day}
+                      </button>
+                    </li>
+                  ))}
+                </ul>
+                {state?.loading && <p className="muted">Nalagam…</p>}
+                {state?.nextAfter && !state.loading && (
+                  <button
+                    className="day-button"
+                    onClick={() => void loadMonth(yearNode.year, monthNode.month, state.nextAfter ?? undefined)}
+                  >
+                    Več
+                  </button>
+                )}
+              </details>
+            );
+          })}
         </details>
       ))}
     </aside>